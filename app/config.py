@@ -1,4 +1,5 @@
 import os
+import json
 import streamlit as st
 import requests
 from contextlib import contextmanager
@@ -12,15 +13,26 @@ ENDPOINTS = {
     "rss_feeds": f"{BASE_URL}/rss_feeds",
     "discover_rss": f"{BASE_URL}/discover_rss/",
     "add_rss": f"{BASE_URL}/add_rss/",
+    "import_opml": f"{BASE_URL}/import_opml",
+    "jobs": f"{BASE_URL}/jobs/",
     "articles": f"{BASE_URL}/articles",
     "chat_sessions": f"{BASE_URL}/chat_sessions/",
 }
 
+# One HTTP session per browser session, so the backend's cookies (which
+# route a client's reads to up-to-date servers right after it writes) persist
+def get_http_session():
+    if "http_session" not in st.session_state:
+        st.session_state.http_session = requests.Session()
+    return st.session_state.http_session
+
 # Session State Initialization
 def init_session_state():
     defaults = {
         "feeds": [],
         "articles": [],
+        "articles_cursor": None,
+        "articles_loaded": False,
         "selected_article_ids": [],
         "current_chat_session": None,
         "chat_messages": [],
@@ -57,12 +69,43 @@ def handle_api_errors():
 def make_api_request(method, endpoint, **kwargs):
     with handle_api_errors():
         if method.upper() == "GET":
-            response = requests.get(endpoint, timeout=30, **kwargs)
+            response = get_http_session().get(endpoint, timeout=30, **kwargs)
         elif method.upper() == "POST":
-            response = requests.post(endpoint, timeout=30, **kwargs)
+            response = get_http_session().post(endpoint, timeout=30, **kwargs)
         
-        if response.status_code == 200:
+        if response.ok:
             return response.json()
         else:
             st.error(f"API Error: {response.status_code} - {response.text}")
             return None
+
+# Server-Sent Events Helper
+class StreamRejected(Exception):
+    """The streaming request never reached the backend or was refused outright"""
+
+def stream_sse(endpoint, **kwargs):
+    """POST to a streaming endpoint and yield (event, data) pairs as they arrive.
+
+    The read timeout applies between events, not to the whole response, so
+    long answers don't time out while tokens keep coming. Raises
+    StreamRejected if the connection fails or the response is not 2xx, i.e.
+    before the backend has taken the request on.
+    """
+    try:
+        response = get_http_session().post(endpoint, stream=True, timeout=(5, 60), **kwargs)
+    except requests.exceptions.ConnectionError as e:
+        raise StreamRejected(str(e)) from e
+    with response:
+        if not response.ok:
+            raise StreamRejected(f"HTTP {response.status_code}")
+        response.encoding = "utf-8"
+        event, data = "message", []
+        for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+            if not line:
+                if data:
+                    yield event, json.loads("\n".join(data))
+                event, data = "message", []
+            elif line.startswith("event:"):
+                event = line[len("event:"):].strip()
+            elif line.startswith("data:"):
+                data.append(line[len("data:"):].lstrip())
@@ -15,7 +15,7 @@ st.set_page_config(
 init_session_state()
 
 def load_feeds():
-    data = make_api_request("GET", ENDPOINTS["rss_feeds"])
+    data = make_api_request("GET", ENDPOINTS["rss_feeds"], params={"include": "stats"})
     if data:
         if isinstance(data, dict) and "feeds" in data:
             return data["feeds"]
@@ -23,15 +23,23 @@ def load_feeds():
             return data
     return []
 
-def load_articles(limit=50):
+def load_articles(limit=50, cursor=None):
+    """Fetch one page of articles; returns (articles, next_cursor)"""
     params = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
     data = make_api_request("GET", ENDPOINTS["articles"], params=params)
     if data:
         if isinstance(data, dict) and "articles" in data:
-            return data["articles"]
+            return data["articles"], data.get("next_cursor")
         elif isinstance(data, list):
-            return data
-    return []
+            return data, None
+    return [], None
+
+def load_more_articles():
+    articles, next_cursor = load_articles(cursor=st.session_state.articles_cursor)
+    st.session_state.articles.extend(articles)
+    st.session_state.articles_cursor = next_cursor
 
 def main():
     st.title("📊 RSS Dashboard")
@@ -44,17 +52,22 @@ def main():
         st.error("🔴 Backend Offline - Please start the backend server")
         st.stop()
     
-    # Load data
+    # Load data; articles accumulate across "Load more" clicks until refreshed
     with st.spinner("Loading feeds and articles..."):
         feeds = load_feeds()
-        articles = load_articles()
+        if not st.session_state.articles_loaded:
+            st.session_state.articles, st.session_state.articles_cursor = load_articles()
+            st.session_state.articles_loaded = True
+    articles = st.session_state.articles
     
     # Stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("📡 RSS Feeds", len(feeds))
     with col2:
-        st.metric("📰 Articles", len(articles))
+        total_articles = sum(feed.get('article_count', 0) for feed in feeds)
+        new_articles = sum(feed.get('articles_24h', 0) for feed in feeds)
+        st.metric("📰 Articles", total_articles, delta=f"{new_articles} in 24h")
     with col3:
         st.metric("🤖 Selected for Chat", len(st.session_state.selected_article_ids))
     with col4:
@@ -63,7 +76,13 @@ def main():
             st.rerun()
     
     # Articles Section
-    st.subheader("📰 Recent Articles")
+    header_col, refresh_col = st.columns([8, 1])
+    with header_col:
+        st.subheader("📰 Recent Articles")
+    with refresh_col:
+        if st.button("🔄 Refresh"):
+            st.session_state.articles_loaded = False
+            st.rerun()
     
     if not articles:
         st.info("No articles found. Add some RSS feeds first!")
@@ -71,7 +90,7 @@ def main():
         return
     
     # Article selection and display
-    for article in articles[:20]:  # Show first 20
+    for article in articles:
         with st.container():
             col1, col2 = st.columns([1, 8])
             
@@ -93,14 +112,17 @@ def main():
                 st.markdown(f"**{article.get('title', 'No Title')}**")
                 st.caption(f"📡 {article.get('feed_title', 'Unknown Feed')} • {article.get('published_date', 'No Date')}")
                 
-                if article.get('summary'):
-                    st.write(article['summary'][:200] + "..." if len(article.get('summary', '')) > 200 else article.get('summary', ''))
+                if article.get('snippet'):
+                    st.write(article['snippet'])
                 
                 if article.get('url'):
                     st.markdown(f"[🔗 Read Full Article]({article['url']})")
         
         st.divider()
     
+    if st.session_state.articles_cursor:
+        st.button("⬇️ Load more", on_click=load_more_articles)
+    
     # Chat Action
     if st.session_state.selected_article_ids:
         st.success(f"✅ {len(st.session_state.selected_article_ids)} articles selected for AI chat")
@@ -1,4 +1,7 @@
 import streamlit as st
+import requests
+import json
+import time
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -9,7 +12,7 @@ st.set_page_config(page_title="Manage RSS Feeds", page_icon="📡")
 init_session_state()
 
 def load_feeds():
-    data = make_api_request("GET", ENDPOINTS["rss_feeds"])
+    data = make_api_request("GET", ENDPOINTS["rss_feeds"], params={"include": "stats"})
     if data:
         if isinstance(data, dict) and "feeds" in data:
             return data["feeds"]
@@ -22,10 +25,39 @@ def discover_feeds(url):
     headers = {"Content-Type": "application/json"}
     return make_api_request("POST", ENDPOINTS["discover_rss"], json=payload, headers=headers)
 
-def add_feed(url):
+def add_feed(url, timeout=30):
+    """Queue a feed and wait for its ingestion job to finish"""
     payload = {"url": url}
     headers = {"Content-Type": "application/json"}
-    return make_api_request("POST", ENDPOINTS["add_rss"], json=payload, headers=headers)
+    queued = make_api_request("POST", ENDPOINTS["add_rss"], json=payload, headers=headers)
+    if not queued:
+        return None
+    
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = make_api_request("GET", f"{ENDPOINTS['jobs']}{queued['job_id']}")
+        if not job:
+            return None
+        if job["status"] == "succeeded":
+            return job["result"]
+        if job["status"] == "failed":
+            st.error(f"❌ {job.get('error') or 'Failed to add feed'}")
+            return None
+        time.sleep(1)
+    
+    st.info("⏳ Feed is still being processed in the background")
+    return None
+
+def import_opml(uploaded_file):
+    """Upload an OPML file and yield the backend's progress events as they arrive"""
+    files = {"file": (uploaded_file.name, uploaded_file.getvalue(), "text/xml")}
+    with get_http_session().post(ENDPOINTS["import_opml"], files=files, stream=True, timeout=(10, 120)) as response:
+        if response.status_code != 200:
+            st.error(f"API Error: {response.status_code} - {response.text}")
+            return
+        for line in response.iter_lines():
+            if line:
+                yield json.loads(line)
 
 def main():
     st.title("📡 Manage RSS Feeds")
@@ -36,7 +68,7 @@ def main():
         st.stop()
     
     # Tabs
-    tab1, tab2 = st.tabs(["🔍 Discover & Add", "📋 Current Feeds"])
+    tab1, tab2, tab3 = st.tabs(["🔍 Discover & Add", "📋 Current Feeds", "📥 Import OPML"])
     
     with tab1:
         st.subheader("🔍 Discover RSS Feeds")
@@ -86,6 +118,33 @@ def main():
                                     st.rerun()
                     st.divider()
     
+    with tab3:
+        st.subheader("📥 Import OPML")
+        
+        uploaded_file = st.file_uploader("Upload an OPML reading list", type=["opml", "xml"])
+        
+        if st.button("📥 Import Feeds", disabled=uploaded_file is None):
+            progress = st.progress(0.0)
+            status = st.empty()
+            total = 0
+            done = 0
+            with handle_api_errors():
+                for event in import_opml(uploaded_file):
+                    if event["event"] == "started":
+                        total = event["total"]
+                    elif event["event"] in ("fetched", "failed"):
+                        done += 1
+                        progress.progress(min(done / max(total, 1), 1.0))
+                        status.caption(f"{'✅' if event['event'] == 'fetched' else '⚠️'} {event['url']}")
+                    elif event["event"] == "done":
+                        progress.progress(1.0)
+                        st.success(
+                            f"✅ Imported {event['fetched']} of {event['total']} feeds "
+                            f"({event['inserted']} new articles, {event['failed']} failed)"
+                        )
+                    elif event["event"] == "error":
+                        st.error(f"❌ {event['error']}")
+    
     with tab2:
         st.subheader("📋 Current RSS Feeds")
         
@@ -104,6 +163,15 @@ def main():
                     if feed.get('description'):
                         st.write(feed['description'])
                     st.caption(f"📅 Added: {feed.get('created_at', 'Unknown')}")
+                    st.caption(
+                        f"📰 {feed.get('article_count', 0)} articles • "
+                        f"{feed.get('articles_24h', 0)} in 24h • {feed.get('articles_7d', 0)} in 7d"
+                    )
+                    if feed.get('last_fetch_status'):
+                        st.caption(
+                            f"🔄 Last fetch: {feed['last_fetch_status']} "
+                            f"({feed.get('last_fetch_ms') or 0} ms) at {feed.get('last_fetch_at')}"
+                        )
                 
                 with col2:
                     if st.button("🗑️", key=f"delete_{feed.get('id', '')}", help="Delete feed"):
@@ -24,6 +24,29 @@ def chat_with_session(session_id, message):
     result = make_api_request("POST", endpoint, json=payload, headers=headers)
     return result.get("response") if result else None
 
+def stream_chat_with_session(session_id, message, placeholder):
+    """Render the reply into placeholder as it streams; None if nothing arrived.
+
+    Raises StreamRejected when the backend never accepted the turn, so the
+    caller can safely retry it elsewhere.
+    """
+    payload = {"session_id": session_id, "message": message}
+    endpoint = f"{BASE_URL}/chat_sessions/{session_id}/chat/stream"
+    text = ""
+    try:
+        for event, data in stream_sse(endpoint, json=payload, headers={"Accept": "text/event-stream"}):
+            if event == "delta":
+                text += data["text"]
+                placeholder.markdown(text + "▌")
+            elif event == "done":
+                return data["response"]
+            elif event == "error":
+                break
+    except (requests.exceptions.RequestException, ValueError):
+        pass
+    # Stream cut short: keep what we showed (the backend saved the same)
+    return text or None
+
 def load_chat_sessions():
     """Load previous chat sessions"""
     result = make_api_request("GET", f"{BASE_URL}/chat_sessions/")
@@ -131,23 +154,31 @@ def main():
                 st.chat_message("user").write(message["content"])
             else:
                 st.chat_message("assistant").write(message["content"])
+        
+        if prompt:
+            respond(prompt)
 
-# Chat input MUST be outside tabs/columns/sidebar - NO INDENTATION
-if prompt := st.chat_input("Ask me anything about the news..."):
+def respond(prompt):
+    """Show the user's message and stream the reply in place"""
     # Add user message
     st.session_state.chat_messages.append({"role": "user", "content": prompt})
+    st.chat_message("user").write(prompt)
     
-    # Get AI response
-    with st.spinner("AI is thinking..."):
-        response = chat_with_session(st.session_state.current_chat_session, prompt)
-        if response:
-            st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        else:
-            error_msg = "Sorry, I couldn't process your request. Please try again."
-            st.session_state.chat_messages.append({"role": "assistant", "content": error_msg})
-    
-    # Rerun to show new messages
-    st.rerun()
+    with st.chat_message("assistant"):
+        placeholder = st.empty()
+        try:
+            response = stream_chat_with_session(st.session_state.current_chat_session, prompt, placeholder)
+        except StreamRejected:
+            # Streaming unavailable and nothing was saved: use the blocking endpoint
+            with st.spinner("AI is thinking..."):
+                response = chat_with_session(st.session_state.current_chat_session, prompt)
+        if not response:
+            response = "Sorry, I couldn't process your request. Please try again."
+        placeholder.markdown(response)
+    st.session_state.chat_messages.append({"role": "assistant", "content": response})
+
+# Chat input MUST be outside tabs/columns/sidebar - NO INDENTATION
+prompt = st.chat_input("Ask me anything about the news...")
 
 if __name__ == "__main__":
     main()
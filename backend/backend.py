@@ -1,19 +1,38 @@
-from fastapi import FastAPI, HTTPException, Depends, Request, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, validator
 from dotenv import load_dotenv
 import json
 import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+import asyncpg
 import os
 import uuid
 import time
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor, execute_values
 from typing import List, Optional, Dict, Any
 import boto3
 from botocore.exceptions import ClientError
 import logging
 import json
+import asyncio
+import random
+import hashlib
+import hmac
+import gzip
+import re
+import tempfile
+import base64
+import csv
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Configure structured logging
 logging.basicConfig(
@@ -32,80 +51,284 @@ def log_error(operation: str, error_type: str = "general", safe_details: str = N
         log_data["details"] = safe_details
     
     logging.error(json.dumps(log_data))
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import dateutil.parser
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-import feedparser
-from bs4 import BeautifulSoup
+from lxml import etree
+import parsing
 import urllib.parse
-from urllib.request import urlopen
-from urllib.request import Request as UrlRequest
-from urllib.error import URLError, HTTPError
+import fetcher
+import embeddings
 
 load_dotenv()
 
 # Database Migration System
-def run_migrations():
-    """Run database migrations on startup"""
-    conn = get_db_connection()
+# Each migration runs in its own transaction under a session advisory lock, so
+# tasks starting together apply it once. The applied file's SHA-256 is
+# recorded and later edits to it are refused.
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_LOCK = 7301400
+
+def available_migrations():
+    """[(version, filename, checksum)] for every numbered .sql file, in order"""
+    migrations = []
+    if os.path.exists(MIGRATIONS_DIR):
+        for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+            if filename.endswith('.sql') and filename[:3].isdigit():
+                with open(os.path.join(MIGRATIONS_DIR, filename), 'rb') as f:
+                    checksum = hashlib.sha256(f.read()).hexdigest()
+                migrations.append((int(filename[:3]), filename, checksum))
+    return migrations
+
+def applied_migrations(cursor):
+    """{version: checksum} from schema_migrations, or None if there is no such table.
+
+    Rows from before checksums were recorded map to None, the same as a NULL
+    checksum, so they count as applied and adopt the current file when the
+    migrations are next run.
+    """
     try:
+        cursor.execute("SELECT version, checksum FROM schema_migrations")
+    except psycopg2.errors.UndefinedTable:
+        cursor.connection.rollback()
+        return None
+    except psycopg2.errors.UndefinedColumn:
+        cursor.connection.rollback()
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {version: None for (version,) in cursor.fetchall()}
+    return dict(cursor.fetchall())
+
+def migration_status(conn, migrations):
+    """(pending, mismatched) migrations; a single query when the schema is current.
+
+    Read-only: pre-checksum rows are treated as applied here but only adopt
+    the file's checksum in run_migrations.
+    """
+    with conn.cursor() as cursor:
+        applied = applied_migrations(cursor)
+    if applied is None:
+        return migrations, []
+    pending = [m for m in migrations if m[0] not in applied]
+    mismatched = [m for m in migrations if applied.get(m[0]) not in (None, m[2])]
+    return pending, mismatched
+
+def run_migrations(check_only=False):
+    """Apply pending migrations; returns the versions applied (or pending, with check_only).
+
+    Raises RuntimeError if an applied migration's file has changed.
+    """
+    migrations = available_migrations()
+    with db_connection() as conn:
+        pending, mismatched = migration_status(conn, migrations)
+        if mismatched:
+            raise RuntimeError(f"Applied migrations were modified: {[m[1] for m in mismatched]}")
+        if check_only or not pending:
+            return [m[0] for m in pending]
+
         with conn.cursor() as cursor:
-            # Create migration tracking table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS schema_migrations (
-                    version INTEGER PRIMARY KEY,
-                    applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Get applied migrations
-            cursor.execute("SELECT version FROM schema_migrations ORDER BY version")
-            applied_versions = {row[0] for row in cursor.fetchall()}
-            
-            # Available migrations
-            migrations_dir = os.path.join(os.path.dirname(__file__), 'migrations')
-            available_migrations = []
-            
-            if os.path.exists(migrations_dir):
-                for filename in sorted(os.listdir(migrations_dir)):
-                    if filename.endswith('.sql') and filename.startswith(('001', '002', '003')):
-                        version = int(filename[:3])
-                        available_migrations.append((version, filename))
-            
-            # Apply missing migrations
-            for version, filename in available_migrations:
-                if version not in applied_versions:
-                    logging.info(f"Applying migration {version}: {filename}")
-                    
-                    migration_path = os.path.join(migrations_dir, filename)
-                    with open(migration_path, 'r') as f:
-                        migration_sql = f.read()
-                    
-                    # Execute migration
-                    cursor.execute(migration_sql)
-                    
-                    # Record as applied
-                    cursor.execute(
-                        "INSERT INTO schema_migrations (version) VALUES (%s)",
-                        (version,)
+            cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK,))
+        conn.commit()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version INTEGER PRIMARY KEY,
+                        applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
                     )
-                    
-                    logging.info(f"Migration {version} applied successfully")
-            
+                """)
+                cursor.execute("ALTER TABLE schema_migrations ADD COLUMN IF NOT EXISTS checksum VARCHAR(64)")
+                cursor.execute("ALTER TABLE schema_migrations ADD COLUMN IF NOT EXISTS filename TEXT")
+
+                # Rows from before checksums were recorded adopt the current file
+                checksums = {version: (filename, checksum) for version, filename, checksum in migrations}
+                cursor.execute("SELECT version FROM schema_migrations WHERE checksum IS NULL")
+                for (version,) in cursor.fetchall():
+                    if version in checksums:
+                        cursor.execute(
+                            "UPDATE schema_migrations SET filename = %s, checksum = %s WHERE version = %s",
+                            (*checksums[version], version)
+                        )
             conn.commit()
+
+            # Another task may have applied some while we waited for the lock
+            pending, mismatched = migration_status(conn, migrations)
+            if mismatched:
+                raise RuntimeError(f"Applied migrations were modified: {[m[1] for m in mismatched]}")
+
+            applied = []
+            for version, filename, checksum in pending:
+                logging.info(f"Applying migration {version}: {filename}")
+                started = time.perf_counter()
+                with open(os.path.join(MIGRATIONS_DIR, filename), 'r') as f:
+                    migration_sql = f.read()
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute(migration_sql)
+                        cursor.execute(
+                            "INSERT INTO schema_migrations (version, filename, checksum) VALUES (%s, %s, %s)",
+                            (version, filename, checksum)
+                        )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    log_error("migration", "execution_failed", safe_details=filename)
+                    raise
+                applied.append(version)
+                logging.info(f"Migration {version} applied in {time.perf_counter() - started:.1f}s")
             logging.info("Database migrations completed")
-            
-    except Exception:
-        log_error("migration", "execution_failed")
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+            return applied
+        finally:
+            conn.rollback()
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK,))
+            conn.commit()
 
 # Constants
 ALLOWED_ORIGINS = os.environ.get("ALLOWED_ORIGINS").split(",") if os.environ.get("ALLOWED_ORIGINS") else []
 
+# Shared secret for /metrics (sent as X-Metrics-Token); unset disables the endpoint
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+# Apply pending migrations in the startup event; disable when a pre-deploy
+# step runs `backend.py migrate` instead
+MIGRATE_ON_STARTUP = os.environ.get("MIGRATE_ON_STARTUP", "true").lower() == "true"
+
+# Database connection budget. Each API task opens at most
+#   DB_POOL_MAX (psycopg2) + ASYNC_DB_POOL_MAX (asyncpg) + 1 (article change listener)
+# connections to the primary, and ASYNC_DB_POOL_MAX to each read replica.
+# By default those add up to DB_CONNECTION_BUDGET; keep
+#   tasks * DB_CONNECTION_BUDGET + CLI workers' DB_POOL_MAX
+# under the instance's max_connections (about 80 usable on a db.t3.micro).
+DB_CONNECTION_BUDGET = int(os.environ.get("DB_CONNECTION_BUDGET", "10"))
+ARTICLE_LISTENER_ENABLED = os.environ.get("ARTICLE_LISTENER_ENABLED", "true").lower() == "true"
+_pool_budget = max(2, DB_CONNECTION_BUDGET - (1 if ARTICLE_LISTENER_ENABLED else 0))
+
+# Database connection pool settings
+DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", str(max(1, _pool_budget // 2))))
+DB_POOL_ACQUIRE_TIMEOUT = float(os.environ.get("DB_POOL_ACQUIRE_TIMEOUT", "10"))
+DB_POOL_HEALTHCHECK_IDLE = float(os.environ.get("DB_POOL_HEALTHCHECK_IDLE", "30"))
+
+# Async (asyncpg) pool used by the read-only endpoints (one per replica too)
+ASYNC_DB_POOL_MIN = int(os.environ.get("ASYNC_DB_POOL_MIN", "1"))
+ASYNC_DB_POOL_MAX = int(os.environ.get("ASYNC_DB_POOL_MAX", str(max(1, _pool_budget - DB_POOL_MAX))))
+ASYNC_DB_COMMAND_TIMEOUT = float(os.environ.get("ASYNC_DB_COMMAND_TIMEOUT", "30"))
+ASYNC_DB_STATEMENT_CACHE = int(os.environ.get("ASYNC_DB_STATEMENT_CACHE", "256"))
+
+# Read replica routing. A replica serves reads only while its lag is under
+# REPLICA_MAX_LAG_SECONDS and it has replayed past the client's last write,
+# which is remembered in a cookie for READ_AFTER_WRITE_SECONDS.
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get("REPLICA_LAG_CHECK_INTERVAL", "2"))
+READ_AFTER_WRITE_SECONDS = int(os.environ.get("READ_AFTER_WRITE_SECONDS", "60"))
+LAST_WRITE_COOKIE = "last_write_at"
+# POST endpoints that only read, so they do not pin the client to the primary
+READ_ONLY_POST_PATHS = ("/articles/batch", "/discover_rss/")
+
+# Largest page the listing endpoints will return
+MAX_PAGE_SIZE = int(os.environ.get("MAX_PAGE_SIZE", "200"))
+
+# Feed refresh scheduler settings (intervals in seconds)
+FEED_SCHEDULER_ENABLED = os.environ.get("FEED_SCHEDULER_ENABLED", "true").lower() == "true"
+FEED_POLL_MIN_INTERVAL = int(os.environ.get("FEED_POLL_MIN_INTERVAL", "900"))
+FEED_POLL_MAX_INTERVAL = int(os.environ.get("FEED_POLL_MAX_INTERVAL", "86400"))
+FEED_POLL_DEFAULT_INTERVAL = int(os.environ.get("FEED_POLL_DEFAULT_INTERVAL", "3600"))
+FEED_POLL_BACKOFF = float(os.environ.get("FEED_POLL_BACKOFF", "1.5"))
+FEED_POLL_JITTER = float(os.environ.get("FEED_POLL_JITTER", "0.1"))
+FEED_POLL_CONCURRENCY = int(os.environ.get("FEED_POLL_CONCURRENCY", "10"))
+FEED_POLL_LEASE_SECONDS = int(os.environ.get("FEED_POLL_LEASE_SECONDS", "600"))
+FEED_SCHEDULER_TICK = float(os.environ.get("FEED_SCHEDULER_TICK", "30"))
+
+# Optional on-disk cache of raw feed bodies, keyed by SHA-256 of the body
+FEED_CACHE_DIR = os.environ.get("FEED_CACHE_DIR")
+
+# Rows per multi-row INSERT when writing articles
+ARTICLE_BATCH_SIZE = int(os.environ.get("ARTICLE_BATCH_SIZE", "500"))
+
+# Monthly rss_articles partitions and their archival to S3
+PARTITION_MAINTENANCE_ENABLED = os.environ.get("PARTITION_MAINTENANCE_ENABLED", "true").lower() == "true"
+PARTITION_MAINTENANCE_INTERVAL = int(os.environ.get("PARTITION_MAINTENANCE_INTERVAL", "86400"))
+ARTICLE_PARTITION_MONTHS_AHEAD = int(os.environ.get("ARTICLE_PARTITION_MONTHS_AHEAD", "3"))
+# Whole months of articles kept online; 0 disables archival
+ARTICLE_RETENTION_MONTHS = int(os.environ.get("ARTICLE_RETENTION_MONTHS", "0"))
+# Drop archived partitions after upload, or leave them detached for a quick re-attach
+ARTICLE_ARCHIVE_DROP = os.environ.get("ARTICLE_ARCHIVE_DROP", "true").lower() == "true"
+ARTICLE_ARCHIVE_PREFIX = os.environ.get("ARTICLE_ARCHIVE_PREFIX", "archive/rss_articles/")
+
+# In-process LRU of article records served to chat and /articles/batch
+ARTICLE_CACHE_SIZE = int(os.environ.get("ARTICLE_CACHE_SIZE", "5000"))
+ARTICLE_CACHE_TTL = int(os.environ.get("ARTICLE_CACHE_TTL", "600"))
+ARTICLE_BATCH_MAX = int(os.environ.get("ARTICLE_BATCH_MAX", "100"))
+
+# Bedrock response cache: an in-process LRU, optionally backed by a table
+# shared between instances. TTL bounds how stale a cached answer can get.
+BEDROCK_CACHE_ENABLED = os.environ.get("BEDROCK_CACHE_ENABLED", "true").lower() == "true"
+BEDROCK_CACHE_SIZE = int(os.environ.get("BEDROCK_CACHE_SIZE", "1000"))
+BEDROCK_CACHE_TTL = int(os.environ.get("BEDROCK_CACHE_TTL", "900"))
+BEDROCK_CACHE_SHARED = os.environ.get("BEDROCK_CACHE_SHARED", "false").lower() == "true"
+
+# Threads relaying streamed chat responses; each holds one for the whole
+# Bedrock stream, so they get their own pool instead of the default executor
+CHAT_STREAM_WORKERS = int(os.environ.get("CHAT_STREAM_WORKERS", "16"))
+
+# Recent-articles block of the chat context, cached per worker until ingest
+# announces new articles (LISTEN/NOTIFY) or the TTL lets the 48h window slide
+RSS_CONTEXT_TTL = int(os.environ.get("RSS_CONTEXT_TTL", "300"))
+ARTICLE_LISTENER_PING_INTERVAL = float(os.environ.get("ARTICLE_LISTENER_PING_INTERVAL", "30"))
+
+# Semantic retrieval: articles are embedded in the background after ingest
+# and every instance keeps the vectors in memory (EMBEDDING_DIM * 4 bytes per
+# article). EMBEDDING_PROVIDER is "hashing" (local, offline) or "bedrock".
+EMBEDDINGS_ENABLED = os.environ.get("EMBEDDINGS_ENABLED", "false").lower() == "true"
+EMBEDDING_PROVIDER = os.environ.get("EMBEDDING_PROVIDER", "hashing")
+EMBEDDING_MODEL_ID = os.environ.get("EMBEDDING_MODEL_ID", "amazon.titan-embed-text-v2:0")
+EMBEDDING_DIM = int(os.environ.get("EMBEDDING_DIM", "256"))
+EMBEDDING_BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", "64"))
+EMBEDDING_IDLE_SECONDS = float(os.environ.get("EMBEDDING_IDLE_SECONDS", "30"))
+EMBEDDING_LOAD_PAGE = int(os.environ.get("EMBEDDING_LOAD_PAGE", "10000"))
+# Articles that fail this many times are skipped until their text changes
+EMBEDDING_MAX_ATTEMPTS = int(os.environ.get("EMBEDDING_MAX_ATTEMPTS", "3"))
+# Weight of ts_rank against cosine similarity when ranking; 0 is cosine only
+EMBEDDING_TS_RANK_WEIGHT = float(os.environ.get("EMBEDDING_TS_RANK_WEIGHT", "0"))
+
+# Feed discovery settings
+DISCOVERY_MAX_BYTES = int(os.environ.get("DISCOVERY_MAX_BYTES", str(256 * 1024)))
+DISCOVERY_PROBE_TIMEOUT = float(os.environ.get("DISCOVERY_PROBE_TIMEOUT", "5"))
+DISCOVERY_CACHE_TTL = int(os.environ.get("DISCOVERY_CACHE_TTL", "3600"))
+COMMON_FEED_PATHS = ['/rss', '/feed', '/rss.xml', '/atom.xml', '/index.xml', '/feed.xml']
+FEED_LINK_TYPES = ('application/rss+xml', 'application/atom+xml')
+
+# OPML import settings
+OPML_IMPORT_CONCURRENCY = int(os.environ.get("OPML_IMPORT_CONCURRENCY", "20"))
+OPML_IMPORT_PER_HOST = int(os.environ.get("OPML_IMPORT_PER_HOST", "4"))
+OPML_WRITE_BATCH_FEEDS = int(os.environ.get("OPML_WRITE_BATCH_FEEDS", "50"))
+OPML_MAX_BYTES = int(os.environ.get("OPML_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# Worker processes for CPU-bound feed parsing and HTML extraction
+PARSE_PROCESSES = int(os.environ.get("PARSE_PROCESSES", str(os.cpu_count() or 2)))
+PARSE_TIMEOUT = int(os.environ.get("PARSE_TIMEOUT", "20"))
+
+# Full-article content extraction settings. Off in the API process by
+# default; run it as its own task with `backend.py extract`
+EXTRACTION_ENABLED = os.environ.get("EXTRACTION_ENABLED", "false").lower() == "true"
+EXTRACTION_FETCH_CONCURRENCY = int(os.environ.get("EXTRACTION_FETCH_CONCURRENCY", "8"))
+EXTRACTION_BATCH_SIZE = int(os.environ.get("EXTRACTION_BATCH_SIZE", "50"))
+EXTRACTION_MAX_BYTES = int(os.environ.get("EXTRACTION_MAX_BYTES", str(2 * 1024 * 1024)))
+EXTRACTION_MAX_CHARS = int(os.environ.get("EXTRACTION_MAX_CHARS", "20000"))
+EXTRACTION_TIMEOUT = int(os.environ.get("EXTRACTION_TIMEOUT", "10"))
+EXTRACTION_IDLE_SECONDS = float(os.environ.get("EXTRACTION_IDLE_SECONDS", "60"))
+EXTRACTION_PROCESSES = int(os.environ.get("EXTRACTION_PROCESSES", "1"))
+# Articles whose extraction times out this many times are marked failed
+EXTRACTION_MAX_ATTEMPTS = int(os.environ.get("EXTRACTION_MAX_ATTEMPTS", "3"))
+
+# Ingestion job queue settings
+INGEST_WORKERS = int(os.environ.get("INGEST_WORKERS", "4"))
+JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", "1.0"))
+JOB_TIMEOUT_SECONDS = int(os.environ.get("JOB_TIMEOUT_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.environ.get("JOB_MAX_ATTEMPTS", "3"))
+
 # Rate limiting setup
 limiter = Limiter(key_func=get_remote_address)
 
@@ -143,6 +366,8 @@ DB_PASSWORD = secrets.get(os.environ.get('DB_PASSWORD_KEY'))
 DB_HOST = secrets.get(os.environ.get('DB_HOST_KEY'))
 DB_PORT = secrets.get(os.environ.get('DB_PORT_KEY'))
 S3_BUCKET_NAME = secrets.get(os.environ.get('S3_BUCKET_KEY'))
+# Optional read replicas: "host[:port],host[:port]" (or a JSON list of them)
+DB_REPLICA_HOSTS = secrets.get(os.environ.get('DB_REPLICA_HOSTS_KEY')) or []
 
 # Strip port from DB_HOST if it contains one
 if DB_HOST and ':' in DB_HOST:
@@ -169,6 +394,15 @@ except Exception:
     log_error("bedrock_init", "client_failed")
     bedrock_client = None
 
+# Initialize article embedder
+embedder = None
+if EMBEDDINGS_ENABLED:
+    try:
+        embedder = embeddings.make_embedder(EMBEDDING_PROVIDER, EMBEDDING_DIM, bedrock_client, EMBEDDING_MODEL_ID)
+        logging.info(f"Article embedder: {embedder.name}")
+    except Exception:
+        log_error("embedder_init", "embedder_failed")
+
 # Initialize S3 client
 try:
     s3_client = boto3.client('s3')
@@ -189,18 +423,92 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def track_client_writes(request: Request, call_next):
+    """Mark clients that just wrote so their next reads skip lagging replicas"""
+    response = await call_next(request)
+    if (replicas and request.method in ("POST", "PUT", "PATCH", "DELETE") and response.status_code < 400
+            and not request.url.path.startswith(READ_ONLY_POST_PATHS)):
+        remember_write(response)
+    return response
+
 # Run migrations on startup
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on application startup"""
     try:
-        logging.info("Running database migrations...")
-        run_migrations()
+        db_pool.fill()
+        logging.info(f"Database pool ready ({DB_POOL_MIN}-{DB_POOL_MAX} connections)")
+        primary_connections = DB_POOL_MAX + ASYNC_DB_POOL_MAX + (1 if ARTICLE_LISTENER_ENABLED else 0)
+        if primary_connections > DB_CONNECTION_BUDGET:
+            logging.warning(
+                f"Pools may open {primary_connections} primary connections, "
+                f"over DB_CONNECTION_BUDGET={DB_CONNECTION_BUDGET}"
+            )
+        if MIGRATE_ON_STARTUP:
+            logging.info("Running database migrations...")
+            run_migrations()
+        else:
+            pending = run_migrations(check_only=True)
+            if pending:
+                logging.warning(f"Pending database migrations: {pending}")
+        await init_async_db_pool()
+        if replicas:
+            app.state.replica_monitor = asyncio.create_task(run_replica_monitor())
+            logging.info(f"Routing reads to {len(replicas)} replicas")
+        app.state.job_workers = [asyncio.create_task(run_job_worker()) for _ in range(INGEST_WORKERS)]
+        logging.info(f"Started {INGEST_WORKERS} ingestion job workers")
+        if FEED_SCHEDULER_ENABLED:
+            app.state.feed_scheduler = asyncio.create_task(run_feed_scheduler())
+            logging.info("Feed refresh scheduler started")
+        if EXTRACTION_ENABLED:
+            app.state.content_extractor = asyncio.create_task(run_content_extractor())
+            logging.info("Content extractor started")
+        if PARTITION_MAINTENANCE_ENABLED:
+            app.state.partition_maintenance = asyncio.create_task(run_partition_maintenance())
+            logging.info("Partition maintenance started")
+        if ARTICLE_LISTENER_ENABLED:
+            app.state.article_listener = asyncio.create_task(run_article_change_listener())
+        if embedder:
+            app.state.embedding_indexer = asyncio.create_task(run_embedding_indexer())
+            logging.info("Embedding indexer started")
         logging.info("Application startup completed")
     except Exception as e:
         logging.error(f"Startup failed: {e}")
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks on application shutdown"""
+    scheduler_task = getattr(app.state, "feed_scheduler", None)
+    if scheduler_task:
+        scheduler_task.cancel()
+    for worker_task in getattr(app.state, "job_workers", []):
+        worker_task.cancel()
+    extractor_task = getattr(app.state, "content_extractor", None)
+    if extractor_task:
+        extractor_task.cancel()
+    maintenance_task = getattr(app.state, "partition_maintenance", None)
+    if maintenance_task:
+        maintenance_task.cancel()
+    monitor_task = getattr(app.state, "replica_monitor", None)
+    if monitor_task:
+        monitor_task.cancel()
+    listener_task = getattr(app.state, "article_listener", None)
+    if listener_task:
+        listener_task.cancel()
+    indexer_task = getattr(app.state, "embedding_indexer", None)
+    if indexer_task:
+        indexer_task.cancel()
+    if parse_pool:
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+    if extraction_pool:
+        extraction_pool.shutdown(wait=False, cancel_futures=True)
+    chat_stream_executor.shutdown(wait=False, cancel_futures=True)
+    fetcher.close()
+    db_pool.closeall()
+    await close_async_db_pool()
+
 # Rate limiting
 # app.state.limiter = limiter
 # app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -252,6 +560,9 @@ class RSSRequest(BaseModel):
             v = 'https://' + v
         return v
 
+class ArticleBatchRequest(BaseModel):
+    article_ids: List[str]
+
 class RSSChatRequest(BaseModel):
     messages: List[Message]
     rss_uuid: str
@@ -265,362 +576,2287 @@ class RSSChatRequest(BaseModel):
             raise ValueError('Invalid UUID format')
 
 # Database helper functions
-def get_db_connection():
-    try:
-        conn = psycopg2.connect(**DB_CONFIG)
+class PoolTimeout(Exception):
+    pass
+
+class ConnectionPool:
+    """Thread-safe psycopg2 connection pool.
+
+    Keeps between minsize and maxsize open connections. Callers block for up
+    to acquire_timeout when every connection is checked out. Connections idle
+    longer than healthcheck_idle are pinged before being handed out, and
+    connections returned broken or mid-transaction are rolled back or dropped.
+    """
+
+    def __init__(self, minsize, maxsize, acquire_timeout, healthcheck_idle, **connect_kwargs):
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.acquire_timeout = acquire_timeout
+        self.healthcheck_idle = healthcheck_idle
+        self.connect_kwargs = connect_kwargs
+        self._idle = []  # (conn, released_at), most recently used last
+        self._size = 0
+        self._cond = threading.Condition()
+        self._metrics = {"acquired": 0, "waits": 0, "wait_seconds": 0.0, "timeouts": 0,
+                         "created": 0, "discarded": 0, "healthcheck_failures": 0}
+
+    def _connect(self):
+        conn = psycopg2.connect(**self.connect_kwargs)
+        with self._cond:
+            self._metrics["created"] += 1
         return conn
+
+    def fill(self):
+        """Open connections up to minsize"""
+        while True:
+            with self._cond:
+                if self._size >= self.minsize:
+                    return
+                self._size += 1
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    def _healthy(self, conn, released_at):
+        if conn.closed:
+            return False
+        if time.monotonic() - released_at < self.healthcheck_idle:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            self._metrics["healthcheck_failures"] += 1
+            return False
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._metrics["discarded"] += 1
+            self._cond.notify()
+
+    def getconn(self):
+        started = time.monotonic()
+        deadline = started + self.acquire_timeout
+        waited = False
+        while True:
+            with self._cond:
+                while not self._idle and self._size >= self.maxsize:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics["timeouts"] += 1
+                        raise PoolTimeout(f"No database connection free after {self.acquire_timeout}s")
+                    waited = True
+                    self._cond.wait(remaining)
+                if self._idle:
+                    conn, released_at = self._idle.pop()
+                else:
+                    conn, released_at = None, None
+                    self._size += 1
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._healthy(conn, released_at):
+                self._discard(conn)
+                continue
+
+            with self._cond:
+                self._metrics["acquired"] += 1
+                if waited:
+                    self._metrics["waits"] += 1
+                    self._metrics["wait_seconds"] += time.monotonic() - started
+            return conn
+
+    def putconn(self, conn):
+        if conn.closed:
+            self._discard(conn)
+            return
+        try:
+            if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn, _ in idle:
+            conn.close()
+
+    def stats(self):
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                **self._metrics,
+                "wait_seconds": round(self._metrics["wait_seconds"], 3),
+                "size": self._size,
+                "idle": idle,
+                "in_use": self._size - idle,
+                "minsize": self.minsize,
+                "maxsize": self.maxsize,
+            }
+
+db_pool = ConnectionPool(DB_POOL_MIN, DB_POOL_MAX, DB_POOL_ACQUIRE_TIMEOUT, DB_POOL_HEALTHCHECK_IDLE, **DB_CONFIG)
+
+@contextmanager
+def db_connection():
+    """Check a pooled connection out for the duration of the block.
+
+    Uncommitted work is rolled back when the connection goes back to the pool.
+    """
+    try:
+        conn = db_pool.getconn()
+    except PoolTimeout:
+        log_error("database_connection", "pool_exhausted")
+        raise HTTPException(status_code=503, detail="Database busy, please retry")
     except Exception:
         log_error("database_connection", "connection_failed")
         raise HTTPException(status_code=500, detail="Database connection failed")
+    try:
+        yield conn
+    finally:
+        db_pool.putconn(conn)
+
+# Async database access
+# Read endpoints run on asyncpg so queries don't block the event loop. Each
+# connection prepares a statement the first time it sees a query string and
+# reuses it afterwards (asyncpg's statement cache), so the read queries below
+# are kept as fixed module-level strings.
+async_db_pool = None
+
+def create_async_pool(host, port):
+    return asyncpg.create_pool(
+        database=DB_NAME,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        host=host,
+        port=int(port),
+        min_size=ASYNC_DB_POOL_MIN,
+        max_size=ASYNC_DB_POOL_MAX,
+        command_timeout=ASYNC_DB_COMMAND_TIMEOUT,
+        statement_cache_size=ASYNC_DB_STATEMENT_CACHE,
+        max_inactive_connection_lifetime=DB_POOL_HEALTHCHECK_IDLE * 10,
+    )
+
+async def init_async_db_pool():
+    global async_db_pool
+    async_db_pool = await create_async_pool(DB_HOST, DB_PORT)
+    for replica in replicas:
+        await replica.connect()
+
+# Article change notifications
+# Ingest NOTIFYs this channel when it commits new or changed articles; every
+# API instance LISTENs and bumps articles_version, which caches built from
+# article data use as part of their key.
+ARTICLES_CHANGED_CHANNEL = "rss_articles_changed"
+
+articles_version = 0
+
+def bump_articles_version(*_):
+    global articles_version
+    articles_version += 1
+
+async def run_article_change_listener():
+    """Bump articles_version on each change notification, reconnecting on failure"""
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(
+                database=DB_NAME, user=DB_USER, password=DB_PASSWORD, host=DB_HOST, port=int(DB_PORT)
+            )
+            await conn.add_listener(ARTICLES_CHANGED_CHANNEL, bump_articles_version)
+            # Changes made while we weren't listening are unknown
+            bump_articles_version()
+            while True:
+                await asyncio.sleep(ARTICLE_LISTENER_PING_INTERVAL)
+                # Notices a dead connection, which would otherwise just go quiet
+                await conn.fetchval("SELECT 1")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log_error("article_listener", "connection_failed")
+        finally:
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+        await asyncio.sleep(ARTICLE_LISTENER_PING_INTERVAL)
 
-def store_rss_feed_and_articles(feed_data, feed_url):
-    """Store RSS feed and articles in database"""
-    conn = get_db_connection()
+async def close_async_db_pool():
+    global async_db_pool
+    for replica in replicas:
+        await replica.close()
+    if async_db_pool is not None:
+        await async_db_pool.close()
+        async_db_pool = None
+
+def pool_stats(pool):
+    if pool is None:
+        return {}
+    size = pool.get_size()
+    idle = pool.get_idle_size()
+    return {"size": size, "idle": idle, "in_use": size - idle,
+            "minsize": pool.get_min_size(), "maxsize": pool.get_max_size()}
+
+def async_db_pool_stats():
+    return pool_stats(async_db_pool)
+
+# Read replicas
+# NULL when the replica is not streaming from the primary: having replayed
+# everything received says nothing about lag once WAL stops arriving
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE coalesce(status, 'streaming') = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+class Replica:
+    """An asyncpg pool on a read replica plus its last measured lag"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.pool = None
+        self.lag = None  # seconds; None while unreachable or unchecked
+        self.checked_at = 0.0
+
+    async def connect(self):
+        try:
+            self.pool = await create_async_pool(self.host, self.port)
+        except Exception:
+            log_error("replica_connection", "connection_failed", safe_details=self.host)
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def check_lag(self):
+        if self.pool is None:
+            await self.connect()
+        try:
+            async with self.pool.acquire(timeout=REPLICA_LAG_CHECK_INTERVAL) as conn:
+                lag = await conn.fetchval(REPLICA_LAG_SQL)
+            self.lag = float(lag) if lag is not None else None
+        except Exception:
+            self.lag = None
+        self.checked_at = time.time()
+
+    def caught_up_to(self, timestamp):
+        """Whether this replica had replayed everything committed before timestamp"""
+        return self.lag is not None and self.checked_at - self.lag > timestamp
+
+    def stats(self):
+        return {"host": self.host, "lag_seconds": self.lag, **pool_stats(self.pool)}
+
+def parse_replica_hosts(value):
+    """[(host, port)] from the DB_REPLICA_HOSTS secret"""
+    if isinstance(value, str):
+        value = json.loads(value) if value.strip().startswith('[') else value.split(',')
+    hosts = []
+    for entry in value:
+        host, _, port = entry.strip().partition(':')
+        if host:
+            hosts.append((host, port or DB_PORT))
+    return hosts
+
+replicas = [Replica(host, port) for host, port in parse_replica_hosts(DB_REPLICA_HOSTS)]
+
+async def run_replica_monitor():
+    """Re-measure every replica's lag each REPLICA_LAG_CHECK_INTERVAL"""
+    while True:
+        await asyncio.gather(*(replica.check_lag() for replica in replicas))
+        await asyncio.sleep(REPLICA_LAG_CHECK_INTERVAL)
+
+def client_last_write(request):
+    """When this client last wrote, from its cookie (None if not recently)"""
+    if request is None:
+        return None
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, ''))
+    except ValueError:
+        return None
+    return last_write if time.time() - last_write < READ_AFTER_WRITE_SECONDS else None
+
+def remember_write(response, written_at=None):
+    """Pin the client's reads to servers that have replayed a write (now, by default)"""
+    response.set_cookie(
+        LAST_WRITE_COOKIE, f"{written_at or time.time():.3f}",
+        max_age=READ_AFTER_WRITE_SECONDS, httponly=True, samesite="lax"
+    )
+
+def read_pool(request=None):
+    """Pool for a read-only query: a fresh-enough replica, else the primary"""
+    last_write = client_last_write(request) or 0.0
+    candidates = [
+        replica for replica in replicas
+        if replica.pool is not None and replica.lag is not None
+        and replica.lag <= REPLICA_MAX_LAG_SECONDS and replica.caught_up_to(last_write)
+    ]
+    if not candidates:
+        return async_db_pool
+    return random.choice(candidates).pool
+
+async def async_fetch(query, *args, pool=None):
+    """Run a read query (on the primary unless a pool is given) and return the rows as dicts"""
+    pool = pool or async_db_pool
+    if pool is None:
+        raise HTTPException(status_code=503, detail="Database not ready")
     try:
+        async with pool.acquire(timeout=DB_POOL_ACQUIRE_TIMEOUT) as conn:
+            rows = await conn.fetch(query, *args)
+    except asyncio.TimeoutError:
+        log_error("database_connection", "pool_exhausted")
+        raise HTTPException(status_code=503, detail="Database busy, please retry")
+    return [dict(row) for row in rows]
+
+# Keyset pagination
+# Listings are ordered by (timestamp, id) descending. A page token encodes the
+# sort key of the last row served, and the next page starts strictly below it,
+# so every page is an index range scan no matter how deep it is.
+def encode_cursor(sort_value, row_id):
+    """Opaque page token for the last row of a page (sort value is a datetime or a number)"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, str(row_id)])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """Inverse of encode_cursor; returns (sort_value, id) or raises a 400"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(sort_value, str):
+            sort_value = datetime.fromisoformat(sort_value)
+        elif not isinstance(sort_value, (int, float)) or isinstance(sort_value, bool):
+            raise ValueError("Bad sort value")
+        return sort_value, str(uuid.UUID(row_id))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def fetch_page(queries, params, cursor, limit, sort_column, pool=None):
+    """Fetch one keyset page; returns (rows, next_cursor).
+
+    queries maps False/True to the first-page and next-page statements: two
+    fixed strings rather than one with an "IS NULL OR" guard, so each prepared
+    statement gets a plan that walks the (timestamp, id) index. Parameters are
+    numbered params..., then the limit, then the cursor's (timestamp, id).
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        rows = await async_fetch(queries[True], *params, limit + 1, *decode_cursor(cursor), pool=pool)
+    else:
+        rows = await async_fetch(queries[False], *params, limit + 1, pool=pool)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][sort_column], rows[-1]['id'])
+    return rows, next_cursor
+
+ALL_ARTICLES_SQL = """
+    SELECT a.id, a.title, a.snippet, a.url, a.published_date, a.author, a.created_at,
+           f.title as feed_title, f.id as feed_id
+    FROM rss_articles a
+    JOIN rss_feeds f ON a.feed_id = f.id
+    {keyset}
+    ORDER BY a.created_at DESC, a.id DESC
+    LIMIT $1
+"""
+ALL_ARTICLES_PAGES = {
+    False: ALL_ARTICLES_SQL.format(keyset=""),
+    True: ALL_ARTICLES_SQL.format(keyset="WHERE (a.created_at, a.id) < ($2, $3)"),
+}
+
+# Search ranks matches in an inner query and builds headlines only for the
+# page it returns. Parameters: $1 query text, $2 feed id, $3/$4 published
+# window, $5 limit, then the cursor's (rank, id).
+SEARCH_FILTERS = """
+          AND ($2::uuid IS NULL OR a.feed_id = $2)
+          AND ($3::timestamptz IS NULL OR COALESCE(a.published_date, a.created_at) >= $3)
+          AND ($4::timestamptz IS NULL OR COALESCE(a.published_date, a.created_at) < $4)
+"""
+
+SEARCH_ARTICLES_SQL = """
+    WITH q AS (SELECT websearch_to_tsquery('english', $1) AS query),
+    page AS (
+        SELECT a.id, a.created_at, ts_rank(a.search_vector, q.query) AS rank
+        FROM rss_articles a, q
+        WHERE a.search_vector @@ q.query
+""" + SEARCH_FILTERS + """
+          {keyset}
+        ORDER BY rank DESC, a.id DESC
+        LIMIT $5
+    )
+    SELECT p.id, p.rank, a.title, a.url, a.published_date, f.title AS feed_title, f.id AS feed_id,
+           ts_headline('english', left(COALESCE(NULLIF(a.content, ''), a.summary_text, ''), 5000), q.query,
+                       'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, '
+                       'MaxFragments=2, FragmentDelimiter=" … "') AS snippet
+    FROM page p
+    JOIN rss_articles a ON a.id = p.id AND a.created_at = p.created_at
+    JOIN rss_feeds f ON a.feed_id = f.id, q
+    ORDER BY p.rank DESC, p.id DESC
+"""
+SEARCH_ARTICLES_PAGES = {
+    False: SEARCH_ARTICLES_SQL.format(keyset=""),
+    True: SEARCH_ARTICLES_SQL.format(keyset="AND (ts_rank(a.search_vector, q.query), a.id) < ($6, $7)"),
+}
+
+# Typo-tolerant fallback when full-text search finds nothing: trigram
+# similarity on titles
+FUZZY_SEARCH_SQL = """
+    WITH page AS (
+        SELECT a.id, a.created_at, similarity(a.title, $1) AS rank
+        FROM rss_articles a
+        WHERE a.title % $1
+""" + SEARCH_FILTERS + """
+          {keyset}
+        ORDER BY rank DESC, a.id DESC
+        LIMIT $5
+    )
+    SELECT p.id, p.rank, a.title, a.url, a.published_date, f.title AS feed_title, f.id AS feed_id,
+           a.snippet
+    FROM page p
+    JOIN rss_articles a ON a.id = p.id AND a.created_at = p.created_at
+    JOIN rss_feeds f ON a.feed_id = f.id
+    ORDER BY p.rank DESC, p.id DESC
+"""
+FUZZY_SEARCH_PAGES = {
+    False: FUZZY_SEARCH_SQL.format(keyset=""),
+    True: FUZZY_SEARCH_SQL.format(keyset="AND (similarity(a.title, $1), a.id) < ($6, $7)"),
+}
+
+# Marks fuzzy-mode page tokens (never produced by url-safe base64)
+FUZZY_CURSOR_PREFIX = "~"
+
+# Undated entries sort by when we stored them
+FEED_ARTICLES_SQL = """
+    SELECT id, title, snippet, url, published_date, author,
+           COALESCE(published_date, created_at) AS sort_date
+    FROM rss_articles
+    WHERE feed_id = $1 {keyset}
+    ORDER BY COALESCE(published_date, created_at) DESC, id DESC
+    LIMIT $2
+"""
+FEED_ARTICLES_PAGES = {
+    False: FEED_ARTICLES_SQL.format(keyset=""),
+    True: FEED_ARTICLES_SQL.format(keyset="AND (COALESCE(published_date, created_at), id) < ($3, $4)"),
+}
+
+CHAT_SESSIONS_SQL = """
+    SELECT id, title, created_at, updated_at, rss_feed_ids, article_ids
+    FROM chat_sessions
+    {keyset}
+    ORDER BY updated_at DESC, id DESC
+    LIMIT $1
+"""
+CHAT_SESSIONS_PAGES = {
+    False: CHAT_SESSIONS_SQL.format(keyset=""),
+    True: CHAT_SESSIONS_SQL.format(keyset="WHERE (updated_at, id) < ($2, $3)"),
+}
+
+RSS_FEEDS_SQL = "SELECT * FROM rss_feeds ORDER BY created_at DESC"
+
+# One row per feed: the 24h/7d counts sum at most 168 hourly buckets per feed
+RSS_FEEDS_WITH_STATS_SQL = """
+    SELECT f.*,
+           COALESCE(s.article_count, 0) AS article_count,
+           s.latest_published_at,
+           COALESCE(h.articles_24h, 0) AS articles_24h,
+           COALESCE(h.articles_7d, 0) AS articles_7d,
+           s.last_fetch_at, s.last_fetch_status, s.last_fetch_ms, s.last_fetch_error
+    FROM rss_feeds f
+    LEFT JOIN feed_stats s ON s.feed_id = f.id
+    LEFT JOIN (
+        SELECT feed_id,
+               SUM(articles) FILTER (WHERE hour >= NOW() - INTERVAL '24 hours') AS articles_24h,
+               SUM(articles) AS articles_7d
+        FROM feed_stats_hourly
+        WHERE hour >= NOW() - INTERVAL '7 days'
+        GROUP BY feed_id
+    ) h ON h.feed_id = f.id
+    ORDER BY f.created_at DESC
+"""
+
+def parse_published_date(value):
+    """Parse a feed date string into a timezone-aware datetime (UTC if unspecified)."""
+    if not value:
+        return None
+    try:
+        parsed = dateutil.parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def upsert_feeds(cursor, feeds):
+    """Insert or refresh (feed_data, feed_url) pairs in one statement; returns {url: feed_id}"""
+    rows = {}
+    for feed_data, feed_url in feeds:
+        rows[feed_url] = (
+            str(uuid.uuid4()), feed_data['title'], feed_url, feed_data['description'], datetime.now(),
+            FEED_POLL_DEFAULT_INTERVAL, feed_data.get('etag'), feed_data.get('last_modified'),
+            feed_data.get('body_hash')
+        )
+    if not rows:
+        return {}
+
+    # New feeds get their first re-poll one default interval out
+    written = execute_values(cursor, """
+        INSERT INTO rss_feeds (id, title, url, description, last_updated, next_poll_at,
+                               etag, last_modified, body_hash)
+        VALUES %s
+        ON CONFLICT (url) DO UPDATE SET
+            title = EXCLUDED.title,
+            description = EXCLUDED.description,
+            last_updated = EXCLUDED.last_updated,
+            etag = EXCLUDED.etag,
+            last_modified = EXCLUDED.last_modified,
+            body_hash = EXCLUDED.body_hash
+        RETURNING url, id
+    """, list(rows.values()),
+        template="(%s, %s, %s, %s, %s, NOW() + make_interval(secs => %s), %s, %s, %s)",
+        page_size=len(rows), fetch=True)
+    return {url: str(feed_id) for url, feed_id in written}
+
+URL_ORIGIN_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#]*')
+
+def article_dedup_key(entry):
+    """Natural key of an entry within its feed: the normalized link, else guid, else title.
+
+    Mirrors the backfill in migration 005 so pre-existing rows keep matching.
+    """
+    link = (entry.get('link') or '').strip().split('#', 1)[0]
+    # Scheme and host are case-insensitive; path and query are not
+    origin = URL_ORIGIN_RE.match(link)
+    if origin:
+        link = origin.group(0).lower() + link[origin.end():]
+    link = link.rstrip('/')
+    if link:
+        return link
+    if entry.get('guid'):
+        return f"guid:{entry['guid']}"
+    return f"title:{hashlib.md5(entry['title'].encode('utf-8')).hexdigest()}"
+
+def article_content_hash(title, summary, content):
+    """Fingerprint of the feed-provided fields, used to skip unchanged entries"""
+    payload = "\x1f".join([title or '', summary or '', content or ''])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def build_article_rows(feed_id, entries):
+    """Turn parsed feed entries into rss_articles rows for upsert_articles"""
+    return [
+        (
+            str(uuid.uuid4()), feed_id, entry['title'], entry.get('content', ''),
+            entry['summary'], entry['link'], parse_published_date(entry.get('published')),
+            entry.get('author', ''), article_dedup_key(entry),
+            article_content_hash(entry['title'], entry['summary'], entry.get('content', '')),
+            # Entries that ship their own content never need the extraction stage
+            'feed' if entry.get('content') else None,
+            entry['summary_text'], entry['snippet'], entry['token_estimate']
+        )
+        for entry in entries
+    ]
+
+# Articles are deduplicated through rss_article_keys: rss_articles is
+# partitioned by created_at and can't carry a (feed_id, dedup_key) unique index.
+# A new key inserts the article into the current partition; a known key whose
+# content hash changed updates the article in the partition it lives in.
+# New articles are also counted into feed_stats and feed_stats_hourly.
+ARTICLE_UPSERT_SQL = """
+    WITH incoming (id, feed_id, title, content, summary, url, published_date, author,
+                   dedup_key, content_hash, content_status, summary_text, snippet, token_estimate) AS (
+        VALUES %s
+    ),
+    keys AS (
+        INSERT INTO rss_article_keys (feed_id, dedup_key, article_id, created_at, content_hash)
+        SELECT feed_id, dedup_key, id, NOW(), content_hash FROM incoming
+        ON CONFLICT (feed_id, dedup_key) DO UPDATE SET content_hash = EXCLUDED.content_hash
+        WHERE rss_article_keys.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+        RETURNING feed_id, dedup_key, article_id, created_at, (xmax = 0) AS inserted
+    ),
+    new_articles AS (
+        INSERT INTO rss_articles (id, feed_id, title, content, summary, url, published_date, author,
+                                  dedup_key, content_hash, content_status, summary_text, snippet,
+                                  token_estimate, created_at)
+        SELECT i.id, i.feed_id, i.title, i.content, i.summary, i.url, i.published_date, i.author,
+               i.dedup_key, i.content_hash, i.content_status, i.summary_text, i.snippet,
+               i.token_estimate, k.created_at
+        FROM incoming i
+        JOIN keys k ON k.feed_id = i.feed_id AND k.dedup_key = i.dedup_key
+        WHERE k.inserted
+    ),
+    changed_articles AS (
+        UPDATE rss_articles AS a SET
+            title = i.title,
+            content = COALESCE(NULLIF(i.content, ''), a.content),
+            content_status = COALESCE(i.content_status, a.content_status),
+            summary = i.summary,
+            summary_text = i.summary_text,
+            snippet = i.snippet,
+            -- Extracted content is kept above, so keep counting it
+            token_estimate = CASE WHEN i.content = '' AND a.content <> ''
+                THEN i.token_estimate + (length(a.content) + 3) / 4 ELSE i.token_estimate END,
+            url = i.url,
+            published_date = i.published_date,
+            author = i.author,
+            content_hash = i.content_hash,
+            embedded_at = NULL,
+            embedding_claimed_at = NULL,
+            embedding_attempts = 0
+        FROM incoming i
+        JOIN keys k ON k.feed_id = i.feed_id AND k.dedup_key = i.dedup_key
+        WHERE NOT k.inserted AND a.id = k.article_id AND a.created_at = k.created_at
+    ),
+    new_stats AS (
+        INSERT INTO feed_stats (feed_id, article_count, latest_published_at)
+        SELECT i.feed_id, count(*), max(i.published_date)
+        FROM incoming i
+        JOIN keys k ON k.feed_id = i.feed_id AND k.dedup_key = i.dedup_key
+        WHERE k.inserted
+        GROUP BY i.feed_id
+        ORDER BY i.feed_id
+        ON CONFLICT (feed_id) DO UPDATE SET
+            article_count = feed_stats.article_count + EXCLUDED.article_count,
+            latest_published_at = GREATEST(feed_stats.latest_published_at, EXCLUDED.latest_published_at)
+    ),
+    new_hourly AS (
+        INSERT INTO feed_stats_hourly (feed_id, hour, articles)
+        SELECT i.feed_id, date_trunc('hour', LEAST(COALESCE(i.published_date, k.created_at), k.created_at)), count(*)
+        FROM incoming i
+        JOIN keys k ON k.feed_id = i.feed_id AND k.dedup_key = i.dedup_key
+        WHERE k.inserted
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+        ON CONFLICT (feed_id, hour) DO UPDATE SET articles = feed_stats_hourly.articles + EXCLUDED.articles
+    )
+    SELECT inserted, article_id FROM keys
+"""
+
+def upsert_articles(cursor, rows):
+    """Write article rows (from any number of feeds) with one multi-row upsert
+    per batch; returns per-batch inserted/updated/skipped counts.
+
+    Rows whose (feed_id, dedup_key) already exists are updated in place only
+    when their content hash changed, otherwise they count as skipped. Each
+    batch also lists its updated article ids, for cache invalidation once
+    the transaction commits.
+    """
+    # A single INSERT ... ON CONFLICT DO UPDATE may not touch the same row twice
+    unique_rows = {}
+    for row in rows:
+        unique_rows.setdefault((row[1], row[8]), row)
+    duplicates = len(rows) - len(unique_rows)
+    rows = list(unique_rows.values())
+
+    batches = []
+    for start in range(0, len(rows), ARTICLE_BATCH_SIZE):
+        batch = rows[start:start + ARTICLE_BATCH_SIZE]
+        written = execute_values(
+            cursor, ARTICLE_UPSERT_SQL, batch,
+            template="(%s::uuid, %s::uuid, %s, %s, %s, %s, %s::timestamptz, %s, %s, %s, %s, %s, %s, %s::integer)",
+            page_size=len(batch), fetch=True
+        )
+        updated_ids = [str(article_id) for was_inserted, article_id in written if not was_inserted]
+        batches.append({
+            "inserted": len(written) - len(updated_ids),
+            "updated": len(updated_ids),
+            "skipped": len(batch) - len(written),
+            "updated_ids": updated_ids
+        })
+    if batches:
+        batches[0]["skipped"] += duplicates
+    return batches
+
+def record_fetches(cursor, fetches):
+    """Record the outcome of feed fetches in feed_stats.
+
+    `fetches` holds (feed_id, status, duration_ms, error) tuples; status is
+    'ok', 'not_modified' or 'error'.
+    """
+    if not fetches:
+        return
+    execute_values(cursor, """
+        INSERT INTO feed_stats (feed_id, last_fetch_at, last_fetch_status, last_fetch_ms, last_fetch_error)
+        VALUES %s
+        ON CONFLICT (feed_id) DO UPDATE SET
+            last_fetch_at = EXCLUDED.last_fetch_at,
+            last_fetch_status = EXCLUDED.last_fetch_status,
+            last_fetch_ms = EXCLUDED.last_fetch_ms,
+            last_fetch_error = EXCLUDED.last_fetch_error
+    """, sorted(fetches, key=lambda fetch: str(fetch[0])), template="(%s::uuid, NOW(), %s, %s, %s)")
+
+def store_feeds(feeds, record_fetch=True):
+    """Store many parsed feeds and their articles in one transaction.
+
+    `feeds` is a list of (feed_data, feed_url) pairs. Feeds are written with a
+    single statement and articles from all of them share upsert batches.
+    Pass record_fetch=False when the data did not come from a fetch (e.g. a
+    re-parse of cached bodies) so feed_stats keeps the last real fetch.
+    Returns {url: feed_id} plus inserted/updated/skipped counts, overall and
+    per batch.
+    """
+    with db_connection() as conn:
         with conn.cursor() as cursor:
-            feed_id = str(uuid.uuid4())
-            
-            # Insert RSS feed
-            cursor.execute("""
-                INSERT INTO rss_feeds (id, title, url, description, last_updated)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    description = EXCLUDED.description,
-                    last_updated = EXCLUDED.last_updated
-                RETURNING id
-            """, (feed_id, feed_data['title'], feed_url, feed_data['description'], datetime.now()))
-            
-            result = cursor.fetchone()
-            feed_id = result[0] if result else feed_id
-            
-            # Insert articles
-            for entry in feed_data['entries']:
-                article_id = str(uuid.uuid4())
-                published_date = None
-                if entry.get('published'):
-                    try:
-                        import dateutil.parser
-                        published_date = dateutil.parser.parse(entry['published'])
-                    except:
-                        pass
-                
-                cursor.execute("""
-                    INSERT INTO rss_articles (id, feed_id, title, content, summary, url, published_date, author)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                """, (
-                    article_id, feed_id, entry['title'], entry.get('content', ''),
-                    entry['summary'], entry['link'], published_date, entry.get('author', '')
-                ))
-        
+            feed_ids = upsert_feeds(cursor, feeds)
+            rows = []
+            for feed_data, feed_url in feeds:
+                rows.extend(build_article_rows(feed_ids[feed_url], feed_data['entries']))
+            batches = upsert_articles(cursor, rows)
+            if record_fetch:
+                record_fetches(cursor, [
+                    (feed_ids[feed_url], 'ok', feed_data.get('fetch_ms'), None) for feed_data, feed_url in feeds
+                ])
+            changed = any(batch['inserted'] or batch['updated'] for batch in batches)
+            if changed:
+                # Delivered to listeners on commit
+                cursor.execute("SELECT pg_notify(%s, '')", (ARTICLES_CHANGED_CHANNEL,))
         conn.commit()
-        return feed_id
-    finally:
-        conn.close()
+    invalidate_articles(article_id for batch in batches for article_id in batch.pop('updated_ids'))
+    if changed:
+        bump_articles_version()
 
-def save_chat_to_s3(session_id: str, messages: List[Dict], context: Dict = None):
-    """Save chat messages to S3"""
+    for number, batch in enumerate(batches, 1):
+        logging.info(
+            f"Article batch {number}: {batch['inserted']} inserted, "
+            f"{batch['updated']} updated, {batch['skipped']} skipped"
+        )
+    return {
+        "feed_ids": feed_ids,
+        "inserted": sum(b['inserted'] for b in batches),
+        "updated": sum(b['updated'] for b in batches),
+        "skipped": sum(b['skipped'] for b in batches),
+        "batches": batches
+    }
+
+def store_rss_feed_and_articles(feed_data, feed_url, record_fetch=True):
+    """Store RSS feed and articles in database.
+
+    Returns the feed id together with inserted/updated/skipped article counts,
+    overall and per batch.
+    """
+    stored = store_feeds([(feed_data, feed_url)], record_fetch=record_fetch)
+    stored["feed_id"] = stored.pop("feed_ids")[feed_url]
+    return stored
+
+# Article Lookup
+ARTICLES_BY_ID_SQL = """
+    SELECT a.id, a.feed_id, a.title, a.summary_text, a.snippet, a.token_estimate, a.url,
+           a.published_date, a.author, f.title as feed_title
+    FROM rss_articles a
+    JOIN rss_feeds f ON a.feed_id = f.id
+    WHERE a.id = ANY(%s::uuid[])
+"""
+
+def get_articles_by_ids(article_ids):
+    """Look up articles by id; returns {id: record} in request order.
+
+    Hot records come from article_cache and all misses are fetched in one
+    primary-key lookup. Malformed and unknown ids are left out.
+    """
+    ids = []
+    for article_id in article_ids:
+        try:
+            ids.append(str(uuid.UUID(str(article_id))))
+        except ValueError:
+            logging.warning(f"Invalid UUID format: {article_id}")
+    ids = list(dict.fromkeys(ids))
+
+    found = {}
+    missing = []
+    for article_id in ids:
+        record = article_cache.get(article_id)
+        if record is None:
+            missing.append(article_id)
+        else:
+            found[article_id] = record
+
+    if missing:
+        with db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(ARTICLES_BY_ID_SQL, (missing,))
+                rows = cursor.fetchall()
+        for row in rows:
+            record = {
+                "id": str(row['id']),
+                "feed_id": str(row['feed_id']),
+                "title": row['title'],
+                "summary": row['summary_text'] or "",
+                "snippet": row['snippet'] or "",
+                "token_estimate": row['token_estimate'] or 0,
+                "url": row['url'] or "",
+                "published_date": row['published_date'].isoformat() if row['published_date'] else None,
+                "author": row['author'] or "",
+                "feed_title": row['feed_title'],
+            }
+            article_cache.set(record['id'], record)
+            found[record['id']] = record
+
+    return {article_id: found[article_id] for article_id in ids if article_id in found}
+
+def invalidate_articles(article_ids):
+    for article_id in article_ids:
+        article_cache.pop(str(article_id))
+
+# AI Context
+RECENT_CONTEXT_SQL = """
+    SELECT a.title, a.snippet, f.title as feed_title
+    FROM rss_articles a
+    JOIN rss_feeds f ON a.feed_id = f.id
+    WHERE a.created_at >= %s
+    ORDER BY a.created_at DESC
+    LIMIT 15
+"""
+
+OLDER_CONTEXT_SQL = """
+    SELECT a.title, a.snippet, f.title as feed_title
+    FROM rss_articles a
+    JOIN rss_feeds f ON a.feed_id = f.id, plainto_tsquery('english', %s) AS query
+    WHERE a.created_at < %s
+    AND a.search_vector @@ query
+    ORDER BY ts_rank(a.search_vector, query) DESC
+    LIMIT 15
+"""
+
+def format_context_articles(heading, articles):
+    block = f"=== {heading} ===\n"
+    for article in articles:
+        block += f"Feed: {article['feed_title']}\n"
+        block += f"Title: {article['title']}\n"
+        block += f"Summary: {article['snippet'] or ''}\n\n"
+    return block
+
+def recent_context_block():
+    """The last-48-hours part of the AI context, as (cutoff, text).
+
+    Shared by every chat turn until ingest bumps articles_version or the
+    entry expires.
+    """
+    version = articles_version
+    cached = recent_context_cache.get(version)
+    if cached is not None:
+        return cached
+    
+    # A literal cutoff lets the planner prune to the current partition(s)
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=48)
+    with db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(RECENT_CONTEXT_SQL, (cutoff,))
+            recent_articles = cursor.fetchall()
+    
+    block = format_context_articles("RECENT ARTICLES (Last 48 hours)", recent_articles) if recent_articles else ""
+    recent_context_cache.set(version, (cutoff, block))
+    return cutoff, block
+
+def get_rss_context_for_ai(user_query: str) -> str:
+    """Get RSS context using Option 3: Recent articles + keyword search"""
+    cutoff, context = recent_context_block()
+    context = "RSS Feed Articles:\n\n" + context
+    
+    # Get older articles matching the user query: closest in meaning when
+    # embeddings are enabled, otherwise by keyword
+    if user_query.strip():
+        older_ids = semantic_article_ids(user_query, 15, before=cutoff)
+        if older_ids is not None:
+            older_articles = list(get_articles_by_ids(older_ids).values())
+        else:
+            with db_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute(OLDER_CONTEXT_SQL, (user_query, cutoff))
+                    older_articles = cursor.fetchall()
+        if older_articles:
+            context += format_context_articles("RELEVANT OLDER ARTICLES", older_articles)
+    
+    return context[:8000]  # Limit context size
+
+def safe_s3_operation(operation, **kwargs):
+    """Run an S3 call, mapping client errors to HTTP errors"""
     if not s3_client:
-        return None
+        return {"status": "skipped", "reason": "s3_unavailable"}
     
     try:
-        s3_key = f"chat-history/anonymous/{session_id}.json"
-        chat_data = {
-            "messages": messages,
-            "context": context or {},
-            "updated_at": datetime.now().isoformat()
-        }
-        
-        s3_client.put_object(
-            Bucket=S3_BUCKET_NAME,
-            Key=s3_key,
-            Body=json.dumps(chat_data),
-            ContentType='application/json'
-        )
-        return s3_key
+        return operation(**kwargs)
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        if error_code == 'NoSuchBucket':
+            raise HTTPException(status_code=404, detail="S3 bucket not found")
+        elif error_code == 'NoSuchKey':
+            raise HTTPException(status_code=404, detail="Resource not found in S3")
+        else:
+            raise HTTPException(status_code=500, detail="S3 operation failed")
+
+# In-process caches
+class TTLCache:
+    """Thread-safe LRU cache with optional per-entry expiry and hit/miss counters"""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[1] is not None and item[1] < time.monotonic():
+                del self._data[key]
+                item = None
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[0] if item else None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+# Discovery results per domain
+discovery_cache = TTLCache(maxsize=1024, ttl=DISCOVERY_CACHE_TTL)
+
+# Article records by id; entries are dropped when ingest or extraction changes them
+article_cache = TTLCache(maxsize=ARTICLE_CACHE_SIZE, ttl=ARTICLE_CACHE_TTL)
+
+# Recent-articles AI context as (cutoff, block), keyed by articles_version;
+# only the current version is kept
+recent_context_cache = TTLCache(maxsize=1, ttl=RSS_CONTEXT_TTL)
+discovery_executor = ThreadPoolExecutor(max_workers=4 * len(COMMON_FEED_PATHS), thread_name_prefix="feed-probe")
+
+# RSS Helper Functions
+def scan_head_for_feeds(chunks, base_url):
+    """Collect feed <link>s from a page's <head>, reading at most DISCOVERY_MAX_BYTES"""
+    feeds = []
+    parser = etree.HTMLPullParser(events=('start',))
+    bytes_read = 0
+    for chunk in chunks:
+        chunk = chunk[:DISCOVERY_MAX_BYTES - bytes_read]
+        bytes_read += len(chunk)
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if element.tag == 'body':
+                return feeds
+            if element.tag == 'link' and (element.get('type') or '').lower() in FEED_LINK_TYPES:
+                feed_url = urllib.parse.urljoin(base_url, element.get('href', ''))
+                feeds.append({'url': feed_url, 'title': element.get('title', 'RSS Feed')})
+        if bytes_read >= DISCOVERY_MAX_BYTES:
+            break
+    return feeds
+
+def probe_feed_url(url):
+    """Check whether url serves a feed: HEAD first, GET and sniff when HEAD is refused"""
+    try:
+        response = fetcher.fetch(url, method='HEAD', timeout=DISCOVERY_PROBE_TIMEOUT)
+        if response.status == 200:
+            return any(t in response.content_type for t in ('rss', 'atom', 'xml'))
+        if response.status not in (403, 405, 501):
+            return False
+
+        response = fetcher.fetch(url, timeout=DISCOVERY_PROBE_TIMEOUT, max_bytes=1024, truncate=True)
+        head = response.body.lstrip().lower()
+        return response.status == 200 and any(tag in head for tag in (b'<rss', b'<feed', b'<rdf', b'<?xml'))
+    except fetcher.FetchError:
+        return False
+
+def discover_rss_feeds(url):
+    """Automatically discover RSS feeds from a website.
+
+    Only the page's <head> is scanned. If it advertises no feeds, the common
+    feed paths are probed concurrently, so the worst case is one probe
+    timeout rather than the sum of them. Results are cached per domain.
+    """
+    domain = urllib.parse.urlparse(url).netloc.lower()
+    cached = discovery_cache.get(domain)
+    if cached is not None:
+        return cached
+
+    feeds = []
+    try:
+        with fetcher.stream(url) as response:
+            if response.status_code >= 400:
+                raise fetcher.FetchError(f"{url} returned HTTP {response.status_code}")
+            feeds = scan_head_for_feeds(response.iter_bytes(), str(response.url))
+
+        # Common RSS paths, only if the page advertises none
+        if not feeds:
+            candidates = [urllib.parse.urljoin(url, path) for path in COMMON_FEED_PATHS]
+            found = discovery_executor.map(probe_feed_url, candidates)
+            for path, test_url, is_feed in zip(COMMON_FEED_PATHS, candidates, found):
+                if is_feed:
+                    feeds.append({'url': test_url, 'title': f'RSS Feed ({path})'})
+                    break  # Keep the first working path, in preference order
+
+        feeds = feeds[:5]  # Limit to 5 feeds max
+        discovery_cache.set(domain, feeds)
     except Exception as e:
-        log_error("s3_chat_save", "save_failed")
+        logging.error(f"RSS discovery error: {str(e)}")
+
+    return feeds
+
+def cache_feed_body(body_hash, body):
+    """Write a raw feed body to the content-addressed cache, if enabled"""
+    if not FEED_CACHE_DIR:
+        return
+    path = os.path.join(FEED_CACHE_DIR, body_hash[:2], body_hash)
+    if os.path.exists(path):
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    except OSError:
+        log_error("feed_cache", "write_failed")
+
+def load_cached_feed_body(body_hash):
+    """Read a raw feed body from the cache, or None if it isn't there"""
+    if not FEED_CACHE_DIR or not body_hash:
+        return None
+    try:
+        with open(os.path.join(FEED_CACHE_DIR, body_hash[:2], body_hash), 'rb') as f:
+            return f.read()
+    except OSError:
         return None
 
-def load_chat_from_s3(s3_key: str):
-    """Load chat messages from S3"""
-    if not s3_client:
-        return {"messages": [], "context": {}}
-    
+# CPU-bound parsing runs in worker processes so it scales with cores, not the GIL.
+# Content extraction gets its own smaller pool so its backfill never queues
+# ahead of feed parsing.
+parse_pool = None
+extraction_pool = None
+
+class ParseTimedOut(Exception):
+    """Parsing didn't finish in time; retryable, unlike the ValueErrors bad input raises"""
+
+def get_parse_pool():
+    """Process pool for feed parsing, created on first use"""
+    global parse_pool
+    if parse_pool is None:
+        parse_pool = ProcessPoolExecutor(max_workers=PARSE_PROCESSES)
+    return parse_pool
+
+def get_extraction_pool():
+    """Process pool for article HTML extraction, created on first use"""
+    global extraction_pool
+    if extraction_pool is None:
+        extraction_pool = ProcessPoolExecutor(max_workers=EXTRACTION_PROCESSES)
+    return extraction_pool
+
+def run_in_process_pool(pool, timeout, fn, *args):
+    """Run fn in a process pool and wait for its result.
+
+    fn enforces its own `timeout` with SIGALRM inside the worker, so the
+    limit covers only the time it actually runs, never the time spent queued
+    behind other tasks. Raises ParseTimedOut when that limit fires.
+    """
     try:
-        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
-        return json.loads(response['Body'].read())
+        return pool.submit(fn, *args).result()
+    except parsing.ParseTimeout:
+        raise ParseTimedOut(f"{fn.__name__} exceeded {timeout}s")
+
+def parse_feed_body(body, url, content_type=None):
+    """Parse a raw feed document into structured data in the process pool"""
+    return run_in_process_pool(
+        get_parse_pool(), PARSE_TIMEOUT, parsing.parse_feed_document, body, url, content_type, 20, PARSE_TIMEOUT
+    )
+
+def parse_rss_feed(url, etag=None, last_modified=None, body_hash=None):
+    """Fetch and parse an RSS feed.
+
+    Sends If-None-Match / If-Modified-Since when validators are known and
+    returns None when the feed is unchanged, either because the server
+    answered 304 or because the body hashes to the last one we parsed.
+    """
+    started = time.perf_counter()
+    try:
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = fetcher.fetch(url, headers=headers)
+        if response.status == 304:
+            return None
+        if response.status >= 400:
+            raise ValueError(f"HTTP {response.status}")
+        body = response.body
+        content_type = response.headers.get('Content-Type')
+        new_etag = response.headers.get('ETag')
+        new_last_modified = response.headers.get('Last-Modified')
+
+        new_hash = hashlib.sha256(body).hexdigest()
+        if body_hash and new_hash == body_hash:
+            return None
+        cache_feed_body(new_hash, body)
+
+        feed_data = parse_feed_body(body, url, content_type)
+        feed_data.update({
+            'etag': new_etag,
+            'last_modified': new_last_modified,
+            'body_hash': new_hash,
+            'fetch_ms': round((time.perf_counter() - started) * 1000)
+        })
+        return feed_data
+    except ParseTimedOut:
+        raise
     except Exception as e:
-        log_error("s3_chat_load", "load_failed")
-        return {"messages": [], "context": {}}
+        logging.error(f"RSS parsing error: {str(e)}")
+        raise ValueError(f"Failed to parse RSS feed: {str(e)}")
 
-def create_chat_session(title: str = None, rss_feed_ids: List[str] = None, article_ids: List[str] = None):
-    """Create new chat session in database"""
-    conn = get_db_connection()
+def reparse_cached_feeds():
+    """Re-parse every feed from its cached raw body without touching the network"""
+    with db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("SELECT url, etag, last_modified, body_hash FROM rss_feeds WHERE body_hash IS NOT NULL")
+            feeds = cursor.fetchall()
+
+    reparsed = 0
+    for feed in feeds:
+        body = load_cached_feed_body(feed['body_hash'])
+        if body is None:
+            continue
+        try:
+            feed_data = parse_feed_body(body, feed['url'])
+        except Exception:
+            log_error("feed_cache_reparse", "parse_failed")
+            continue
+        feed_data.update({'etag': feed['etag'], 'last_modified': feed['last_modified'], 'body_hash': feed['body_hash']})
+        store_rss_feed_and_articles(feed_data, feed['url'], record_fetch=False)
+        reparsed += 1
+    return reparsed
+
+# Feed Refresh Scheduler
+def compute_poll_interval(current_interval, new_entries, entry_dates=None):
+    """Adapt a feed's polling interval to how often it actually publishes.
+
+    The interval halves when a poll finds new entries and backs off by
+    FEED_POLL_BACKOFF when it finds none. When the feed dates its entries,
+    an active feed is pulled straight down to half its median publishing gap.
+    """
+    current_interval = current_interval or FEED_POLL_DEFAULT_INTERVAL
+    if new_entries:
+        interval = current_interval / 2
+        dates = sorted(entry_dates or [], reverse=True)
+        gaps = [(newer - older).total_seconds() for newer, older in zip(dates, dates[1:]) if newer > older]
+        if gaps:
+            gaps.sort()
+            interval = min(interval, gaps[len(gaps) // 2] / 2)
+    else:
+        interval = current_interval * FEED_POLL_BACKOFF
+    return int(min(max(interval, FEED_POLL_MIN_INTERVAL), FEED_POLL_MAX_INTERVAL))
+
+def error_backoff_delay(interval, error_count):
+    """Delay before re-polling a failing feed: interval doubled per consecutive error, capped"""
+    interval = interval or FEED_POLL_DEFAULT_INTERVAL
+    return int(max(interval, min(interval * (2 ** error_count), FEED_POLL_MAX_INTERVAL)))
+
+def jittered_delay(interval):
+    """Spread polls of feeds sharing an interval so they don't fire together"""
+    return interval * random.uniform(1 - FEED_POLL_JITTER, 1 + FEED_POLL_JITTER)
+
+def claim_due_feeds(limit):
+    """Lease up to `limit` due feeds; SKIP LOCKED keeps concurrent schedulers apart"""
+    with db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                UPDATE rss_feeds
+                SET next_poll_at = NOW() + make_interval(secs => %s)
+                WHERE id IN (
+                    SELECT id FROM rss_feeds
+                    WHERE next_poll_at <= NOW()
+                    ORDER BY next_poll_at
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, url, poll_interval_seconds, last_entry_at, poll_error_count,
+                          etag, last_modified, body_hash
+            """, (FEED_POLL_LEASE_SECONDS, limit))
+            feeds = cursor.fetchall()
+        conn.commit()
+        return feeds
+
+def schedule_next_poll(feed_id, interval, error_count=0, latest_entry_at=None, fetch=None, delay=None):
+    """Record a finished poll and schedule the next one.
+
+    `interval` is stored as the feed's polling interval; the next poll is due
+    after `delay` seconds if given (e.g. an error backoff), else after the
+    interval. `fetch` is an optional (status, duration_ms, error) for feed_stats.
+    """
+    with db_connection() as conn:
+        with conn.cursor() as cursor:
+            if fetch:
+                record_fetches(cursor, [(feed_id, *fetch)])
+            cursor.execute("""
+                UPDATE rss_feeds
+                SET poll_interval_seconds = %s,
+                    next_poll_at = NOW() + make_interval(secs => %s),
+                    last_polled_at = NOW(),
+                    poll_error_count = %s,
+                    last_entry_at = GREATEST(last_entry_at, %s)
+                WHERE id = %s
+            """, (interval, jittered_delay(delay or interval), error_count, latest_entry_at, feed_id))
+        conn.commit()
+
+def refresh_feed(feed):
+    """Re-poll a single feed, store its entries and adapt its schedule"""
+    interval = feed['poll_interval_seconds'] or FEED_POLL_DEFAULT_INTERVAL
+    started = time.perf_counter()
     try:
-        session_id = str(uuid.uuid4())
-        s3_key = f"chat-history/anonymous/{session_id}.json"
-        
-        # Initialize empty chat in S3
-        save_chat_to_s3(session_id, [], {"rss_feed_ids": rss_feed_ids or [], "article_ids": article_ids or []})
-        
+        feed_data = parse_rss_feed(feed['url'], feed['etag'], feed['last_modified'], feed['body_hash'])
+    except ParseTimedOut as e:
+        # Not the feed's fault: try again next interval without backing off
+        elapsed_ms = round((time.perf_counter() - started) * 1000)
+        schedule_next_poll(feed['id'], interval, feed['poll_error_count'] or 0,
+                           fetch=('error', elapsed_ms, str(e)[:500]))
+        log_error("feed_refresh", "parse_timed_out")
+        return 0
+    except ValueError as e:
+        # Back off exponentially on failures, but keep the interval itself intact
+        error_count = (feed['poll_error_count'] or 0) + 1
+        elapsed_ms = round((time.perf_counter() - started) * 1000)
+        schedule_next_poll(feed['id'], interval, error_count, fetch=('error', elapsed_ms, str(e)[:500]),
+                           delay=error_backoff_delay(interval, error_count))
+        log_error("feed_refresh", "parse_failed")
+        return 0
+
+    if feed_data is None:
+        # Not modified: skip parsing and article writes, just push the next poll out
+        elapsed_ms = round((time.perf_counter() - started) * 1000)
+        schedule_next_poll(feed['id'], compute_poll_interval(interval, 0), fetch=('not_modified', elapsed_ms, None))
+        return 0
+
+    entry_dates = [d for d in (parse_published_date(e['published']) for e in feed_data['entries']) if d]
+
+    try:
+        # Articles are de-duplicated on insert, so inserted rows are exactly the new entries
+        new_entries = store_rss_feed_and_articles(feed_data, feed['url'])['inserted']
+        schedule_next_poll(
+            feed['id'],
+            compute_poll_interval(interval, new_entries, entry_dates),
+            latest_entry_at=max(entry_dates) if entry_dates else None
+        )
+    except Exception:
+        # The lease on next_poll_at expires on its own, so the feed is retried later
+        log_error("feed_refresh", "store_failed")
+        return 0
+    return new_entries
+
+async def run_feed_scheduler():
+    """Continuously re-poll due feeds with at most FEED_POLL_CONCURRENCY fetches in flight"""
+    in_flight = set()
+    while True:
+        free_slots = FEED_POLL_CONCURRENCY - len(in_flight)
+        feeds = []
+        if free_slots > 0:
+            try:
+                feeds = await asyncio.to_thread(claim_due_feeds, free_slots)
+            except Exception:
+                log_error("feed_scheduler", "claim_failed")
+
+        for feed in feeds:
+            task = asyncio.create_task(asyncio.to_thread(refresh_feed, feed))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight and len(feeds) == free_slots:
+            # More feeds may be due; wait for a slot rather than the full tick
+            await asyncio.wait(in_flight, timeout=FEED_SCHEDULER_TICK, return_when=asyncio.FIRST_COMPLETED)
+        else:
+            await asyncio.sleep(FEED_SCHEDULER_TICK)
+
+# OPML Import
+def parse_opml(body):
+    """Extract unique feed URLs (with titles) from an OPML document"""
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid OPML file: {str(e)}")
+
+    feeds = {}
+    for outline in root.iter('outline'):
+        url = (outline.get('xmlUrl') or '').strip()
+        if url.startswith(('http://', 'https://')) and url not in feeds:
+            feeds[url] = outline.get('title') or outline.get('text') or url
+    return [{'url': url, 'title': title} for url, title in feeds.items()]
+
+async def import_feeds(urls, concurrency=OPML_IMPORT_CONCURRENCY, per_host=OPML_IMPORT_PER_HOST):
+    """Fetch and parse feeds concurrently, yielding progress events as dicts.
+
+    At most `concurrency` fetches run at once and at most `per_host` against
+    any single host. Parsed feeds are written through store_feeds in groups
+    of OPML_WRITE_BATCH_FEEDS.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    host_semaphores = {}
+    pending_writes = []
+    totals = {"total": len(urls), "fetched": 0, "failed": 0, "inserted": 0, "updated": 0}
+
+    async def fetch(executor, url):
+        host = urllib.parse.urlparse(url).netloc.lower()
+        host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(per_host))
+        # Per-host slot first, so feeds queued behind a busy host don't hold global slots
+        async with host_semaphore, semaphore:
+            try:
+                return url, await loop.run_in_executor(executor, parse_rss_feed, url), None
+            except (ValueError, ParseTimedOut) as e:
+                return url, None, str(e)
+
+    async def flush(executor):
+        batch = pending_writes[:]
+        pending_writes.clear()
+        stored = await loop.run_in_executor(executor, store_feeds, batch)
+        totals["inserted"] += stored["inserted"]
+        totals["updated"] += stored["updated"]
+        return {"event": "stored", "feeds": len(batch), "inserted": stored["inserted"],
+                "updated": stored["updated"], "skipped": stored["skipped"]}
+
+    yield {"event": "started", "total": len(urls)}
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    tasks = [asyncio.ensure_future(fetch(executor, url)) for url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            url, feed_data, error = await next_done
+            if error:
+                totals["failed"] += 1
+                yield {"event": "failed", "url": url, "error": error}
+                continue
+
+            totals["fetched"] += 1
+            pending_writes.append((feed_data, url))
+            yield {"event": "fetched", "url": url, "title": feed_data['title'],
+                   "entries": len(feed_data['entries'])}
+            if len(pending_writes) >= OPML_WRITE_BATCH_FEEDS:
+                yield await flush(executor)
+
+        if pending_writes:
+            yield await flush(executor)
+    finally:
+        # Don't block the event loop on fetches still running if the client went away
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    yield {"event": "done", **totals}
+
+# Ingestion Job Queue
+def enqueue_job(kind, payload):
+    """Queue a background ingestion job and return its id"""
+    with db_connection() as conn:
         with conn.cursor() as cursor:
             cursor.execute("""
-                INSERT INTO chat_sessions (id, title, s3_key, rss_feed_ids, article_ids)
-                VALUES (%s, %s, %s, %s, %s)
+                INSERT INTO ingest_jobs (id, kind, payload)
+                VALUES (%s, %s, %s)
                 RETURNING id
-            """, (session_id, title or "New Chat", s3_key, rss_feed_ids or [], article_ids or []))
-            
-            result = cursor.fetchone()
-            conn.commit()
-            return result[0]
-    finally:
-        conn.close()
+            """, (str(uuid.uuid4()), kind, json.dumps(payload)))
+            job_id = str(cursor.fetchone()[0])
+        conn.commit()
+        return job_id
 
-def get_chat_sessions(limit: int = 20):
-    """Get user's chat sessions"""
-    conn = get_db_connection()
-    try:
+def get_job(job_id):
+    """Fetch a job's status row, or None if it doesn't exist"""
+    with db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute("""
-                SELECT id, title, created_at, updated_at, rss_feed_ids, article_ids
-                FROM chat_sessions 
-                ORDER BY updated_at DESC 
-                LIMIT %s
-            """, (limit,))
-            return cursor.fetchall()
-    finally:
-        conn.close()
+                SELECT id, kind, payload, status, result, error, attempts,
+                       created_at, started_at, finished_at
+                FROM ingest_jobs WHERE id = %s
+            """, (job_id,))
+            return cursor.fetchone()
 
-def update_chat_session(session_id: str, messages: List[Dict], title: str = None):
-    """Update chat session with new messages"""
-    conn = get_db_connection()
-    try:
+def claim_job():
+    """Take the oldest queued job (or one whose worker died mid-run) for this worker.
+
+    A stale job that has used up its attempts (it keeps killing its worker)
+    is failed instead of being run again.
+    """
+    with db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            # Get current session
-            cursor.execute("SELECT s3_key, rss_feed_ids, article_ids FROM chat_sessions WHERE id = %s", (session_id,))
-            session = cursor.fetchone()
-            
-            if not session:
-                raise HTTPException(status_code=404, detail="Chat session not found")
-            
-            # Load current context
-            chat_data = load_chat_from_s3(session['s3_key'])
-            context = chat_data.get('context', {})
-            
-            # Save updated messages to S3
-            save_chat_to_s3(session_id, messages, context)
-            
-            # Update database
-            update_fields = ["updated_at = CURRENT_TIMESTAMP"]
-            params = []
-            
-            if title:
-                update_fields.append("title = %s")
-                params.append(title)
-            
-            params.append(session_id)
-            
-            cursor.execute(f"""
-                UPDATE chat_sessions 
-                SET {', '.join(update_fields)}
+            cursor.execute("""
+                UPDATE ingest_jobs
+                SET status = 'failed', finished_at = NOW(),
+                    error = 'Job did not finish after ' || attempts || ' attempts'
+                WHERE status = 'running' AND started_at < NOW() - make_interval(secs => %s)
+                  AND attempts >= %s
+            """, (JOB_TIMEOUT_SECONDS, JOB_MAX_ATTEMPTS))
+            cursor.execute("""
+                UPDATE ingest_jobs
+                SET status = 'running', started_at = NOW(), attempts = attempts + 1
+                WHERE id = (
+                    SELECT id FROM ingest_jobs
+                    WHERE status = 'queued'
+                       OR (status = 'running' AND started_at < NOW() - make_interval(secs => %s)
+                           AND attempts < %s)
+                    ORDER BY created_at
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, kind, payload, attempts
+            """, (JOB_TIMEOUT_SECONDS, JOB_MAX_ATTEMPTS))
+            job = cursor.fetchone()
+        conn.commit()
+        return job
+
+def finish_job(job_id, status, result=None, error=None):
+    """Record a job's outcome"""
+    with db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                UPDATE ingest_jobs
+                SET status = %s, result = %s, error = %s,
+                    finished_at = CASE WHEN %s = 'queued' THEN NULL ELSE NOW() END
                 WHERE id = %s
-            """, params)
-            
-            conn.commit()
-            return session_id
-    finally:
-        conn.close()
-    """Get RSS context using Option 3: Recent articles + keyword search"""
-    
-    conn = get_db_connection()
-    if not conn:
-        return ""
-    
+            """, (status, json.dumps(result) if result is not None else None, error, status, job_id))
+        conn.commit()
+
+def run_add_rss_job(payload):
+    """Fetch, parse and store one feed for an add_rss job"""
+    feed_data = parse_rss_feed(payload['url'])
+    stored = store_rss_feed_and_articles(feed_data, payload['url'])
+    return {
+        "rss_uuid": stored['feed_id'],
+        "feed_title": feed_data['title'],
+        "entries_count": len(feed_data['entries']),
+        "inserted_count": stored['inserted'],
+        "updated_count": stored['updated'],
+        "skipped_count": stored['skipped']
+    }
+
+JOB_HANDLERS = {
+    "add_rss": run_add_rss_job,
+}
+
+def execute_job(job):
+    """Run a claimed job; bad input fails it, anything else is retried up to JOB_MAX_ATTEMPTS"""
+    try:
+        result = JOB_HANDLERS[job['kind']](job['payload'])
+        finish_job(job['id'], 'succeeded', result=result)
+    except ValueError as e:
+        finish_job(job['id'], 'failed', error=str(e))
+    except Exception:
+        log_error("ingest_job", "execution_failed", safe_details=job['kind'])
+        retry = job['attempts'] < JOB_MAX_ATTEMPTS
+        finish_job(job['id'], 'queued' if retry else 'failed', error="Job failed")
+
+async def run_job_worker():
+    """Claim and run ingestion jobs off the event loop until cancelled"""
+    while True:
+        try:
+            job = await asyncio.to_thread(claim_job)
+        except Exception:
+            log_error("ingest_job", "claim_failed")
+            job = None
+
+        if job:
+            await asyncio.to_thread(execute_job, job)
+        else:
+            await asyncio.sleep(JOB_POLL_INTERVAL)
+
+# Full-Article Content Extraction
+def claim_articles_for_extraction(limit):
+    """Lease the newest articles still missing content; stale leases are picked up again"""
+    with db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                UPDATE rss_articles
+                SET content_status = 'extracting', content_extracted_at = NOW(),
+                    content_attempts = content_attempts + 1
+                WHERE id IN (
+                    SELECT id FROM rss_articles
+                    WHERE content_status IS NULL
+                       OR (content_status = 'extracting' AND content_extracted_at < NOW() - INTERVAL '15 minutes'
+                           AND content_attempts < %s)
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, url, content_attempts
+            """, (EXTRACTION_MAX_ATTEMPTS, limit))
+            articles = cursor.fetchall()
+        conn.commit()
+        return articles
+
+def fetch_article_html(url):
+    """Download an article page, capped at EXTRACTION_MAX_BYTES"""
+    response = fetcher.fetch(url, timeout=EXTRACTION_TIMEOUT, max_bytes=EXTRACTION_MAX_BYTES, truncate=True)
+    if response.status >= 400 or 'html' not in response.content_type:
+        return None
+    return response.body
+
+def extract_article_content(article):
+    """Fetch one article and extract its main text in the extraction process pool.
+
+    Returns (article_id, content, status). A timeout leaves the article
+    leased ('extracting'), so it is retried once the lease goes stale, until
+    its EXTRACTION_MAX_ATTEMPTS-th attempt, which marks it failed.
+    """
+    if not article['url']:
+        return article['id'], '', 'skipped'
     try:
+        html = fetch_article_html(article['url'])
+        if html is None:
+            return article['id'], '', 'skipped'
+        content = run_in_process_pool(
+            get_extraction_pool(), EXTRACTION_TIMEOUT,
+            parsing.extract_main_text, html, EXTRACTION_MAX_CHARS, EXTRACTION_TIMEOUT
+        )
+        return article['id'], content, 'extracted' if content else 'failed'
+    except ParseTimedOut:
+        if article['content_attempts'] >= EXTRACTION_MAX_ATTEMPTS:
+            return article['id'], '', 'failed'
+        return article['id'], '', 'extracting'
+    except Exception:
+        return article['id'], '', 'failed'
+
+def save_extracted_content(results):
+    """Write extraction results back; feed-provided content is never overwritten"""
+    with db_connection() as conn:
+        with conn.cursor() as cursor:
+            execute_values(cursor, """
+                UPDATE rss_articles AS a
+                SET content = CASE WHEN v.content <> '' THEN v.content ELSE a.content END,
+                    token_estimate = CASE WHEN v.content <> ''
+                        THEN (length(a.title) + length(COALESCE(a.summary_text, '')) + length(v.content) + 3) / 4
+                        ELSE a.token_estimate END,
+                    content_status = v.status,
+                    content_extracted_at = NOW()
+                FROM (VALUES %s) AS v (id, content, status)
+                WHERE a.id = v.id::uuid AND a.content_status = 'extracting'
+            """, [(str(article_id), content, status) for article_id, content, status in results])
+        conn.commit()
+    invalidate_articles(article_id for article_id, _, _ in results)
+
+def extract_pending_content(fetch_executor):
+    """Run one extraction batch; returns the number of articles processed"""
+    articles = claim_articles_for_extraction(EXTRACTION_BATCH_SIZE)
+    if not articles:
+        return 0
+    results = list(fetch_executor.map(extract_article_content, articles))
+    save_extracted_content(results)
+    extracted = sum(1 for _, _, status in results if status == 'extracted')
+    logging.info(f"Content extraction batch: {extracted}/{len(results)} articles extracted")
+    return len(results)
+
+async def run_content_extractor():
+    """Backfill article content newest-first, off the event loop and the add-feed path"""
+    fetch_executor = ThreadPoolExecutor(
+        max_workers=EXTRACTION_FETCH_CONCURRENCY, thread_name_prefix="article-fetch"
+    )
+    try:
+        while True:
+            try:
+                processed = await asyncio.to_thread(extract_pending_content, fetch_executor)
+            except Exception:
+                log_error("content_extraction", "batch_failed")
+                processed = 0
+            if not processed:
+                await asyncio.sleep(EXTRACTION_IDLE_SECONDS)
+    finally:
+        fetch_executor.shutdown(wait=False, cancel_futures=True)
+
+# Article Embeddings
+# One vector per article in article_embeddings, mirrored into vector_index on
+# every instance. Instances share the embedding work through short leases and
+# pick up each other's vectors by polling embedded_at.
+vector_index = embeddings.VectorIndex(EMBEDDING_DIM)
+
+# Catches up on embeddings committed slightly out of embedded_at order
+EMBEDDING_SYNC_OVERLAP = timedelta(minutes=2)
+vector_index_synced = {"embedded_at": None}
+
+def claim_articles_for_embedding(limit):
+    """Lease the newest articles whose text hasn't been embedded; stale leases are picked up again"""
+    with db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            # Get recent articles (last 48 hours)
             cursor.execute("""
-                SELECT a.title, a.summary, a.content, f.title as feed_title
-                FROM rss_articles a
-                JOIN rss_feeds f ON a.feed_id = f.id
-                WHERE a.created_at >= NOW() - INTERVAL '48 hours'
-                ORDER BY a.created_at DESC
-                LIMIT 15
+                UPDATE rss_articles
+                SET embedding_claimed_at = NOW(), embedding_attempts = embedding_attempts + 1
+                WHERE id IN (
+                    SELECT id FROM rss_articles
+                    WHERE embedded_at IS NULL
+                      AND embedding_attempts < %s
+                      AND (embedding_claimed_at IS NULL OR embedding_claimed_at < NOW() - INTERVAL '15 minutes')
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, created_at, embedding_claimed_at, title, summary_text, left(content, 2000) AS content
+            """, (EMBEDDING_MAX_ATTEMPTS, limit))
+            articles = cursor.fetchall()
+        conn.commit()
+        return articles
+
+def embed_pending_articles(limit=EMBEDDING_BATCH_SIZE):
+    """Embed a batch of leased articles; returns how many were embedded.
+
+    The embedder runs outside any transaction, one article at a time, so a
+    failing article only costs itself an attempt. Results are written only
+    for articles still holding their lease, i.e. whose text didn't change
+    while they were being embedded.
+    """
+    articles = claim_articles_for_embedding(limit)
+    if not articles:
+        return 0
+
+    done = []
+    for article in articles:
+        try:
+            vector = embedder.embed(
+                embeddings.embedding_text(article['title'], article['summary_text'], article['content'])
+            )
+        except Exception:
+            log_error("embedding_indexer", "embed_failed", safe_details=str(article['id']))
+            continue
+        done.append((article, vector))
+    if not done:
+        return 0
+
+    vectors = {str(article['id']): vector for article, vector in done}
+    with db_connection() as conn:
+        with conn.cursor() as cursor:
+            written = execute_values(cursor, """
+                UPDATE rss_articles AS a SET embedded_at = NOW(), embedding_claimed_at = NULL
+                FROM (VALUES %s) AS v (id, created_at, claimed_at)
+                WHERE a.id = v.id::uuid AND a.created_at = v.created_at::timestamptz
+                  AND a.embedding_claimed_at = v.claimed_at::timestamptz
+                RETURNING a.id, a.created_at
+            """, [
+                (str(article['id']), article['created_at'], article['embedding_claimed_at']) for article, _ in done
+            ], fetch=True)
+            if written:
+                execute_values(cursor, """
+                    INSERT INTO article_embeddings (article_id, article_created_at, model, embedding)
+                    VALUES %s
+                    ON CONFLICT (article_id) DO UPDATE SET
+                        model = EXCLUDED.model,
+                        embedding = EXCLUDED.embedding,
+                        embedded_at = NOW()
+                """, [
+                    (str(article_id), created_at, embedder.name,
+                     psycopg2.Binary(embeddings.to_bytes(vectors[str(article_id)])))
+                    for article_id, created_at in written
+                ])
+        conn.commit()
+
+    vector_index.add(
+        [str(article_id) for article_id, _ in written],
+        [vectors[str(article_id)] for article_id, _ in written],
+        [created_at.timestamp() for _, created_at in written]
+    )
+    return len(written)
+
+def sync_vector_index():
+    """Load the current model's embeddings written since the last sync (all of them at first)"""
+    since = vector_index_synced["embedded_at"]
+    since = since - EMBEDDING_SYNC_OVERLAP if since else datetime.min.replace(tzinfo=timezone.utc)
+    last_id = uuid.UUID(int=0)
+    loaded = 0
+    while True:
+        with db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT article_id, article_created_at, embedding, embedded_at
+                    FROM article_embeddings
+                    WHERE model = %s AND (embedded_at, article_id) > (%s, %s::uuid)
+                    ORDER BY embedded_at, article_id
+                    LIMIT %s
+                """, (embedder.name, since, str(last_id), EMBEDDING_LOAD_PAGE))
+                rows = cursor.fetchall()
+            conn.commit()
+        if not rows:
+            break
+        vector_index.add(
+            [str(row[0]) for row in rows],
+            [embeddings.from_bytes(row[2]) for row in rows],
+            [row[1].timestamp() for row in rows]
+        )
+        loaded += len(rows)
+        since, last_id = rows[-1][3], rows[-1][0]
+        vector_index_synced["embedded_at"] = since
+        if len(rows) < EMBEDDING_LOAD_PAGE:
+            break
+    return loaded
+
+async def run_embedding_indexer(sync=True):
+    """Embed new and changed articles and, with sync, keep vector_index in step
+    with other instances"""
+    while True:
+        embedded = 0
+        try:
+            if sync:
+                await asyncio.to_thread(sync_vector_index)
+            embedded = await asyncio.to_thread(embed_pending_articles)
+        except Exception:
+            log_error("embedding_indexer", "batch_failed")
+        if not embedded:
+            await asyncio.sleep(EMBEDDING_IDLE_SECONDS)
+
+def reset_article_embeddings():
+    """Mark every article for re-embedding, e.g. after changing the embedding model"""
+    with db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                UPDATE rss_articles SET embedded_at = NULL, embedding_claimed_at = NULL, embedding_attempts = 0
+                WHERE embedded_at IS NOT NULL OR embedding_attempts > 0
             """)
-            recent_articles = cursor.fetchall()
-            
-            # Get keyword-matched older articles if user query provided
-            older_articles = []
-            if user_query.strip():
+            reset = cursor.rowcount
+        conn.commit()
+    return reset
+
+def semantic_article_ids(query, k, before=None, candidates=None):
+    """Ids of the k articles closest in meaning to query, best first.
+
+    Optionally limited to articles created before a datetime or to candidate
+    ids, and blended with ts_rank by EMBEDDING_TS_RANK_WEIGHT. Returns None
+    when semantic retrieval isn't available, so callers can fall back.
+    """
+    if embedder is None or not len(vector_index) or not query.strip():
+        return None
+    hits = vector_index.search(
+        embedder.embed(query),
+        k * 4 if EMBEDDING_TS_RANK_WEIGHT > 0 else k,
+        before=before.timestamp() if before else None,
+        candidates=candidates
+    )
+    if EMBEDDING_TS_RANK_WEIGHT > 0 and hits:
+        with db_connection() as conn:
+            with conn.cursor() as cursor:
+                # Normalization 32 maps rank into [0, 1) like the cosine scores
                 cursor.execute("""
-                    SELECT a.title, a.summary, a.content, f.title as feed_title
-                    FROM rss_articles a
-                    JOIN rss_feeds f ON a.feed_id = f.id
-                    WHERE a.created_at < NOW() - INTERVAL '48 hours'
-                    AND a.search_vector @@ plainto_tsquery('english', %s)
-                    ORDER BY ts_rank(a.search_vector, plainto_tsquery('english', %s)) DESC
-                    LIMIT 15
-                """, (user_query, user_query))
-                older_articles = cursor.fetchall()
-            
-            # Build context
-            context = "RSS Feed Articles:\n\n"
-            
-            if recent_articles:
-                context += "=== RECENT ARTICLES (Last 48 hours) ===\n"
-                for article in recent_articles:
-                    context += f"Feed: {article['feed_title']}\n"
-                    context += f"Title: {article['title']}\n"
-                    context += f"Summary: {article['summary'][:300]}...\n\n"
-            
-            if older_articles:
-                context += "=== RELEVANT OLDER ARTICLES ===\n"
-                for article in older_articles:
-                    context += f"Feed: {article['feed_title']}\n"
-                    context += f"Title: {article['title']}\n"
-                    context += f"Summary: {article['summary'][:300]}...\n\n"
-            
-            return context[:8000]  # Limit context size
-    finally:
-        conn.close()
+                    SELECT a.id, ts_rank(a.search_vector, query, 32)
+                    FROM rss_articles a, websearch_to_tsquery('english', %s) AS query
+                    WHERE a.id = ANY(%s::uuid[])
+                """, (query, [article_id for article_id, _ in hits]))
+                text_ranks = {str(article_id): rank for article_id, rank in cursor.fetchall()}
+        weight = EMBEDDING_TS_RANK_WEIGHT
+        hits = sorted(
+            ((article_id, (1 - weight) * score + weight * text_ranks.get(article_id, 0.0))
+             for article_id, score in hits),
+            key=lambda hit: hit[1], reverse=True
+        )
+    return [article_id for article_id, _ in hits[:k]]
+
+# Article Partition Maintenance
+PARTITION_NAME_RE = re.compile(r'^rss_articles_p(\d{4})(\d{2})$')
+
+# Arbitrary key for the advisory lock that keeps maintenance to one instance
+PARTITION_MAINTENANCE_LOCK = 7301401
+
+# Every stored column; the generated search_vector is rebuilt on restore and
+# embedded_at is left out so restored articles are embedded again
+ARCHIVE_COLUMNS = [
+    'id', 'feed_id', 'title', 'content', 'summary', 'url', 'published_date', 'author', 'metadata',
+    'created_at', 'dedup_key', 'content_hash', 'content_status', 'content_extracted_at',
+    'summary_text', 'snippet', 'token_estimate'
+]
+
+def partition_bounds(name):
+    """UTC [start, end) of a monthly rss_articles partition, from its name"""
+    match = PARTITION_NAME_RE.match(name)
+    if not match:
+        raise ValueError(f"Not a monthly rss_articles partition: {name}")
+    start = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start, end
+
+def archive_key(name):
+    return f"{ARTICLE_ARCHIVE_PREFIX}{name}.csv.gz"
+
+def ensure_article_partitions(conn, months_ahead=ARTICLE_PARTITION_MONTHS_AHEAD):
+    """Create monthly partitions through months_ahead; returns how many were created"""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT ensure_rss_articles_partitions((now() AT TIME ZONE 'UTC')::date, %s)",
+            (months_ahead,)
+        )
+        created = cursor.fetchone()[0]
+    conn.commit()
+    return created
+
+def expired_partitions(conn, retention_months):
+    """Attached monthly partitions that end before the retention window"""
+    cutoff = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    for _ in range(retention_months):
+        cutoff = (cutoff - timedelta(days=1)).replace(day=1)
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'rss_articles'::regclass
+            ORDER BY c.relname
+        """)
+        names = [name for (name,) in cursor.fetchall() if PARTITION_NAME_RE.match(name)]
+    conn.commit()
+    return [name for name in names if partition_bounds(name)[1] <= cutoff]
+
+def archive_partition(conn, name, drop=ARTICLE_ARCHIVE_DROP):
+    """Export a monthly partition gzipped to S3, then detach it.
+
+    The export reads the still-attached partition from one read-only
+    REPEATABLE READ snapshot and the upload runs outside any transaction, so
+    writers are never blocked while data moves. Only then is the partition
+    locked, checked for rows changed since the snapshot (the next run retries
+    if any were), and detached, all in one short transaction. A failed upload
+    leaves the month in place. The partition is dropped afterwards unless
+    drop is False, in which case it stays as a detached table that
+    reattach_partition can put back without touching S3. Returns the S3 key.
+    """
     if not s3_client:
-        return {"status": "skipped", "reason": "s3_unavailable"}
-    
-    try:
-        return operation(**kwargs)
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        if error_code == 'NoSuchBucket':
-            raise HTTPException(status_code=404, detail="S3 bucket not found")
-        elif error_code == 'NoSuchKey':
-            raise HTTPException(status_code=404, detail="Resource not found in S3")
+        raise RuntimeError("S3 client unavailable; refusing to archive")
+    start, end = partition_bounds(name)
+    table = sql.Identifier(name)
+    with tempfile.TemporaryFile() as spool:
+        with conn.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+            cursor.execute(
+                sql.SQL("SELECT count(*), txid_snapshot_xmin(txid_current_snapshot()) FROM {}").format(table)
+            )
+            exported, snapshot_xmin = cursor.fetchone()
+            with gzip.GzipFile(fileobj=spool, mode='wb') as compressed:
+                cursor.copy_expert(
+                    sql.SQL("COPY {} ({}) TO STDOUT WITH (FORMAT csv, HEADER)").format(
+                        table, sql.SQL(', ').join(map(sql.Identifier, ARCHIVE_COLUMNS))
+                    ),
+                    compressed
+                )
+        conn.commit()
+        spool.seek(0)
+        s3_client.upload_fileobj(spool, S3_BUCKET_NAME, archive_key(name))
+
+    with conn.cursor() as cursor:
+        cursor.execute(sql.SQL("LOCK TABLE {} IN SHARE MODE").format(table))
+        # Rows written by transactions the snapshot couldn't see are newer
+        # than its xmin; age() keeps the comparison safe across xid wraparound
+        cursor.execute(sql.SQL("""
+            SELECT count(*), count(*) FILTER (WHERE age(xmin) <= age((%s %% 4294967296)::text::xid))
+            FROM {}
+        """).format(table), (snapshot_xmin,))
+        current, changed = cursor.fetchone()
+        if current != exported or changed:
+            conn.rollback()
+            raise RuntimeError(f"Partition {name} changed during export; leaving it for the next run")
+
+        cursor.execute(sql.SQL("ALTER TABLE rss_articles DETACH PARTITION {}").format(table))
+        cursor.execute(
+            "DELETE FROM rss_article_keys WHERE created_at >= %s AND created_at < %s", (start, end)
+        )
+        cursor.execute(
+            "DELETE FROM article_embeddings WHERE article_created_at >= %s AND article_created_at < %s "
+            "RETURNING article_id",
+            (start, end)
+        )
+        removed = [str(row[0]) for row in cursor.fetchall()]
+        cursor.execute(sql.SQL("""
+            UPDATE feed_stats AS s
+            SET article_count = GREATEST(s.article_count - c.archived, 0)
+            FROM (SELECT feed_id, count(*) AS archived FROM {} GROUP BY feed_id) AS c
+            WHERE s.feed_id = c.feed_id
+        """).format(table))
+        if drop:
+            cursor.execute(sql.SQL("DROP TABLE {}").format(table))
+    conn.commit()
+    vector_index.remove(removed)
+    article_cache.clear()
+    logging.info(f"Archived partition {name} to s3://{S3_BUCKET_NAME}/{archive_key(name)}")
+    return archive_key(name)
+
+def reattach_partition(conn, name):
+    """Put an archived partition back, restoring it from S3 if it was dropped"""
+    start, end = partition_bounds(name)
+    table = sql.Identifier(name)
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", (name,))
+        if cursor.fetchone()[0]:
+            cursor.execute(
+                sql.SQL("ALTER TABLE rss_articles ATTACH PARTITION {} FOR VALUES FROM (%s) TO (%s)").format(table),
+                (start, end)
+            )
         else:
-            raise HTTPException(status_code=500, detail="S3 operation failed")
+            if not s3_client:
+                raise RuntimeError("S3 client unavailable; cannot restore archive")
+            cursor.execute(
+                sql.SQL("CREATE TABLE {} PARTITION OF rss_articles FOR VALUES FROM (%s) TO (%s)").format(table),
+                (start, end)
+            )
+            with tempfile.TemporaryFile() as spool:
+                s3_client.download_fileobj(S3_BUCKET_NAME, archive_key(name), spool)
+                spool.seek(0)
+                with gzip.GzipFile(fileobj=spool, mode='rb') as compressed:
+                    # Older archives predate some columns; load whatever the header lists
+                    columns = next(csv.reader([compressed.readline().decode('utf-8')]))
+                    unknown = set(columns) - set(ARCHIVE_COLUMNS)
+                    if unknown:
+                        raise RuntimeError(f"Archive {name} has unexpected columns: {sorted(unknown)}")
+                    cursor.copy_expert(
+                        sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+                            table, sql.SQL(', ').join(map(sql.Identifier, columns))
+                        ),
+                        compressed
+                    )
+
+        cursor.execute(sql.SQL("""
+            INSERT INTO rss_article_keys (feed_id, dedup_key, article_id, created_at, content_hash)
+            SELECT feed_id, dedup_key, id, created_at, content_hash FROM {}
+            WHERE feed_id IS NOT NULL
+            ON CONFLICT (feed_id, dedup_key) DO NOTHING
+        """).format(table))
+        cursor.execute(sql.SQL("""
+            UPDATE feed_stats AS s
+            SET article_count = s.article_count + c.restored
+            FROM (SELECT feed_id, count(*) AS restored FROM {} GROUP BY feed_id) AS c
+            WHERE s.feed_id = c.feed_id
+        """).format(table))
+    conn.commit()
+    logging.info(f"Re-attached partition {name}")
+
+def prune_feed_stats(conn):
+    """Drop hourly buckets older than the 7-day window (plus a day of slack)"""
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM feed_stats_hourly WHERE hour < NOW() - INTERVAL '8 days'")
+    conn.commit()
+
+def prune_bedrock_cache(conn):
+    """Drop expired entries from the shared Bedrock response cache"""
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM bedrock_response_cache WHERE expires_at < NOW()")
+    conn.commit()
+
+def maintain_article_partitions():
+    """Create upcoming partitions, archive expired ones and prune hourly feed
+    stats and expired shared Bedrock responses; returns archived S3 keys.
+
+    Runs under a session advisory lock so only one instance does maintenance.
+    """
+    archived = []
+    with db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", (PARTITION_MAINTENANCE_LOCK,))
+            locked = cursor.fetchone()[0]
+        conn.commit()
+        if not locked:
+            return archived
+        try:
+            created = ensure_article_partitions(conn)
+            if created:
+                logging.info(f"Created {created} rss_articles partitions")
+            if ARTICLE_RETENTION_MONTHS > 0:
+                for name in expired_partitions(conn, ARTICLE_RETENTION_MONTHS):
+                    archived.append(archive_partition(conn, name))
+            prune_feed_stats(conn)
+            if BEDROCK_CACHE_SHARED:
+                prune_bedrock_cache(conn)
+        finally:
+            conn.rollback()
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", (PARTITION_MAINTENANCE_LOCK,))
+            conn.commit()
+    return archived
 
-# RSS Helper Functions
-def discover_rss_feeds(url):
-    """Automatically discover RSS feeds from a website."""
-    feeds = []
-    try:
-        req = UrlRequest(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urlopen(req, timeout=15) as response:  # Increased timeout slightly
-            content = response.read().decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(content, 'html.parser')
-            
-        # Look for RSS/Atom links
-        for link in soup.find_all('link', type=['application/rss+xml', 'application/atom+xml']):
-            feed_url = urllib.parse.urljoin(url, link.get('href', ''))
-            feeds.append({'url': feed_url, 'title': link.get('title', 'RSS Feed')})
-            
-        # Common RSS paths (reduced for speed)
-        if not feeds:  # Only try common paths if no feeds found
-            common_paths = ['/rss', '/feed', '/rss.xml']  # Reduced list
-            for path in common_paths:
-                test_url = urllib.parse.urljoin(url, path)
-                try:
-                    req = UrlRequest(test_url, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urlopen(req, timeout=5) as test_response:
-                        if test_response.status == 200:
-                            feeds.append({'url': test_url, 'title': f'RSS Feed ({path})'})
-                            break  # Stop after finding first working feed
-                except:
-                    continue
-                
-    except Exception as e:
-        logging.error(f"RSS discovery error: {str(e)}")
-        
-    return feeds[:5]  # Limit to 5 feeds max
+async def run_partition_maintenance():
+    """Keep future partitions in place and archive old ones, once per interval"""
+    while True:
+        try:
+            await asyncio.to_thread(maintain_article_partitions)
+        except Exception:
+            log_error("partition_maintenance", "run_failed")
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL)
 
-def parse_rss_feed(url):
-    """Parse RSS feed and return structured data."""
-    try:
-        feed = feedparser.parse(url)
-        if feed.bozo and not feed.entries:
-            raise ValueError("Invalid RSS feed")
-            
-        feed_data = {
-            'title': feed.feed.get('title', 'Unknown Feed'),
-            'description': feed.feed.get('description', ''),
-            'link': feed.feed.get('link', ''),
-            'entries': []
+# Bedrock Response Cache
+class BedrockResponseCache:
+    """Completed model responses keyed by a fingerprint of the whole request.
+
+    The key covers the model id, inference config, system prompt (which
+    embeds the article context) and message window, so a changed article
+    or a new one in the recent window changes the key rather than
+    needing explicit invalidation. Lookups try the in-process LRU, then the
+    shared bedrock_response_cache table when BEDROCK_CACHE_SHARED is set;
+    shared-tier failures count as misses.
+    """
+
+    def __init__(self, maxsize, ttl, shared=False):
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        self.shared = shared
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.stores = 0
+
+    @staticmethod
+    def key(request):
+        payload = json.dumps(request, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        response = self.memory.get(key)
+        if response is not None or not self.shared:
+            return response
+        try:
+            with db_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT response FROM bedrock_response_cache WHERE cache_key = %s AND expires_at > NOW()",
+                        (key,)
+                    )
+                    row = cursor.fetchone()
+                conn.commit()
+        except Exception:
+            log_error("bedrock_cache", "shared_get_failed")
+            row = None
+        if row is None:
+            self.shared_misses += 1
+            return None
+        self.shared_hits += 1
+        self.memory.set(key, row[0])
+        return row[0]
+
+    def set(self, key, request, response):
+        self.memory.set(key, response)
+        self.stores += 1
+        if not self.shared:
+            return
+        try:
+            with db_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        INSERT INTO bedrock_response_cache (cache_key, model_id, response, expires_at)
+                        VALUES (%s, %s, %s, NOW() + make_interval(secs => %s))
+                        ON CONFLICT (cache_key) DO UPDATE SET
+                            response = EXCLUDED.response,
+                            created_at = NOW(),
+                            expires_at = EXCLUDED.expires_at
+                    """, (key, request.get('modelId'), response, self.ttl))
+                conn.commit()
+        except Exception:
+            log_error("bedrock_cache", "shared_set_failed")
+
+    def stats(self):
+        return {
+            **self.memory.stats(),
+            "shared": self.shared,
+            "shared_hits": self.shared_hits,
+            "shared_misses": self.shared_misses,
+            "stores": self.stores,
         }
-        
-        for entry in feed.entries[:20]:  # Limit to 20 entries
-            feed_data['entries'].append({
-                'title': entry.get('title', 'No Title'),
-                'link': entry.get('link', ''),
-                'summary': entry.get('summary', entry.get('description', '')),
-                'published': entry.get('published', ''),
-                'author': entry.get('author', '')
-            })
-            
-        return feed_data
-    except Exception as e:
-        logging.error(f"RSS parsing error: {str(e)}")
-        raise ValueError(f"Failed to parse RSS feed: {str(e)}")
+
+bedrock_cache = BedrockResponseCache(BEDROCK_CACHE_SIZE, BEDROCK_CACHE_TTL, shared=BEDROCK_CACHE_SHARED)
 
 # Bedrock Nova Lite helper function
+def build_nova_request(messages, system_prompt=None):
+    """Keyword arguments for a Nova Lite converse/converse_stream call"""
+    # Improved system prompt for news articles
+    if not system_prompt:
+        system_prompt = (
+            "You are a helpful AI assistant. Provide direct, concise answers. "
+            "Do not repeat the user's question. Do not start with phrases like "
+            "'Based on your question' or 'You asked about'. "
+            "Answer directly and briefly in 1-2 sentences maximum."
+        )
+    
+    # Prepare messages for Nova Lite - limit context to prevent loops
+    conversation = []
+    if system_prompt:
+        conversation.append({
+            "role": "user",
+            "content": [{"text": system_prompt}]
+        })
+        conversation.append({
+            "role": "assistant", 
+            "content": [{"text": "Understood. I'll provide direct, concise answers."}]
+        })
+    
+    # Only use the last 3 messages to prevent context overflow
+    recent_messages = messages[-3:] if len(messages) > 3 else messages
+    for msg in recent_messages:
+        # Handle both dict and object formats
+        role = msg.role if hasattr(msg, 'role') else msg['role']
+        content = msg.content if hasattr(msg, 'content') else msg['content']
+        conversation.append({
+            "role": role,
+            "content": [{"text": content}]
+        })
+    
+    return {
+        "modelId": os.environ.get("BEDROCK_MODEL_ID"),
+        "messages": conversation,
+        "inferenceConfig": {
+            "maxTokens": 500,  # Increased for complete responses
+            "temperature": 0.3,
+            "topP": 0.8,
+            "stopSequences": ["Human:", "User:"]
+        }
+    }
+
 def call_bedrock_nova(messages, system_prompt=None):
     """Call AWS Bedrock Nova Lite model with improved settings."""
     if not bedrock_client:
         return os.environ.get("BEDROCK_MOCK_RESPONSE")
     
     try:
-        # Improved system prompt for news articles
-        if not system_prompt:
-            system_prompt = (
-                "You are a helpful AI assistant. Provide direct, concise answers. "
-                "Do not repeat the user's question. Do not start with phrases like "
-                "'Based on your question' or 'You asked about'. "
-                "Answer directly and briefly in 1-2 sentences maximum."
-            )
-        
-        # Prepare messages for Nova Lite - limit context to prevent loops
-        conversation = []
-        if system_prompt:
-            conversation.append({
-                "role": "user",
-                "content": [{"text": system_prompt}]
-            })
-            conversation.append({
-                "role": "assistant", 
-                "content": [{"text": "Understood. I'll provide direct, concise answers."}]
-            })
+        request = build_nova_request(messages, system_prompt)
+        if BEDROCK_CACHE_ENABLED:
+            cache_key = bedrock_cache.key(request)
+            cached = bedrock_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        # Only use the last 3 messages to prevent context overflow
-        recent_messages = messages[-3:] if len(messages) > 3 else messages
-        for msg in recent_messages:
-            # Handle both dict and object formats
-            role = msg.role if hasattr(msg, 'role') else msg['role']
-            content = msg.content if hasattr(msg, 'content') else msg['content']
-            conversation.append({
-                "role": role,
-                "content": [{"text": content}]
-            })
-        
-        response = bedrock_client.converse(
-            modelId=os.environ.get("BEDROCK_MODEL_ID"),
-            messages=conversation,
-            inferenceConfig={
-                "maxTokens": 500,  # Increased for complete responses
-                "temperature": 0.3,
-                "topP": 0.8,
-                "stopSequences": ["Human:", "User:"]
-            }
-        )
+        response = bedrock_client.converse(**request)
         
-        response_text = response['output']['message']['content'][0]['text']
-        return response_text.strip()
+        response_text = response['output']['message']['content'][0]['text'].strip()
+        if BEDROCK_CACHE_ENABLED and response_text:
+            bedrock_cache.set(cache_key, request, response_text)
+        return response_text
         
     except Exception as e:
         logging.error(f"Bedrock error: {str(e)}")
         raise HTTPException(status_code=500, detail="AI service unavailable")
 
+def stream_bedrock_nova(messages, system_prompt=None):
+    """Yield Nova Lite text deltas as converse_stream produces them (blocking)"""
+    if not bedrock_client:
+        mock = os.environ.get("BEDROCK_MOCK_RESPONSE")
+        if mock:
+            yield mock
+        return
+    
+    request = build_nova_request(messages, system_prompt)
+    if BEDROCK_CACHE_ENABLED:
+        cache_key = bedrock_cache.key(request)
+        cached = bedrock_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+    
+    stream = bedrock_client.converse_stream(**request)['stream']
+    parts = []
+    try:
+        for event in stream:
+            delta = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+            if delta:
+                parts.append(delta)
+                yield delta
+    finally:
+        # Releases the HTTP connection when the consumer stops early
+        stream.close()
+    
+    # Only responses streamed to the end are cached
+    response_text = ''.join(parts).strip()
+    if BEDROCK_CACHE_ENABLED and response_text:
+        bedrock_cache.set(cache_key, request, response_text)
+
+chat_stream_executor = ThreadPoolExecutor(max_workers=CHAT_STREAM_WORKERS, thread_name_prefix="chat-stream")
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def stream_chat_response(messages, system_prompt=None, on_complete=None):
+    """Relay a Bedrock stream to the client as Server-Sent Events.
+
+    Emits "delta" events with text fragments, then one "done" event with the
+    full response, or an "error" event. The Bedrock stream is read on a worker
+    thread; a client disconnect cancels it at the next delta. on_complete(text,
+    cancelled) runs on that thread once the stream has ended, whether or not
+    the client is still connected.
+    """
+    cancelled = threading.Event()
+
+    def relay(loop, queue):
+        parts = []
+        try:
+            with closing(stream_bedrock_nova(messages, system_prompt)) as deltas:
+                for delta in deltas:
+                    if cancelled.is_set():
+                        break
+                    parts.append(delta)
+                    loop.call_soon_threadsafe(queue.put_nowait, ("delta", delta))
+        except Exception as e:
+            logging.error(f"Bedrock stream error: {str(e)}")
+            loop.call_soon_threadsafe(queue.put_nowait, ("error", None))
+            return
+        text = ''.join(parts).strip()
+        if on_complete:
+            try:
+                on_complete(text, cancelled.is_set())
+            except Exception:
+                log_error("chat_stream", "persist_failed")
+        loop.call_soon_threadsafe(queue.put_nowait, ("done", text))
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        loop.run_in_executor(chat_stream_executor, relay, loop, queue)
+        try:
+            while True:
+                kind, data = await queue.get()
+                if kind == "delta":
+                    yield sse_event("delta", {"text": data})
+                elif kind == "error":
+                    yield sse_event("error", {"error": "AI service unavailable"})
+                    break
+                else:
+                    yield sse_event("done", {"response": data})
+                    break
+        finally:
+            # Client went away (or we're done): stop reading from Bedrock
+            cancelled.set()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # API Endpoints
 @app.post("/chat/", response_model=None)
-async def chat(request: Request, chat_req: ChatRequest):
+def chat(request: Request, chat_req: ChatRequest):
     try:
         # Return JSON payload for consistency with other endpoints
         response_text = call_bedrock_nova(chat_req.messages)
@@ -631,35 +2867,31 @@ async def chat(request: Request, chat_req: ChatRequest):
 
 @app.post("/save_chat/")
 @limiter.limit("10/minute")
-async def save_chat(request: Request, save_req: SaveChatRequest):
+def save_chat(request: Request, save_req: SaveChatRequest):
     try:
-        conn = get_db_connection()
-        if not conn:
-            return {"message": "Database unavailable"}
-            
-        with conn.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO chats (id, messages, chat_name, rss_uuid, rss_title, rss_url, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO UPDATE SET
-                    messages = EXCLUDED.messages,
-                    chat_name = EXCLUDED.chat_name,
-                    rss_uuid = EXCLUDED.rss_uuid,
-                    rss_title = EXCLUDED.rss_title,
-                    rss_url = EXCLUDED.rss_url,
-                    updated_at = EXCLUDED.updated_at
-            """, (
-                save_req.chat_id,
-                json.dumps([msg.dict() for msg in save_req.messages]),
-                save_req.chat_name,
-                save_req.rss_uuid,
-                save_req.rss_title,
-                save_req.rss_url,
-                datetime.now(),
-                datetime.now()
-            ))
-        conn.commit()
-        conn.close()
+        with db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    INSERT INTO chats (id, messages, chat_name, rss_uuid, rss_title, rss_url, created_at, updated_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (id) DO UPDATE SET
+                        messages = EXCLUDED.messages,
+                        chat_name = EXCLUDED.chat_name,
+                        rss_uuid = EXCLUDED.rss_uuid,
+                        rss_title = EXCLUDED.rss_title,
+                        rss_url = EXCLUDED.rss_url,
+                        updated_at = EXCLUDED.updated_at
+                """, (
+                    save_req.chat_id,
+                    json.dumps([msg.dict() for msg in save_req.messages]),
+                    save_req.chat_name,
+                    save_req.rss_uuid,
+                    save_req.rss_title,
+                    save_req.rss_url,
+                    datetime.now(),
+                    datetime.now()
+                ))
+            conn.commit()
         
         return {"message": "Chat saved successfully"}
     except Exception as e:
@@ -668,21 +2900,16 @@ async def save_chat(request: Request, save_req: SaveChatRequest):
 
 @app.post("/load_chat/")
 @limiter.limit("30/minute")
-async def load_chat(request: Request, load_req: LoadChatRequest):
+def load_chat(request: Request, load_req: LoadChatRequest):
     try:
-        conn = get_db_connection()
-        if not conn:
-            return {"chats": []}
-            
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            if load_req.chat_id == "all":
-                cursor.execute("SELECT * FROM chats ORDER BY updated_at DESC")
-                chats = cursor.fetchall()
-            else:
-                cursor.execute("SELECT * FROM chats WHERE id = %s", (load_req.chat_id,))
-                chats = cursor.fetchall()
-        
-        conn.close()
+        with db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                if load_req.chat_id == "all":
+                    cursor.execute("SELECT * FROM chats ORDER BY updated_at DESC")
+                    chats = cursor.fetchall()
+                else:
+                    cursor.execute("SELECT * FROM chats WHERE id = %s", (load_req.chat_id,))
+                    chats = cursor.fetchall()
         
         for chat in chats:
             if chat['messages']:
@@ -695,16 +2922,12 @@ async def load_chat(request: Request, load_req: LoadChatRequest):
 
 @app.post("/delete_chat/")
 @limiter.limit("10/minute")
-async def delete_chat(request: Request, delete_req: DeleteChatRequest):
+def delete_chat(request: Request, delete_req: DeleteChatRequest):
     try:
-        conn = get_db_connection()
-        if not conn:
-            return {"message": "Database unavailable"}
-            
-        with conn.cursor() as cursor:
-            cursor.execute("DELETE FROM chats WHERE id = %s", (delete_req.chat_id,))
-        conn.commit()
-        conn.close()
+        with db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("DELETE FROM chats WHERE id = %s", (delete_req.chat_id,))
+            conn.commit()
         
         return {"message": "Chat deleted successfully"}
     except Exception as e:
@@ -718,62 +2941,110 @@ async def discover_rss(
     rss_req: RSSRequest
 ):
     try:
-        feeds = discover_rss_feeds(rss_req.url)
+        feeds = await run_in_threadpool(discover_rss_feeds, rss_req.url)
         return {"feeds": feeds, "source_url": rss_req.url}
     except Exception as e:
         logging.error(f"RSS discovery error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to discover RSS feeds")
 
-@app.post("/add_rss/")
+@app.post("/add_rss/", status_code=status.HTTP_202_ACCEPTED)
 async def add_rss(
     request: Request,
     rss_req: RSSRequest
 ):
+    """Queue a feed for ingestion; poll /jobs/{job_id} for the outcome"""
     try:
-        # Parse RSS feed
-        feed_data = parse_rss_feed(rss_req.url)
-        
-        # Store in database
-        feed_id = store_rss_feed_and_articles(feed_data, rss_req.url)
-        
-        return {
-            "message": "RSS feed added successfully",
-            "rss_uuid": feed_id,
-            "feed_title": feed_data['title'],
-            "entries_count": len(feed_data['entries'])
-        }
-        
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        job_id = await run_in_threadpool(enqueue_job, "add_rss", {"url": rss_req.url})
+        return {"message": "RSS feed queued", "job_id": job_id, "status": "queued"}
     except Exception as e:
         logging.error(f"RSS add error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to add RSS feed")
 
+@app.get("/jobs/{job_id}")
+async def get_job_status(request: Request, job_id: str, response: Response):
+    """Get the status and result of an ingestion job"""
+    try:
+        uuid.UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job ID")
+
+    try:
+        job = await run_in_threadpool(get_job, job_id)
+    except Exception:
+        log_error("ingest_job_status", "lookup_failed")
+        raise HTTPException(status_code=500, detail="Failed to get job status")
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if replicas and job['status'] == 'succeeded' and job['finished_at']:
+        # The job's writes happened after the request that queued it; pin
+        # reads to its finish time once, not again on every later poll
+        finished_at = job['finished_at'].timestamp()
+        if (time.time() - finished_at < READ_AFTER_WRITE_SECONDS
+                and finished_at > (client_last_write(request) or 0.0)):
+            remember_write(response, finished_at)
+    return job
+
+@app.post("/import_opml")
+@limiter.limit("5/minute")
+async def import_opml(
+    request: Request,
+    file: UploadFile = File(...),
+    concurrency: int = OPML_IMPORT_CONCURRENCY,
+    per_host: int = OPML_IMPORT_PER_HOST
+):
+    """Import every feed in an OPML file, streaming progress as NDJSON"""
+    body = await file.read(OPML_MAX_BYTES + 1)
+    if len(body) > OPML_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="OPML file too large")
+    try:
+        feeds = parse_opml(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not feeds:
+        raise HTTPException(status_code=400, detail="No feeds found in OPML file")
+
+    concurrency = max(1, min(concurrency, OPML_IMPORT_CONCURRENCY))
+    per_host = max(1, min(per_host, concurrency))
+
+    async def progress():
+        try:
+            async for event in import_feeds([f['url'] for f in feeds], concurrency, per_host):
+                yield json.dumps(event) + "\n"
+        except Exception:
+            log_error("opml_import", "import_failed")
+            yield json.dumps({"event": "error", "error": "Import failed"}) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+def rss_chat_prompt(rss_req: RSSChatRequest) -> str:
+    """System prompt with RSS context for the conversation's last user message"""
+    # Get user input for keyword search
+    user_input = rss_req.messages[-1].content if rss_req.messages[-1].role == "user" else ""
+    if not user_input:
+        raise HTTPException(status_code=400, detail="Last message must be from user")
+
+    # Get RSS context using Option 3 strategy
+    rss_context = get_rss_context_for_ai(user_input)
+    
+    # Create system prompt with RSS context
+    return (
+        "You are a helpful news assistant discussing publicly available RSS feed content. "
+        "The articles below are from public RSS feeds and news sources. "
+        "You should freely discuss, analyze, and provide insights about these public news articles. "
+        "These are not confidential - they are published news stories meant to be shared and discussed. "
+        "Provide helpful summaries, analysis, and insights based on the feed content. "
+        "If you don't have specific information about something, say so.\n\n"
+        f"RSS ARTICLES:\n{rss_context}"
+    )
+
 @app.post("/rss_chat/", response_model=None)
 @limiter.limit("20/minute")
-async def rss_chat(
+def rss_chat(
     request: Request,
     rss_req: RSSChatRequest
 ):
     try:
-        # Get user input for keyword search
-        user_input = rss_req.messages[-1].content if rss_req.messages[-1].role == "user" else ""
-        if not user_input:
-            raise HTTPException(status_code=400, detail="Last message must be from user")
-
-        # Get RSS context using Option 3 strategy
-        rss_context = get_rss_context_for_ai(user_input)
-        
-        # Create system prompt with RSS context
-        system_prompt = (
-            "You are a helpful news assistant discussing publicly available RSS feed content. "
-            "The articles below are from public RSS feeds and news sources. "
-            "You should freely discuss, analyze, and provide insights about these public news articles. "
-            "These are not confidential - they are published news stories meant to be shared and discussed. "
-            "Provide helpful summaries, analysis, and insights based on the feed content. "
-            "If you don't have specific information about something, say so.\n\n"
-            f"RSS ARTICLES:\n{rss_context}"
-        )
+        system_prompt = rss_chat_prompt(rss_req)
 
         # Call Bedrock with RSS context
         response_text = call_bedrock_nova(rss_req.messages, system_prompt)
@@ -787,27 +3058,27 @@ async def rss_chat(
         logging.error(f"RSS chat error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to process RSS chat request")
 
+@app.post("/rss_chat/stream", response_model=None)
+@limiter.limit("20/minute")
+def rss_chat_stream(request: Request, rss_req: RSSChatRequest):
+    """Streaming /rss_chat/: the response arrives as Server-Sent Events"""
+    try:
+        system_prompt = rss_chat_prompt(rss_req)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"RSS chat error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to process RSS chat request")
+    return stream_chat_response(rss_req.messages, system_prompt)
+
 @app.get("/articles")
 @limiter.limit("30/minute")
-async def get_all_articles(request: Request, limit: int = 50):
-    """Get all articles across all feeds"""
+async def get_all_articles(request: Request, limit: int = 50, cursor: Optional[str] = None):
+    """Get all articles across all feeds, newest first; pass next_cursor back to page"""
     try:
-        conn = get_db_connection()
-        if not conn:
-            return {"articles": []}
-            
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT a.id, a.title, a.summary, a.url, a.published_date, a.author,
-                       f.title as feed_title, f.id as feed_id
-                FROM rss_articles a
-                JOIN rss_feeds f ON a.feed_id = f.id
-                ORDER BY a.created_at DESC 
-                LIMIT %s
-            """, (limit,))
-            articles = cursor.fetchall()
-        
-        conn.close()
+        articles, next_cursor = await fetch_page(
+            ALL_ARTICLES_PAGES, (), cursor, limit, 'created_at', pool=read_pool(request)
+        )
         
         # Convert to list of dicts
         article_list = []
@@ -815,7 +3086,7 @@ async def get_all_articles(request: Request, limit: int = 50):
             article_list.append({
                 "id": str(article['id']),
                 "title": article['title'],
-                "summary": article['summary'] or "",
+                "snippet": article['snippet'] or "",
                 "url": article['url'] or "",
                 "published_date": str(article['published_date']) if article['published_date'] else "",
                 "author": article['author'] or "",
@@ -823,128 +3094,161 @@ async def get_all_articles(request: Request, limit: int = 50):
                 "feed_id": str(article['feed_id'])
             })
         
-        return {"articles": article_list}
+        return {"articles": article_list, "next_cursor": next_cursor}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Get all articles error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get articles")
 
 @app.get("/search_articles")
-async def search_articles(q: str, limit: int = 10):
-    """Search articles using full-text search"""
+async def search_articles(
+    request: Request,
+    q: str,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    feed_id: Optional[uuid.UUID] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+):
+    """Search articles with web-style query syntax ("quoted phrases", -exclusions, or).
+
+    Results are ranked title > summary > body, carry a highlighted snippet and
+    page with next_cursor. When nothing matches, titles are matched fuzzily
+    instead (mode "fuzzy").
+    """
     if not q.strip():
-        return {"articles": []}
+        return {"articles": [], "next_cursor": None, "mode": "fulltext"}
     
-    conn = get_db_connection()
+    fuzzy = bool(cursor) and cursor.startswith(FUZZY_CURSOR_PREFIX)
+    if fuzzy:
+        cursor = cursor[len(FUZZY_CURSOR_PREFIX):]
+    params = (q, feed_id, since, until)
+    pool = read_pool(request)
+    
+    rows, next_cursor = [], None
+    if not fuzzy:
+        rows, next_cursor = await fetch_page(SEARCH_ARTICLES_PAGES, params, cursor, limit, 'rank', pool=pool)
+        # Only fall back on a first page: later pages may legitimately be empty
+        fuzzy = not rows and not cursor
+    if fuzzy:
+        rows, next_cursor = await fetch_page(FUZZY_SEARCH_PAGES, params, cursor, limit, 'rank', pool=pool)
+        if next_cursor:
+            next_cursor = FUZZY_CURSOR_PREFIX + next_cursor
+    
+    articles = []
+    for row in rows:
+        articles.append({
+            "id": str(row['id']),
+            "title": row['title'],
+            "snippet": row['snippet'],
+            "url": row['url'],
+            "published_date": row['published_date'].isoformat() if row['published_date'] else None,
+            "feed_title": row['feed_title'],
+            "feed_id": str(row['feed_id']),
+            "relevance": float(row['rank'])
+        })
+    
+    return {"articles": articles, "next_cursor": next_cursor, "mode": "fuzzy" if fuzzy else "fulltext"}
+
+@app.post("/articles/batch")
+@limiter.limit("60/minute")
+def get_articles_batch(request: Request, batch_req: ArticleBatchRequest):
+    """Fetch up to ARTICLE_BATCH_MAX articles by id in one lookup"""
+    if len(batch_req.article_ids) > ARTICLE_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {ARTICLE_BATCH_MAX} article IDs per request")
+    ids, invalid = [], []
+    for article_id in batch_req.article_ids:
+        try:
+            ids.append(str(uuid.UUID(str(article_id))))
+        except ValueError:
+            invalid.append(article_id)
+    ids = list(dict.fromkeys(ids))
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT a.id, a.title, a.summary, a.url, a.published_date, 
-                       f.title as feed_title, f.id as feed_id,
-                       ts_rank(a.search_vector, to_tsquery('english', %s)) as rank
-                FROM rss_articles a
-                JOIN rss_feeds f ON a.feed_id = f.id
-                WHERE a.search_vector @@ to_tsquery('english', %s)
-                ORDER BY rank DESC, a.published_date DESC
-                LIMIT %s
-            """, (q, q, limit))
-            
-            articles = []
-            for row in cursor.fetchall():
-                articles.append({
-                    "id": str(row['id']),
-                    "title": row['title'],
-                    "summary": row['summary'][:200] + "..." if row['summary'] and len(row['summary']) > 200 else row['summary'],
-                    "url": row['url'],
-                    "published_date": row['published_date'].isoformat() if row['published_date'] else None,
-                    "feed_title": row['feed_title'],
-                    "feed_id": str(row['feed_id']),
-                    "relevance": float(row['rank'])
-                })
-            
-            return {"articles": articles}
-    finally:
-        conn.close()
+        articles = get_articles_by_ids(ids)
+    except Exception as e:
+        logging.error(f"Batch article lookup error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to get articles")
+    return {
+        "articles": list(articles.values()),
+        "missing": [article_id for article_id in ids if article_id not in articles],
+        "invalid": invalid
+    }
 
-@app.post("/chat_article")
-async def chat_article(request: Request, article_req: dict):
-    """Chat about a specific article"""
+def article_chat_prompt(article_req: dict):
+    """(article, messages, system prompt) for a chat about one article"""
     article_id = article_req.get("article_id")
     message = article_req.get("message", "Tell me about this article")
     
     if not article_id:
         raise HTTPException(status_code=400, detail="Article ID required")
     
-    conn = get_db_connection()
-    try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT a.title, a.content, a.summary, a.url, f.title as feed_title
-                FROM rss_articles a
-                JOIN rss_feeds f ON a.feed_id = f.id
-                WHERE a.id = %s
-            """, (article_id,))
-            
-            article = cursor.fetchone()
-            if not article:
-                raise HTTPException(status_code=404, detail="Article not found")
-            
-            # Create focused context with just this article
-            article_context = f"""
+    article = next(iter(get_articles_by_ids([article_id]).values()), None)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    
+    # Create focused context with just this article
+    article_context = f"""
 Article: {article['title']}
 Source: {article['feed_title']}
 Summary: {article['summary'] or 'No summary available'}
 URL: {article['url']}
 """
-            
-            system_prompt = f"""You are discussing this specific news article:
+    
+    system_prompt = f"""You are discussing this specific news article:
 {article_context}
 
 Answer questions about this article directly and concisely. If asked for details not in the article, say so."""
-            
-            messages = [{"role": "user", "content": message}]
-            response_text = call_bedrock_nova(messages, system_prompt)
-            
-            return {"response": response_text, "article": {
-                "title": article['title'],
-                "url": article['url'],
-                "feed_title": article['feed_title']
-            }}
-    finally:
-        conn.close()
+    
+    return article, [{"role": "user", "content": message}], system_prompt
+
+@app.post("/chat_article")
+def chat_article(request: Request, article_req: dict):
+    """Chat about a specific article"""
+    article, messages, system_prompt = article_chat_prompt(article_req)
+    response_text = call_bedrock_nova(messages, system_prompt)
+    
+    return {"response": response_text, "article": {
+        "title": article['title'],
+        "url": article['url'],
+        "feed_title": article['feed_title']
+    }}
+
+@app.post("/chat_article/stream")
+def chat_article_stream(request: Request, article_req: dict):
+    """Streaming /chat_article: the response arrives as Server-Sent Events"""
+    _, messages, system_prompt = article_chat_prompt(article_req)
+    return stream_chat_response(messages, system_prompt)
 
 @app.get("/rss_articles/{feed_id}")
-async def get_rss_articles(request: Request, feed_id: str):
+async def get_rss_articles(request: Request, feed_id: str, limit: int = 20, cursor: Optional[str] = None):
     try:
-        conn = get_db_connection()
-        if not conn:
-            return {"articles": []}
-            
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT title, summary, url, published_date, author
-                FROM rss_articles 
-                WHERE feed_id = %s 
-                ORDER BY published_date DESC 
-                LIMIT 20
-            """, (feed_id,))
-            articles = cursor.fetchall()
-        
-        conn.close()
+        uuid.UUID(feed_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid feed ID")
+
+    try:
+        articles, next_cursor = await fetch_page(
+            FEED_ARTICLES_PAGES, (feed_id,), cursor, limit, 'sort_date', pool=read_pool(request)
+        )
         
         # Convert to list of dicts
         article_list = []
         for article in articles:
             article_list.append({
+                "id": str(article['id']),
                 "title": article['title'],
-                "summary": article['summary'] or "",
+                "snippet": article['snippet'] or "",
                 "url": article['url'] or "",
                 "published_date": str(article['published_date']) if article['published_date'] else "",
                 "author": article['author'] or ""
             })
         
-        return {"articles": article_list}
+        return {"articles": article_list, "next_cursor": next_cursor}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Get articles error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get articles")
@@ -998,8 +3302,7 @@ def load_chat_from_s3(s3_key: str):
 
 def create_chat_session(title: str = None, rss_feed_ids: List[str] = None, article_ids: List[str] = None):
     """Create new chat session in database"""
-    conn = get_db_connection()
-    try:
+    with db_connection() as conn:
         session_id = str(uuid.uuid4())
         s3_key = f"chat-history/anonymous/{session_id}.json"
         
@@ -1016,61 +3319,34 @@ def create_chat_session(title: str = None, rss_feed_ids: List[str] = None, artic
             result = cursor.fetchone()
             conn.commit()
             return result[0]
-    finally:
-        conn.close()
 
-def get_articles_context(article_ids: List[str]) -> str:
-    """Get context from specific articles"""
+def get_articles_context(article_ids: List[str], query: str = "") -> str:
+    """Get context from specific articles, most relevant to query first"""
     if not article_ids:
         return ""
     
-    conn = get_db_connection()
-    try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            # Convert string IDs to UUID format for database query
-            uuid_params = []
-            for article_id in article_ids:
-                try:
-                    # Try to convert string to UUID format
-                    import uuid
-                    uuid.UUID(article_id)  # Validate UUID format
-                    uuid_params.append(article_id)
-                except ValueError:
-                    # Skip invalid UUIDs
-                    logging.warning(f"Invalid UUID format: {article_id}")
-                    continue
-            
-            if not uuid_params:
-                return "No valid article IDs provided."
-            
-            placeholders = ','.join(['%s'] * len(uuid_params))
-            cursor.execute(f"""
-                SELECT a.title, a.summary, a.content, f.title as feed_title
-                FROM rss_articles a
-                JOIN rss_feeds f ON a.feed_id = f.id
-                WHERE a.id::text IN ({placeholders})
-                LIMIT 10
-            """, uuid_params)
-            
-            articles = cursor.fetchall()
-            
-            if not articles:
-                return "No articles found for the provided IDs."
-            
-            context = "Selected Articles:\n\n"
-            for article in articles:
-                context += f"Feed: {article['feed_title']}\n"
-                context += f"Title: {article['title']}\n"
-                context += f"Summary: {article['summary'][:300]}...\n\n"
-            
-            return context[:8000]  # Limit context size
-    finally:
-        conn.close()
+    # Put the articles that matter to this question ahead of the size cut
+    ranked = semantic_article_ids(query, len(article_ids), candidates=article_ids) if query else None
+    if ranked:
+        seen = set(ranked)
+        article_ids = ranked + [article_id for article_id in article_ids if article_id not in seen]
+    
+    articles = get_articles_by_ids(article_ids)
+    if not articles:
+        return "No articles found for the provided IDs."
+    
+    context = "Selected Articles:\n\n"
+    for article in articles.values():
+        context += f"Feed: {article['feed_title']}\n"
+        context += f"Title: {article['title']}\n"
+        context += f"Summary: {article['snippet']}\n\n"
+    
+    return context[:8000]  # Limit context size
 
 # Chat Session API Endpoints
 @app.post("/chat_sessions/")
 @limiter.limit("10/minute")
-async def create_new_chat_session(request: Request, chat_data: ChatSessionCreate):
+def create_new_chat_session(request: Request, chat_data: ChatSessionCreate):
     """Create a new chat session"""
     try:
         session_id = create_chat_session(
@@ -1085,70 +3361,79 @@ async def create_new_chat_session(request: Request, chat_data: ChatSessionCreate
 
 @app.get("/chat_sessions/")
 @limiter.limit("30/minute")
-async def list_chat_sessions(request: Request):
-    """List user's chat sessions"""
+async def list_chat_sessions(request: Request, limit: int = 20, cursor: Optional[str] = None):
+    """List user's chat sessions, most recently active first"""
     try:
-        conn = get_db_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT id, title, created_at, updated_at, rss_feed_ids, article_ids
-                FROM chat_sessions 
-                ORDER BY updated_at DESC 
-                LIMIT 20
-            """)
-            sessions = cursor.fetchall()
-            return {"sessions": sessions}
+        sessions, next_cursor = await fetch_page(
+            CHAT_SESSIONS_PAGES, (), cursor, limit, 'updated_at', pool=read_pool(request)
+        )
+        return {"sessions": sessions, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         log_error("chat_sessions_list", "list_failed")
         raise HTTPException(status_code=500, detail="Failed to list chat sessions")
-    finally:
-        conn.close()
 
-@app.post("/chat_sessions/{session_id}/chat")
-@limiter.limit("20/minute")
-async def chat_with_session(request: Request, session_id: str, chat_req: ChatRequest):
-    """Chat within a specific session"""
-    try:
-        # Get session
-        conn = get_db_connection()
+def load_session_chat(session_id: str, message: str):
+    """Load a session's history and build the AI context for its next message.
+
+    Returns (session, messages, system_prompt); messages already ends with
+    the new user message.
+    """
+    # Get session
+    with db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute("""
                 SELECT s3_key, rss_feed_ids, article_ids 
                 FROM chat_sessions WHERE id = %s
             """, (session_id,))
             session = cursor.fetchone()
-            
-            if not session:
-                raise HTTPException(status_code=404, detail="Chat session not found")
-        
-        # Load current messages
-        chat_data = load_chat_from_s3(session['s3_key'])
-        messages = chat_data.get('messages', [])
-        
-        # Add user message
-        messages.append({"role": "user", "content": chat_req.message})
         
-        # Get AI response with context
-        rss_context = ""
-        if session['article_ids']:
-            rss_context = get_articles_context(session['article_ids'])
-        elif session['rss_feed_ids']:
-            rss_context = get_rss_context_for_ai(chat_req.message)
-        
-        # Call AI
-        ai_response = call_bedrock_nova([{"role": "user", "content": chat_req.message}], 
-                                       system_prompt=f"RSS Context:\n{rss_context}")
-        
-        # Add AI response
+    if not session:
+        raise HTTPException(status_code=404, detail="Chat session not found")
+    
+    # Load current messages
+    chat_data = load_chat_from_s3(session['s3_key'])
+    messages = chat_data.get('messages', [])
+    
+    # Add user message
+    messages.append({"role": "user", "content": message})
+    
+    # Get AI response with context
+    rss_context = ""
+    if session['article_ids']:
+        rss_context = get_articles_context(session['article_ids'], message)
+    elif session['rss_feed_ids']:
+        rss_context = get_rss_context_for_ai(message)
+    
+    return session, messages, f"RSS Context:\n{rss_context}"
+
+def save_session_reply(session_id: str, session, messages: List[Dict], ai_response: str):
+    """Append the assistant reply (if any) and persist the session history"""
+    if ai_response:
         messages.append({"role": "assistant", "content": ai_response})
-        
-        # Save updated messages
-        save_chat_to_s3(session_id, messages, {"rss_feed_ids": session['rss_feed_ids'], "article_ids": session['article_ids']})
-        
-        # Update session timestamp
+    
+    # Save updated messages
+    save_chat_to_s3(session_id, messages, {"rss_feed_ids": session['rss_feed_ids'], "article_ids": session['article_ids']})
+    
+    # Update session timestamp
+    with db_connection() as conn:
         with conn.cursor() as cursor:
             cursor.execute("UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = %s", (session_id,))
             conn.commit()
+
+@app.post("/chat_sessions/{session_id}/chat")
+@limiter.limit("20/minute")
+def chat_with_session(request: Request, session_id: str, chat_req: ChatRequest):
+    """Chat within a specific session"""
+    try:
+        session, messages, system_prompt = load_session_chat(session_id, chat_req.message)
+        
+        # Call AI
+        ai_response = call_bedrock_nova([{"role": "user", "content": chat_req.message}], 
+                                       system_prompt=system_prompt)
+        
+        save_session_reply(session_id, session, messages, ai_response)
         
         return {"response": ai_response}
         
@@ -1157,29 +3442,140 @@ async def chat_with_session(request: Request, session_id: str, chat_req: ChatReq
     except Exception as e:
         log_error("chat_session_chat", "chat_failed")
         raise HTTPException(status_code=500, detail="Failed to process chat")
-    finally:
-        conn.close()
+
+@app.post("/chat_sessions/{session_id}/chat/stream")
+@limiter.limit("20/minute")
+def chat_with_session_stream(request: Request, session_id: str, chat_req: ChatRequest):
+    """Streaming session chat: the response arrives as Server-Sent Events.
+
+    The reply is saved to the session once the stream ends; if the client
+    disconnects first, whatever was generated up to then is saved.
+    """
+    try:
+        session, messages, system_prompt = load_session_chat(session_id, chat_req.message)
+    except HTTPException:
+        raise
+    except Exception as e:
+        log_error("chat_session_chat", "chat_failed")
+        raise HTTPException(status_code=500, detail="Failed to process chat")
+    
+    def persist(ai_response, cancelled):
+        save_session_reply(session_id, session, messages, ai_response)
+    
+    return stream_chat_response(
+        [{"role": "user", "content": chat_req.message}], system_prompt, on_complete=persist
+    )
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "timestamp": time.time()}
 
+def require_metrics_token(request: Request):
+    """Only scrapers holding METRICS_TOKEN may read /metrics; without one it is off"""
+    supplied = request.headers.get("X-Metrics-Token", "")
+    if not METRICS_TOKEN or not hmac.compare_digest(supplied.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def get_metrics():
+    """Connection pool, fetcher and cache counters"""
+    return {
+        "db_pool": db_pool.stats(),
+        "async_db_pool": async_db_pool_stats(),
+        "replicas": [replica.stats() for replica in replicas],
+        "fetcher": fetcher.stats(),
+        "discovery_cache": discovery_cache.stats(),
+        "article_cache": article_cache.stats(),
+        "bedrock_cache": bedrock_cache.stats(),
+        "rss_context_cache": {**recent_context_cache.stats(), "articles_version": articles_version},
+        "vector_index": {**vector_index.stats(), "model": embedder.name if embedder else None},
+    }
+
 @app.get("/rss_feeds")
-async def get_rss_feeds():
-    """Get all stored RSS feeds"""
-    conn = get_db_connection()
+async def get_rss_feeds(request: Request, include: Optional[str] = None):
+    """Get all stored RSS feeds; include=stats adds article counts and last fetch outcome"""
+    with_stats = 'stats' in (include or '').split(',')
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("SELECT * FROM rss_feeds ORDER BY created_at DESC")
-            feeds = cursor.fetchall()
-            return {"feeds": feeds}
+        feeds = await async_fetch(
+            RSS_FEEDS_WITH_STATS_SQL if with_stats else RSS_FEEDS_SQL, pool=read_pool(request)
+        )
+        return {"feeds": feeds}
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Failed to get RSS feeds: {e}")
         raise HTTPException(status_code=500, detail="Failed to get RSS feeds")
-    finally:
-        conn.close()
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host=os.environ.get("HOST"), port=int(os.environ.get("PORT")))
+    import argparse
+
+    parser = argparse.ArgumentParser(description="RSS Chat backend")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("serve", help="Run the API server (default)")
+    migrate_parser = subparsers.add_parser("migrate", help="Apply pending database migrations and exit")
+    migrate_parser.add_argument("--check", action="store_true",
+                                help="Only report pending migrations; exit status 1 if any")
+    subparsers.add_parser("scheduler", help="Run only the feed refresh scheduler")
+    subparsers.add_parser("worker", help="Run only the ingestion job workers")
+    subparsers.add_parser("extract", help="Run only the full-article content extractor")
+    embed_parser = subparsers.add_parser("embed", help="Run only the article embedding indexer")
+    embed_parser.add_argument("--reset", action="store_true",
+                              help="Re-embed every article first (after changing the embedding model)")
+    subparsers.add_parser("reparse-cache", help="Re-parse all feeds from the raw body cache (FEED_CACHE_DIR)")
+    opml_parser = subparsers.add_parser("import-opml", help="Import all feeds from an OPML file")
+    opml_parser.add_argument("path", help="Path to the OPML file")
+    opml_parser.add_argument("--concurrency", type=int, default=OPML_IMPORT_CONCURRENCY)
+    opml_parser.add_argument("--per-host", type=int, default=OPML_IMPORT_PER_HOST)
+    partitions_parser = subparsers.add_parser("partitions", help="Maintain monthly rss_articles partitions")
+    partitions_parser.add_argument("action", choices=["maintain", "archive", "reattach"])
+    partitions_parser.add_argument("name", nargs="?", help="Partition name, e.g. rss_articles_p202401")
+    partitions_parser.add_argument("--keep-detached", action="store_true",
+                                   help="With archive: keep the detached table instead of dropping it")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        if args.check:
+            pending = run_migrations(check_only=True)
+            print(json.dumps({"pending": pending}))
+            raise SystemExit(1 if pending else 0)
+        logging.info(f"Applied migrations: {run_migrations()}")
+    elif args.command == "scheduler":
+        asyncio.run(run_feed_scheduler())
+    elif args.command == "worker":
+        async def run_workers():
+            await asyncio.gather(*(run_job_worker() for _ in range(INGEST_WORKERS)))
+
+        asyncio.run(run_workers())
+    elif args.command == "extract":
+        asyncio.run(run_content_extractor())
+    elif args.command == "embed":
+        if embedder is None:
+            parser.error("embed needs EMBEDDINGS_ENABLED=true and a working embedder")
+        if args.reset:
+            logging.info(f"Marked {reset_article_embeddings()} articles for re-embedding")
+        asyncio.run(run_embedding_indexer(sync=False))
+    elif args.command == "reparse-cache":
+        logging.info(f"Re-parsed {reparse_cached_feeds()} feeds from cache")
+    elif args.command == "import-opml":
+        async def run_import():
+            with open(args.path, 'rb') as f:
+                feeds = parse_opml(f.read())
+            async for event in import_feeds([f['url'] for f in feeds], args.concurrency, args.per_host):
+                print(json.dumps(event), flush=True)
+
+        asyncio.run(run_import())
+    elif args.command == "partitions":
+        if args.action == "maintain":
+            logging.info(f"Archived: {maintain_article_partitions()}")
+        elif not args.name:
+            parser.error(f"partitions {args.action} needs a partition name")
+        else:
+            with db_connection() as conn:
+                if args.action == "archive":
+                    archive_partition(conn, args.name, drop=not args.keep_detached)
+                else:
+                    reattach_partition(conn, args.name)
+    else:
+        import uvicorn
+        uvicorn.run(app, host=os.environ.get("HOST"), port=int(os.environ.get("PORT")))
@@ -0,0 +1,30 @@
+"""Import backend without AWS: Secrets Manager is faked so module setup
+finds its configuration, and nothing connects to the database until a test
+asks for a connection."""
+import json
+import os
+import sys
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+TEST_SECRETS = {
+    "db_name": "rss", "db_user": "rss", "db_password": "rss",
+    "db_host": "localhost", "db_port": "5432", "s3_bucket": "rss-test",
+}
+
+for key in TEST_SECRETS:
+    os.environ.setdefault(f"{key.upper()}_KEY", key)
+os.environ.setdefault("REGION_NAME", "us-east-1")
+
+
+def _fake_session():
+    session = mock.MagicMock()
+    session.client.return_value.get_secret_value.return_value = {
+        "SecretString": json.dumps(TEST_SECRETS)
+    }
+    return session
+
+
+with mock.patch("boto3.session.Session", side_effect=_fake_session):
+    import backend  # noqa: E402,F401
@@ -0,0 +1,194 @@
+"""Article embeddings and an in-process vector index for semantic retrieval.
+
+Embedders turn text into L2-normalised float32 vectors: HashingEmbedder needs
+no model or network (offline runs and tests), BedrockEmbedder calls a Bedrock
+embedding model. VectorIndex keeps every vector in one contiguous float32
+matrix, so a top-k cosine query is a single matrix-vector product plus an
+argpartition. Nothing here touches the database.
+"""
+import hashlib
+import json
+import re
+import threading
+
+import numpy as np
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Characters of article text sent to an embedder
+EMBED_MAX_CHARS = 4000
+
+
+def embedding_text(title, summary_text, content=''):
+    """The text an article is embedded from: title plus summary (or the start of the body)"""
+    body = summary_text or content or ''
+    return f"{title or ''}\n{body}"[:EMBED_MAX_CHARS]
+
+
+def normalize(vector):
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def to_bytes(vector):
+    return np.asarray(vector, dtype='<f4').tobytes()
+
+
+def from_bytes(data):
+    return np.frombuffer(data, dtype='<f4')
+
+
+class HashingEmbedder:
+    """Signed feature hashing of word unigrams and bigrams, log-scaled.
+
+    Deterministic across processes and good enough to test the pipeline or
+    run without Bedrock; it matches shared vocabulary, not meaning.
+    """
+
+    def __init__(self, dim=256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, text):
+        tokens = TOKEN_RE.findall((text or '').lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature in features:
+            h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+            vector[h % self.dim] += 1.0 if h >> 63 else -1.0
+        return normalize(np.sign(vector) * np.log1p(np.abs(vector)))
+
+    def embed_many(self, texts):
+        return np.vstack([self.embed(text) for text in texts]) if texts else np.zeros((0, self.dim), np.float32)
+
+
+class BedrockEmbedder:
+    """Embeddings from a Bedrock text embedding model (Titan Text Embeddings v2 request format)"""
+
+    def __init__(self, client, model_id, dim=256):
+        self.client = client
+        self.model_id = model_id
+        self.dim = dim
+        self.name = f"{model_id}:{dim}"
+
+    def embed(self, text):
+        response = self.client.invoke_model(
+            modelId=self.model_id,
+            body=json.dumps({"inputText": (text or ' ')[:EMBED_MAX_CHARS], "dimensions": self.dim, "normalize": True}),
+            contentType="application/json",
+            accept="application/json"
+        )
+        embedding = json.loads(response['body'].read())['embedding']
+        return normalize(np.asarray(embedding, dtype=np.float32))
+
+    def embed_many(self, texts):
+        # The model takes one input per request
+        return np.vstack([self.embed(text) for text in texts]) if texts else np.zeros((0, self.dim), np.float32)
+
+
+def make_embedder(provider, dim, bedrock_client=None, model_id=None):
+    if provider == 'hashing':
+        return HashingEmbedder(dim)
+    if provider == 'bedrock':
+        if bedrock_client is None:
+            raise ValueError("Bedrock embedder needs a bedrock-runtime client")
+        return BedrockEmbedder(bedrock_client, model_id, dim)
+    raise ValueError(f"Unknown embedding provider: {provider}")
+
+
+class VectorIndex:
+    """Unit vectors by article id in a growable float32 matrix, with top-k cosine search.
+
+    Adding an id that is already present overwrites its row; removed rows
+    are masked out rather than compacted. Searches work on a snapshot of
+    the current size, so they never wait on a writer for long.
+    """
+
+    def __init__(self, dim, capacity=1024):
+        self.dim = dim
+        self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._ids = []
+        self._rows = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _grow(self, needed):
+        capacity = max(needed, 2 * len(self._matrix))
+        for name in ('_matrix', '_times', '_live'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, ids, vectors, timestamps):
+        """Insert or replace vectors; timestamps are article creation times (epoch seconds)"""
+        with self._lock:
+            new = sum(1 for article_id in ids if article_id not in self._rows)
+            if len(self._ids) + new > len(self._matrix):
+                self._grow(len(self._ids) + new)
+            for article_id, vector, timestamp in zip(ids, vectors, timestamps):
+                row = self._rows.get(article_id)
+                if row is None:
+                    row = len(self._ids)
+                    self._ids.append(article_id)
+                    self._rows[article_id] = row
+                self._matrix[row] = vector
+                self._times[row] = timestamp
+                self._live[row] = True
+
+    def remove(self, ids):
+        with self._lock:
+            for article_id in ids:
+                row = self._rows.get(article_id)
+                if row is not None:
+                    self._live[row] = False
+
+    def search(self, query, k, before=None, candidates=None):
+        """Top-k (id, cosine) pairs for a unit query vector, best first.
+
+        before limits results to articles created before that epoch time;
+        candidates limits them to the given ids.
+        """
+        with self._lock:
+            size = len(self._ids)
+            matrix, times, live = self._matrix[:size], self._times[:size], self._live[:size]
+            if candidates is not None:
+                rows = np.fromiter(
+                    (self._rows[c] for c in dict.fromkeys(candidates) if c in self._rows), dtype=np.int64
+                )
+        if candidates is None:
+            rows = None
+            scores = matrix @ query
+        else:
+            matrix, times, live = matrix[rows], times[rows], live[rows]
+            scores = matrix @ query
+        if not len(scores) or k <= 0:
+            return []
+
+        mask = ~live
+        if before is not None:
+            mask |= times >= before
+        scores[mask] = -np.inf
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        if rows is not None:
+            top_rows = rows[top]
+        else:
+            top_rows = top
+        return [(self._ids[row], float(score)) for row, score in zip(top_rows, scores[top]) if score > -np.inf]
+
+    def stats(self):
+        with self._lock:
+            size = len(self._ids)
+            return {
+                "size": size,
+                "live": int(self._live[:size].sum()),
+                "dim": self.dim,
+                "bytes": int(self._matrix.nbytes),
+            }
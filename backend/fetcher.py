@@ -0,0 +1,206 @@
+"""Shared HTTP fetcher for all outbound feed and page requests.
+
+One process-wide httpx client keeps per-host keep-alive pools (HTTP/2 where the
+server supports it), negotiates gzip/brotli, follows a bounded number of
+redirects, caps body sizes and caches DNS lookups. Every fetch reports its
+own timing.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import httpx
+
+USER_AGENT = os.environ.get("FETCH_USER_AGENT", "Mozilla/5.0")
+FETCH_TIMEOUT = float(os.environ.get("FETCH_TIMEOUT", "15"))
+FETCH_CONNECT_TIMEOUT = float(os.environ.get("FETCH_CONNECT_TIMEOUT", "5"))
+FETCH_MAX_BYTES = int(os.environ.get("FETCH_MAX_BYTES", str(10 * 1024 * 1024)))
+FETCH_MAX_REDIRECTS = int(os.environ.get("FETCH_MAX_REDIRECTS", "5"))
+FETCH_MAX_CONNECTIONS = int(os.environ.get("FETCH_MAX_CONNECTIONS", "100"))
+FETCH_MAX_KEEPALIVE = int(os.environ.get("FETCH_MAX_KEEPALIVE", "50"))
+FETCH_KEEPALIVE_EXPIRY = float(os.environ.get("FETCH_KEEPALIVE_EXPIRY", "60"))
+FETCH_HTTP2 = os.environ.get("FETCH_HTTP2", "true").lower() == "true"
+DNS_CACHE_TTL = float(os.environ.get("DNS_CACHE_TTL", "300"))
+DNS_CACHE_SIZE = int(os.environ.get("DNS_CACHE_SIZE", "1024"))
+
+
+class FetchError(Exception):
+    pass
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    headers: httpx.Headers
+    body: bytes
+    truncated: bool = False
+    http_version: str = ""
+    timings: dict = field(default_factory=dict)
+
+    @property
+    def content_type(self):
+        return (self.headers.get('content-type') or '').lower()
+
+
+# DNS cache
+# Only lookups made while a fetch is in progress on the current thread go
+# through the cache; boto3, psycopg2 and asyncpg resolve as usual. The
+# cache is an LRU of at most DNS_CACHE_SIZE entries, each kept DNS_CACHE_TTL.
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache = OrderedDict()
+_dns_lock = threading.Lock()
+_dns_scope = threading.local()
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    if not getattr(_dns_scope, 'active', False):
+        return _original_getaddrinfo(host, port, *args, **kwargs)
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+        if cached and cached[0] > now:
+            _dns_cache.move_to_end(key)
+            return cached[1]
+    result = _original_getaddrinfo(host, port, *args, **kwargs)
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+        _dns_cache.move_to_end(key)
+        while len(_dns_cache) > DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return result
+
+
+def install_dns_cache():
+    """Hook name lookups so fetches can use the cache"""
+    if DNS_CACHE_TTL > 0 and DNS_CACHE_SIZE > 0:
+        socket.getaddrinfo = _cached_getaddrinfo
+
+
+@contextmanager
+def _cached_lookups():
+    """Send this thread's name lookups through the DNS cache for the block"""
+    previous = getattr(_dns_scope, 'active', False)
+    _dns_scope.active = True
+    try:
+        yield
+    finally:
+        _dns_scope.active = previous
+
+
+# Shared client
+_client = None
+_client_lock = threading.Lock()
+_stats = {"requests": 0, "errors": 0, "bytes": 0, "seconds": 0.0}
+_stats_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide pooled client, created on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                install_dns_cache()
+                _client = httpx.Client(
+                    http2=FETCH_HTTP2,
+                    follow_redirects=True,
+                    max_redirects=FETCH_MAX_REDIRECTS,
+                    timeout=httpx.Timeout(FETCH_TIMEOUT, connect=FETCH_CONNECT_TIMEOUT),
+                    limits=httpx.Limits(
+                        max_connections=FETCH_MAX_CONNECTIONS,
+                        max_keepalive_connections=FETCH_MAX_KEEPALIVE,
+                        keepalive_expiry=FETCH_KEEPALIVE_EXPIRY,
+                    ),
+                    headers={'User-Agent': USER_AGENT},
+                )
+    return _client
+
+
+def close():
+    """Close pooled connections (on shutdown)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def stats():
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _record(seconds, size, failed=False):
+    with _stats_lock:
+        _stats["requests"] += 1
+        _stats["seconds"] += seconds
+        _stats["bytes"] += size
+        if failed:
+            _stats["errors"] += 1
+
+
+@contextmanager
+def stream(url, method='GET', headers=None, timeout=None):
+    """Open a response for incremental reading via response.iter_bytes()"""
+    started = time.perf_counter()
+    try:
+        with _cached_lookups(), \
+                get_client().stream(method, url, headers=headers, timeout=timeout or FETCH_TIMEOUT) as response:
+            yield response
+    except httpx.HTTPError as e:
+        _record(time.perf_counter() - started, 0, failed=True)
+        raise FetchError(f"{method} {url} failed: {e}") from e
+    _record(time.perf_counter() - started, response.num_bytes_downloaded)
+
+
+def fetch(url, method='GET', headers=None, timeout=None, max_bytes=FETCH_MAX_BYTES, truncate=False):
+    """Fetch url and return a FetchResult.
+
+    Bodies larger than max_bytes raise FetchError, or are cut short when
+    truncate is set. Error statuses are returned, not raised.
+    """
+    started = time.perf_counter()
+    chunks = []
+    size = 0
+    truncated = False
+    try:
+        with _cached_lookups(), \
+                get_client().stream(method, url, headers=headers, timeout=timeout or FETCH_TIMEOUT) as response:
+            first_byte = time.perf_counter()
+            for chunk in response.iter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    if not truncate:
+                        raise FetchError(f"{url} exceeded {max_bytes} bytes")
+                    chunks.append(chunk[:max_bytes - (size - len(chunk))])
+                    truncated = True
+                    break
+                chunks.append(chunk)
+    except httpx.HTTPError as e:
+        _record(time.perf_counter() - started, size, failed=True)
+        raise FetchError(f"{method} {url} failed: {e}") from e
+
+    finished = time.perf_counter()
+    _record(finished - started, size)
+    timings = {
+        "headers_ms": round((first_byte - started) * 1000, 1),
+        "body_ms": round((finished - first_byte) * 1000, 1),
+        "total_ms": round((finished - started) * 1000, 1),
+    }
+    logging.debug(f"Fetched {url} [{response.status_code} {response.http_version}] in {timings['total_ms']}ms")
+    return FetchResult(
+        url=str(response.url),
+        status=response.status_code,
+        headers=response.headers,
+        body=b''.join(chunks),
+        truncated=truncated,
+        http_version=response.http_version,
+        timings=timings,
+    )
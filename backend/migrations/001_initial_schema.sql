@@ -59,6 +59,7 @@ END;
 $$ language 'plpgsql';
 
 -- Triggers
+DROP TRIGGER IF EXISTS update_chats_updated_at ON chats;
 CREATE TRIGGER update_chats_updated_at 
     BEFORE UPDATE ON chats 
     FOR EACH ROW 
@@ -0,0 +1,22 @@
+-- Migration 003: Adaptive feed polling
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS poll_interval_seconds INTEGER NOT NULL DEFAULT 3600;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS next_poll_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS last_polled_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS last_entry_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS poll_error_count INTEGER NOT NULL DEFAULT 0;
+
+-- Seed newest known entry per feed
+UPDATE rss_feeds f
+SET last_entry_at = latest.published_date
+FROM (
+    SELECT feed_id, MAX(published_date) AS published_date
+    FROM rss_articles
+    GROUP BY feed_id
+) latest
+WHERE f.id = latest.feed_id;
+
+-- Spread the first round of polls over an hour instead of firing all at once
+UPDATE rss_feeds SET next_poll_at = CURRENT_TIMESTAMP + random() * INTERVAL '1 hour';
+
+-- Index for the scheduler's due-feed scan
+CREATE INDEX IF NOT EXISTS idx_rss_feeds_next_poll_at ON rss_feeds(next_poll_at);
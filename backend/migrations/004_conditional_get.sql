@@ -0,0 +1,4 @@
+-- Migration 004: HTTP validators for conditional feed polling
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS etag TEXT;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS last_modified TEXT;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS body_hash VARCHAR(64);
@@ -0,0 +1,39 @@
+-- Migration 005: Natural key and content hash for article de-duplication
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS dedup_key TEXT;
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+-- Backfill keys the same way the ingest path computes them:
+-- normalized link (scheme and host lowercased, fragment and trailing slash
+-- removed; path and query keep their case), else a title hash
+UPDATE rss_articles
+SET dedup_key = COALESCE(
+        NULLIF(rtrim(COALESCE(
+            lower(substring(split_part(btrim(COALESCE(url, '')), '#', 1) from '^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#]*'))
+                || substr(split_part(btrim(COALESCE(url, '')), '#', 1),
+                          length(substring(split_part(btrim(COALESCE(url, '')), '#', 1)
+                                           from '^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#]*')) + 1),
+            split_part(btrim(COALESCE(url, '')), '#', 1)
+        ), '/'), ''),
+        'title:' || md5(title)
+    ),
+    content_hash = encode(sha256(convert_to(
+        title || chr(31) || COALESCE(summary, '') || chr(31) || COALESCE(content, ''), 'UTF8'
+    )), 'hex')
+WHERE dedup_key IS NULL;
+
+-- Collapse existing duplicates, keeping the first copy of each article
+DELETE FROM rss_articles
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY feed_id, dedup_key ORDER BY created_at, id
+        ) AS copy_number
+        FROM rss_articles
+    ) copies
+    WHERE copy_number > 1
+);
+
+ALTER TABLE rss_articles ALTER COLUMN dedup_key SET NOT NULL;
+
+-- Natural key used by ON CONFLICT in the ingest path
+CREATE UNIQUE INDEX IF NOT EXISTS idx_rss_articles_feed_dedup_key ON rss_articles(feed_id, dedup_key);
@@ -0,0 +1,17 @@
+-- Migration 006: Background ingestion job queue
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    kind VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    result JSONB,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+-- Workers only ever scan unfinished jobs
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_pending ON ingest_jobs(created_at)
+    WHERE status IN ('queued', 'running');
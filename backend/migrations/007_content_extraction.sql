@@ -0,0 +1,13 @@
+-- Migration 007: Full-article content extraction state
+-- content_status: NULL (pending), 'feed', 'extracting', 'extracted', 'failed', 'skipped'
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS content_status VARCHAR(20);
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS content_extracted_at TIMESTAMP WITH TIME ZONE;
+
+-- Articles that already carry content don't need extraction
+UPDATE rss_articles
+SET content_status = 'feed', content_extracted_at = created_at
+WHERE COALESCE(content, '') <> '';
+
+-- Backfill scan: newest pending articles first
+CREATE INDEX IF NOT EXISTS idx_rss_articles_extraction_pending ON rss_articles(created_at DESC)
+    WHERE content_status IS NULL OR content_status = 'extracting';
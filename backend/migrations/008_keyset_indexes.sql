@@ -0,0 +1,19 @@
+-- Migration 008: Composite indexes for keyset (cursor) pagination
+-- Each listing orders by (timestamp, id) so a page token can resume exactly
+-- where the previous page ended with an index range scan instead of OFFSET.
+
+-- /articles: newest stored first
+CREATE INDEX IF NOT EXISTS idx_rss_articles_created_at_id
+    ON rss_articles(created_at DESC, id DESC);
+
+-- /rss_articles/{feed_id}: newest published first, undated entries by stored time
+CREATE INDEX IF NOT EXISTS idx_rss_articles_feed_sort_date
+    ON rss_articles(feed_id, (COALESCE(published_date, created_at)) DESC, id DESC);
+
+-- /chat_sessions/: most recently active first
+CREATE INDEX IF NOT EXISTS idx_chat_sessions_updated_at_id
+    ON chat_sessions(updated_at DESC, id DESC);
+
+-- Superseded by the composite indexes above (same leading columns)
+DROP INDEX IF EXISTS idx_rss_articles_created_at;
+DROP INDEX IF EXISTS idx_rss_articles_feed_id;
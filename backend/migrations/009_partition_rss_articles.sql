@@ -0,0 +1,137 @@
+-- Migration 009: Monthly range partitioning of rss_articles on created_at
+-- A partitioned table can't have a unique index that leaves out the
+-- partition key, so the per-feed dedup key moves to rss_article_keys.
+
+ALTER TABLE rss_articles RENAME TO rss_articles_unpartitioned;
+
+CREATE TABLE rss_articles (
+    id UUID NOT NULL,
+    feed_id UUID REFERENCES rss_feeds(id) ON DELETE CASCADE,
+    title VARCHAR(1000) NOT NULL,
+    content TEXT,
+    summary TEXT,
+    url TEXT,
+    published_date TIMESTAMP WITH TIME ZONE,
+    author VARCHAR(255),
+    metadata JSONB DEFAULT '{}',
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dedup_key TEXT NOT NULL,
+    content_hash VARCHAR(64),
+    content_status VARCHAR(20),
+    content_extracted_at TIMESTAMP WITH TIME ZONE,
+
+    -- Full-text search vector
+    search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', title || ' ' || COALESCE(content, '') || ' ' || COALESCE(summary, ''))
+    ) STORED,
+
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Anything outside the monthly partitions lands here rather than failing
+CREATE TABLE rss_articles_default PARTITION OF rss_articles DEFAULT;
+
+-- Create the monthly partitions (rss_articles_pYYYYMM, UTC month boundaries)
+-- from from_month through months_ahead months past the current one.
+-- Existing tables are left alone, including detached archived partitions.
+-- Rows that landed in the default partition for a new month are moved into
+-- it; PostgreSQL refuses to create the partition while they are there.
+CREATE OR REPLACE FUNCTION ensure_rss_articles_partitions(from_month DATE, months_ahead INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::date;
+    last_month DATE := (date_trunc('month', (now() AT TIME ZONE 'UTC')::date)
+                        + make_interval(months => months_ahead))::date;
+    partition_name TEXT;
+    range_start TIMESTAMP WITH TIME ZONE;
+    range_end TIMESTAMP WITH TIME ZONE;
+    stored_columns TEXT;
+    stray_rows BIGINT;
+    created INTEGER := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        partition_name := 'rss_articles_p' || to_char(month_start, 'YYYYMM');
+        IF to_regclass(partition_name) IS NULL THEN
+            range_start := month_start::timestamp AT TIME ZONE 'UTC';
+            range_end := (month_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC';
+
+            LOCK TABLE rss_articles_default IN SHARE ROW EXCLUSIVE MODE;
+            SELECT count(*) INTO stray_rows FROM rss_articles_default
+            WHERE created_at >= range_start AND created_at < range_end;
+            IF stray_rows > 0 THEN
+                -- Every column but generated ones, which are recomputed on insert
+                SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO stored_columns
+                FROM pg_attribute
+                WHERE attrelid = 'rss_articles'::regclass AND attnum > 0
+                  AND NOT attisdropped AND attgenerated = '';
+                EXECUTE format(
+                    'CREATE TEMP TABLE rss_articles_moving ON COMMIT DROP AS SELECT %s FROM rss_articles_default '
+                    'WHERE created_at >= %L AND created_at < %L',
+                    stored_columns, range_start, range_end
+                );
+                DELETE FROM rss_articles_default WHERE created_at >= range_start AND created_at < range_end;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF rss_articles FOR VALUES FROM (%L) TO (%L)',
+                partition_name, range_start, range_end
+            );
+
+            IF stray_rows > 0 THEN
+                EXECUTE format(
+                    'INSERT INTO rss_articles (%s) SELECT %s FROM rss_articles_moving',
+                    stored_columns, stored_columns
+                );
+                DROP TABLE rss_articles_moving;
+            END IF;
+            created := created + 1;
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT ensure_rss_articles_partitions(
+    COALESCE(
+        (SELECT (min(created_at) AT TIME ZONE 'UTC')::date FROM rss_articles_unpartitioned),
+        (now() AT TIME ZONE 'UTC')::date
+    ),
+    3
+);
+
+INSERT INTO rss_articles (id, feed_id, title, content, summary, url, published_date, author, metadata,
+                          created_at, dedup_key, content_hash, content_status, content_extracted_at)
+SELECT id, feed_id, title, content, summary, url, published_date, author, metadata,
+       COALESCE(created_at, CURRENT_TIMESTAMP), dedup_key, content_hash, content_status, content_extracted_at
+FROM rss_articles_unpartitioned;
+
+-- One row per (feed, dedup key) pointing at the stored article
+CREATE TABLE IF NOT EXISTS rss_article_keys (
+    feed_id UUID NOT NULL REFERENCES rss_feeds(id) ON DELETE CASCADE,
+    dedup_key TEXT NOT NULL,
+    article_id UUID NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    content_hash VARCHAR(64),
+    PRIMARY KEY (feed_id, dedup_key)
+);
+
+INSERT INTO rss_article_keys (feed_id, dedup_key, article_id, created_at, content_hash)
+SELECT feed_id, dedup_key, id, created_at, content_hash
+FROM rss_articles
+WHERE feed_id IS NOT NULL;
+
+-- Archival removes a month of keys at a time
+CREATE INDEX IF NOT EXISTS idx_rss_article_keys_created_at ON rss_article_keys(created_at);
+
+DROP TABLE rss_articles_unpartitioned;
+
+-- Indexes are created on every partition, current and future
+CREATE INDEX IF NOT EXISTS idx_rss_articles_created_at_id
+    ON rss_articles(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_rss_articles_feed_sort_date
+    ON rss_articles(feed_id, (COALESCE(published_date, created_at)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_rss_articles_published_date ON rss_articles(published_date DESC);
+CREATE INDEX IF NOT EXISTS idx_rss_articles_search ON rss_articles USING GIN(search_vector);
+CREATE INDEX IF NOT EXISTS idx_rss_articles_extraction_pending ON rss_articles(created_at DESC)
+    WHERE content_status IS NULL OR content_status = 'extracting';
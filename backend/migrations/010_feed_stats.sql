@@ -0,0 +1,39 @@
+-- Migration 010: Incrementally maintained per-feed statistics
+-- Written by the ingest path so feed listings never aggregate rss_articles.
+CREATE TABLE IF NOT EXISTS feed_stats (
+    feed_id UUID PRIMARY KEY REFERENCES rss_feeds(id) ON DELETE CASCADE,
+    article_count BIGINT NOT NULL DEFAULT 0,
+    latest_published_at TIMESTAMP WITH TIME ZONE,
+    -- last_fetch_status: 'ok', 'not_modified', 'error'
+    last_fetch_at TIMESTAMP WITH TIME ZONE,
+    last_fetch_status VARCHAR(20),
+    last_fetch_ms INTEGER,
+    last_fetch_error TEXT
+);
+
+-- New articles per feed per hour (by published date, capped at ingest time);
+-- rolling 24h/7d counts sum at most 168 rows per feed. Pruned after 8 days.
+CREATE TABLE IF NOT EXISTS feed_stats_hourly (
+    feed_id UUID NOT NULL REFERENCES rss_feeds(id) ON DELETE CASCADE,
+    hour TIMESTAMP WITH TIME ZONE NOT NULL,
+    articles INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (feed_id, hour)
+);
+
+CREATE INDEX IF NOT EXISTS idx_feed_stats_hourly_hour ON feed_stats_hourly(hour);
+
+-- Backfill from existing articles
+INSERT INTO feed_stats (feed_id, article_count, latest_published_at)
+SELECT feed_id, count(*), max(published_date)
+FROM rss_articles
+WHERE feed_id IS NOT NULL
+GROUP BY feed_id
+ON CONFLICT (feed_id) DO NOTHING;
+
+INSERT INTO feed_stats_hourly (feed_id, hour, articles)
+SELECT feed_id, date_trunc('hour', LEAST(COALESCE(published_date, created_at), created_at)), count(*)
+FROM rss_articles
+WHERE feed_id IS NOT NULL
+  AND LEAST(COALESCE(published_date, created_at), created_at) >= now() - INTERVAL '8 days'
+GROUP BY 1, 2
+ON CONFLICT (feed_id, hour) DO NOTHING;
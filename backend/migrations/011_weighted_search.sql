@@ -0,0 +1,15 @@
+-- Migration 011: Weighted full-text search vector and fuzzy title index
+-- Title matches outrank summary matches, which outrank body matches.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DROP INDEX IF EXISTS idx_rss_articles_search;
+ALTER TABLE rss_articles DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE rss_articles ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+    setweight(to_tsvector('english', COALESCE(summary, '')), 'B') ||
+    setweight(to_tsvector('english', COALESCE(content, '')), 'C')
+) STORED;
+CREATE INDEX IF NOT EXISTS idx_rss_articles_search ON rss_articles USING GIN(search_vector);
+
+-- Trigram index for typo-tolerant title matching (title % query)
+CREATE INDEX IF NOT EXISTS idx_rss_articles_title_trgm ON rss_articles USING GIN(title gin_trgm_ops);
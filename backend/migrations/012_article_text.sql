@@ -0,0 +1,25 @@
+-- Migration 012: Plain-text summary, snippet and token estimate per article
+-- Computed once at ingest (parsing.parse_feed_document) so read paths and
+-- AI context builders never strip markup or truncate on the fly.
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS summary_text TEXT;
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS snippet VARCHAR(300);
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS token_estimate INTEGER;
+
+-- Backfill with an SQL approximation of html_to_text: drop tags, decode the
+-- common entities, collapse whitespace. Rows re-ingested later get the exact form.
+UPDATE rss_articles
+SET summary_text = btrim(regexp_replace(
+        replace(replace(replace(replace(replace(replace(
+            regexp_replace(COALESCE(summary, ''), '<[^>]*>', ' ', 'g'),
+            '&nbsp;', ' '), '&lt;', '<'), '&gt;', '>'), '&quot;', '"'), '&#39;', ''''), '&amp;', '&'),
+        '\s+', ' ', 'g'))
+WHERE summary_text IS NULL;
+
+UPDATE rss_articles
+SET snippet = CASE
+        WHEN length(COALESCE(NULLIF(summary_text, ''), content, '')) <= 280
+            THEN COALESCE(NULLIF(summary_text, ''), content, '')
+        ELSE left(COALESCE(NULLIF(summary_text, ''), content), 279) || '…'
+    END,
+    token_estimate = (length(title) + length(summary_text) + length(COALESCE(content, '')) + 3) / 4
+WHERE snippet IS NULL;
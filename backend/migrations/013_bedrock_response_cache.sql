@@ -0,0 +1,12 @@
+-- Migration 013: Shared tier of the Bedrock response cache
+-- Keyed by a SHA-256 of the full model request (model id, inference config,
+-- system prompt and message window), so changed article context never hits.
+CREATE TABLE IF NOT EXISTS bedrock_response_cache (
+    cache_key CHAR(64) PRIMARY KEY,
+    model_id VARCHAR(255),
+    response TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_bedrock_response_cache_expires_at ON bedrock_response_cache(expires_at);
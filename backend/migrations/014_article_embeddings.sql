@@ -0,0 +1,21 @@
+-- Migration 014: Article embeddings for semantic retrieval
+-- Vectors are float32 little-endian bytes tagged with the embedder that made
+-- them; each API instance loads the current model's rows into memory.
+CREATE TABLE IF NOT EXISTS article_embeddings (
+    article_id UUID PRIMARY KEY,
+    article_created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    model VARCHAR(255) NOT NULL,
+    embedding BYTEA NOT NULL,
+    embedded_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Incremental loads by instances, and archival by month
+CREATE INDEX IF NOT EXISTS idx_article_embeddings_model_embedded_at
+    ON article_embeddings(model, embedded_at, article_id);
+CREATE INDEX IF NOT EXISTS idx_article_embeddings_article_created_at
+    ON article_embeddings(article_created_at);
+
+-- NULL until the article's current text has been embedded
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS embedded_at TIMESTAMP WITH TIME ZONE;
+CREATE INDEX IF NOT EXISTS idx_rss_articles_embedding_pending ON rss_articles(created_at DESC)
+    WHERE embedded_at IS NULL;
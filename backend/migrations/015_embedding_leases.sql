@@ -0,0 +1,6 @@
+-- Migration 015: Embedding leases and attempt counts
+-- Articles are claimed (leased) in a short transaction and embedded outside
+-- it; articles that keep failing stop being claimed after a few attempts.
+-- Both columns are reset whenever the article's text changes.
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS embedding_claimed_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS embedding_attempts SMALLINT NOT NULL DEFAULT 0;
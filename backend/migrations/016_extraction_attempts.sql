@@ -0,0 +1,5 @@
+-- Migration 016: Content extraction attempt counts
+-- Incremented each time an article is leased for extraction; articles whose
+-- extraction keeps timing out are marked 'failed' after a few attempts
+-- instead of being leased again forever.
+ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS content_attempts SMALLINT NOT NULL DEFAULT 0;
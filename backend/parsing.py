@@ -0,0 +1,152 @@
+"""CPU-bound parsing helpers.
+
+Everything here is pure and picklable so it can run in a ProcessPoolExecutor
+without importing backend.py (which loads secrets and AWS clients).
+"""
+import re
+import signal
+from contextlib import contextmanager
+
+import feedparser
+import lxml.html
+from lxml import etree
+
+# Elements that never hold article text
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'iframe', 'svg']
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Stored article snippets are at most this many characters
+SNIPPET_CHARS = 280
+
+# Rough characters-per-token ratio for English text
+CHARS_PER_TOKEN = 4
+
+
+class ParseTimeout(Exception):
+    pass
+
+
+@contextmanager
+def time_limit(seconds):
+    """Abort the wrapped block after `seconds` (worker process main thread only)"""
+    def on_alarm(signum, frame):
+        raise ParseTimeout(f"Parsing exceeded {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def collapse_whitespace(text):
+    return WHITESPACE_RE.sub(' ', text or '').strip()
+
+
+def html_to_text(html):
+    """Strip markup from an HTML fragment and collapse whitespace"""
+    if not html or '<' not in html:
+        return collapse_whitespace(html)
+    try:
+        root = lxml.html.fragment_fromstring(html, create_parent='div')
+    except (etree.ParserError, ValueError):
+        return collapse_whitespace(html)
+    for element in list(root.iter('script', 'style')):
+        element.drop_tree()
+    return collapse_whitespace(root.text_content())
+
+
+def make_snippet(text, max_chars=SNIPPET_CHARS):
+    """Cut plain text to max_chars at a word boundary, marking the cut with an ellipsis"""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars - 1]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut.rstrip(' ,.;:') + '…'
+
+
+def estimate_tokens(*texts):
+    """Approximate LLM token count of the given texts"""
+    chars = sum(len(text) for text in texts if text)
+    return -(-chars // CHARS_PER_TOKEN)
+
+
+def extract_main_text(html, max_chars=20000, timeout=10):
+    """Extract the main article text from a full HTML page.
+
+    Prefers an <article> or <main> element; otherwise picks the element whose
+    direct <p> children hold the most text. Runs under a hard time limit so a
+    pathological page can't stall a worker process.
+    """
+    with time_limit(timeout):
+        try:
+            root = lxml.html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            return ''
+
+        for element in list(root.iter(*BOILERPLATE_TAGS)):
+            element.drop_tree()
+
+        container = next(iter(root.iter('article', 'main')), None)
+        if container is None:
+            scores = {}
+            for paragraph in root.iter('p'):
+                parent = paragraph.getparent()
+                if parent is not None:
+                    scores[parent] = scores.get(parent, 0) + len(paragraph.text_content())
+            if scores:
+                container = max(scores, key=scores.get)
+
+        if container is None:
+            return collapse_whitespace(root.text_content())[:max_chars]
+
+        paragraphs = [collapse_whitespace(p.text_content()) for p in container.iter('p')]
+        text = '\n\n'.join(p for p in paragraphs if p) or collapse_whitespace(container.text_content())
+        return text[:max_chars]
+
+
+def parse_feed_document(body, url, content_type=None, max_entries=20, timeout=20):
+    """Parse a raw feed document into plain dicts.
+
+    Only the fields the ingest path stores are copied out, so what crosses
+    the process boundary is a small record rather than a FeedParserDict.
+    """
+    with time_limit(timeout):
+        response_headers = {'content-location': url}
+        if content_type:
+            response_headers['content-type'] = content_type
+        feed = feedparser.parse(body, response_headers=response_headers)
+        if feed.bozo and not feed.entries:
+            raise ValueError("Invalid RSS feed")
+
+        entries = []
+        for entry in feed.entries[:max_entries]:
+            content = entry.get('content')
+            title = entry.get('title', 'No Title')
+            summary = entry.get('summary', entry.get('description', ''))
+            text = html_to_text(content[0].get('value', '')) if content else ''
+            summary_text = html_to_text(summary)
+            entries.append({
+                'title': title,
+                'link': entry.get('link', ''),
+                'summary': summary,
+                'published': entry.get('published', ''),
+                'author': entry.get('author', ''),
+                'guid': entry.get('id', ''),
+                'content': text,
+                # Plain-text forms so read paths never re-strip or re-truncate
+                'summary_text': summary_text,
+                'snippet': make_snippet(summary_text or text),
+                'token_estimate': estimate_tokens(title, summary_text, text)
+            })
+
+        return {
+            'title': feed.feed.get('title', 'Unknown Feed'),
+            'description': feed.feed.get('description', ''),
+            'link': feed.feed.get('link', ''),
+            'entries': entries
+        }
@@ -0,0 +1,30 @@
+from backend import TTLCache
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("backend.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("default", 2)
+    now[0] += 5
+    assert (cache.get("short"), cache.get("default")) == (None, 2)
+    now[0] += 10
+    assert cache.get("default") is None
+
+
+def test_counts_hits_and_misses():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b", "fallback")
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
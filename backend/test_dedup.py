@@ -0,0 +1,23 @@
+import hashlib
+
+from backend import article_dedup_key
+
+
+def test_link_key_lowercases_only_scheme_and_host():
+    entry = {"link": " HTTPS://Example.COM/News/Story?id=AbC#comments ", "title": "t"}
+    assert article_dedup_key(entry) == "https://example.com/News/Story?id=AbC"
+
+
+def test_links_differing_in_path_case_stay_distinct():
+    upper = article_dedup_key({"link": "https://example.com/a/Foo", "title": "t"})
+    lower = article_dedup_key({"link": "https://example.com/a/foo", "title": "t"})
+    assert upper != lower
+
+
+def test_trailing_slash_is_ignored():
+    assert article_dedup_key({"link": "https://example.com/a/", "title": "t"}) == "https://example.com/a"
+
+
+def test_falls_back_to_guid_then_title():
+    assert article_dedup_key({"link": "", "guid": "g-1", "title": "t"}) == "guid:g-1"
+    assert article_dedup_key({"link": "", "title": "t"}) == f"title:{hashlib.md5(b't').hexdigest()}"
@@ -0,0 +1,44 @@
+from unittest import mock
+
+import psycopg2.errors
+
+from backend import migration_status
+
+MIGRATIONS = [(1, "001_a.sql", "c1"), (2, "002_b.sql", "c2"), (3, "003_c.sql", "c3")]
+
+
+def fake_conn(rows=None, error=None, versions=None):
+    """A connection whose schema_migrations holds rows, or whose first query raises error"""
+    conn = mock.MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    results = []
+
+    def execute(query, *args):
+        if error and not results:
+            results.append(None)
+            raise error
+        results.append(versions if "checksum" not in query else rows)
+
+    cursor.execute.side_effect = execute
+    cursor.fetchall.side_effect = lambda: results[-1]
+    return conn
+
+
+def test_current_schema_reports_pending_and_mismatched():
+    conn = fake_conn(rows=[(1, "c1"), (2, "edited")])
+    assert migration_status(conn, MIGRATIONS) == ([MIGRATIONS[2]], [MIGRATIONS[1]])
+
+
+def test_null_checksums_count_as_applied():
+    conn = fake_conn(rows=[(1, None), (2, "c2")])
+    assert migration_status(conn, MIGRATIONS) == ([MIGRATIONS[2]], [])
+
+
+def test_pre_checksum_table_counts_versions_as_applied():
+    conn = fake_conn(error=psycopg2.errors.UndefinedColumn(), versions=[(1,), (2,)])
+    assert migration_status(conn, MIGRATIONS) == ([MIGRATIONS[2]], [])
+
+
+def test_missing_table_leaves_everything_pending():
+    conn = fake_conn(error=psycopg2.errors.UndefinedTable())
+    assert migration_status(conn, MIGRATIONS) == (MIGRATIONS, [])
@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from backend import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_a_timestamp():
+    row_id = uuid.uuid4()
+    sort_value = datetime(2026, 3, 4, 5, 6, 7, 890000, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(sort_value, row_id)) == (sort_value, str(row_id))
+
+
+def test_cursor_round_trips_a_number():
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(0.4375, row_id)) == (0.4375, str(row_id))
+
+
+def test_cursor_is_url_safe():
+    token = encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), uuid.uuid4())
+    assert "=" not in token and "+" not in token and "/" not in token
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", encode_cursor(True, uuid.uuid4()), encode_cursor(1, "x")])
+def test_bad_cursors_are_a_400(token):
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(token)
+    assert raised.value.status_code == 400
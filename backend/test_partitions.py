@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+import backend
+from backend import archive_key, expired_partitions, partition_bounds
+
+
+def test_partition_bounds_cover_one_utc_month():
+    assert partition_bounds("rss_articles_p202512") == (
+        datetime(2025, 12, 1, tzinfo=timezone.utc), datetime(2026, 1, 1, tzinfo=timezone.utc)
+    )
+
+
+def test_partition_bounds_reject_other_tables():
+    with pytest.raises(ValueError):
+        partition_bounds("rss_articles_default")
+
+
+def test_archive_key_is_per_partition():
+    assert archive_key("rss_articles_p202401").endswith("rss_articles_p202401.csv.gz")
+
+
+def test_expired_partitions_keep_the_retention_window(monkeypatch):
+    conn = mock.MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [
+        ("rss_articles_default",), ("rss_articles_p202606",), ("rss_articles_p202607",),
+        ("rss_articles_p202608",), ("rss_articles_p202610",),
+    ]
+    now = datetime(2026, 10, 17, 12, tzinfo=timezone.utc)
+    monkeypatch.setattr(backend, "datetime", mock.Mock(wraps=datetime, now=lambda tz=None: now))
+
+    # Keeping two full months before October keeps August and September
+    assert expired_partitions(conn, 2) == ["rss_articles_p202606", "rss_articles_p202607"]
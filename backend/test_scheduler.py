@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+
+import backend
+from backend import (
+    FEED_POLL_BACKOFF, FEED_POLL_DEFAULT_INTERVAL, FEED_POLL_MAX_INTERVAL, FEED_POLL_MIN_INTERVAL,
+    compute_poll_interval, error_backoff_delay,
+)
+
+
+def test_poll_interval_halves_on_new_entries():
+    assert compute_poll_interval(7200, 3) == 3600
+
+
+def test_poll_interval_backs_off_without_new_entries():
+    assert compute_poll_interval(3600, 0) == int(3600 * FEED_POLL_BACKOFF)
+
+
+def test_poll_interval_follows_median_publishing_gap():
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    dates = [now - timedelta(minutes=40 * i) for i in range(5)]
+    assert compute_poll_interval(20000, 5, dates) == 1200
+
+
+def test_poll_interval_is_clamped():
+    assert compute_poll_interval(FEED_POLL_MIN_INTERVAL, 1) == FEED_POLL_MIN_INTERVAL
+    assert compute_poll_interval(FEED_POLL_MAX_INTERVAL, 0) == FEED_POLL_MAX_INTERVAL
+    assert compute_poll_interval(None, 0) == int(FEED_POLL_DEFAULT_INTERVAL * FEED_POLL_BACKOFF)
+
+
+def test_error_backoff_doubles_per_error_and_caps():
+    assert error_backoff_delay(3600, 1) == 7200
+    assert error_backoff_delay(3600, 3) == 28800
+    assert error_backoff_delay(3600, 20) == FEED_POLL_MAX_INTERVAL
+    assert error_backoff_delay(FEED_POLL_MAX_INTERVAL * 2, 1) == FEED_POLL_MAX_INTERVAL * 2
+
+
+def test_failed_poll_keeps_stored_interval(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(backend, "parse_rss_feed", lambda *args: (_ for _ in ()).throw(ValueError("bad feed")))
+    monkeypatch.setattr(backend, "schedule_next_poll", lambda *args, **kwargs: scheduled.append((args, kwargs)))
+    feed = {"id": "f", "url": "https://example.com/feed", "poll_interval_seconds": 3600,
+            "poll_error_count": 2, "etag": None, "last_modified": None, "body_hash": None}
+
+    assert backend.refresh_feed(feed) == 0
+    (feed_id, interval, error_count), kwargs = scheduled[0]
+    assert (interval, error_count) == (3600, 3)
+    assert kwargs["delay"] == error_backoff_delay(3600, 3)
@@ -21,13 +21,26 @@ locals {
         ]
         Resource = "${var.s3_bucket_arn}/chat-history/*"
       },
+      {
+        Sid    = "S3ArticleArchiveAccess"
+        Effect = "Allow"
+        Action = [
+          "s3:GetObject",
+          "s3:PutObject"
+        ]
+        Resource = "${var.s3_bucket_arn}/archive/*"
+      },
       {
         Sid    = "BedrockNovaLiteAccess"
         Effect = "Allow"
         Action = [
-          "bedrock:InvokeModel"
+          "bedrock:InvokeModel",
+          "bedrock:InvokeModelWithResponseStream"
+        ]
+        Resource = [
+          "arn:aws:bedrock:${var.aws_region}::foundation-model/amazon.nova-lite-v1:0",
+          "arn:aws:bedrock:${var.aws_region}::foundation-model/amazon.titan-embed-text-v2:0"
         ]
-        Resource = "arn:aws:bedrock:${var.aws_region}::foundation-model/amazon.nova-lite-v1:0"
         Condition = {
           StringEquals = {
             "aws:RequestedRegion" = var.aws_region